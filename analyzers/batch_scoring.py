@@ -0,0 +1,138 @@
+# analyzers/batch_scoring.py
+from typing import Dict, List, Any, Iterable, Union
+
+import numpy as np
+
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from utils.prepared_text import PreparedText
+from utils.profiling import timed
+
+
+class BatchKeywordScorer:
+    """
+    Bir rol için çok sayıda CV'nin anahtar kelime skorunu NumPy ile toplu hesaplar
+
+    Her CV rol otomatıyla bir kez taranır ve CV x anahtar kelime varlık matrisine yazılır;
+    core/bonus oranları, minimum ceza, excellence bonusu ve ağırlıklı toplam tüm CV'ler
+    için matris işlemleriyle hesaplanır. Sonuçlar KeywordAnalyzer.analyze_keywords'ün
+    'total_score' ve 'category_scores' değerleriyle birebir aynıdır.
+    """
+
+    def __init__(self, keyword_analyzer: KeywordAnalyzer, role: str):
+        ruleset = keyword_analyzer.ruleset
+        if role not in ruleset.role_data:
+            raise ValueError(f"Desteklenmeyen rol: {role}")
+
+        self.role = role
+        self.matcher = ruleset.role_matchers[role]
+        self.vocabulary = self.matcher.terms
+        self._column = {term: index for index, term in enumerate(self.vocabulary)}
+
+        critical_skills = ruleset.role_data[role]['critical_skills']
+        self.categories = list(critical_skills)
+        self.rules = ruleset.scoring_rules[role]
+
+        # Kategori başına sütun indeksleri; tekrar eden kelimeler tek yoldaki gibi iki kez sayılır
+        self._core_columns = []
+        self._bonus_columns = []
+        minimum_required = []
+        for config in critical_skills.values():
+            self._core_columns.append(np.array(
+                [self._column[k] for k in config['core_keywords']], dtype=np.intp
+            ))
+            self._bonus_columns.append(np.array(
+                [self._column[k] for k in config['bonus_keywords']], dtype=np.intp
+            ))
+            minimum_required.append(config['minimum_required'])
+
+        self._minimum_required = np.array(minimum_required)
+        self._weights = [config['weight'] for config in critical_skills.values()]
+
+    @timed('batch.presence_matrix')
+    def presence_matrix(self, cv_texts: Iterable[Union[str, PreparedText]]) -> np.ndarray:
+        """CV x anahtar kelime boolean varlık matrisi (her CV için tek otomat geçişi)"""
+        rows = []
+        for cv_text in cv_texts:
+            lower = cv_text.lower if isinstance(cv_text, PreparedText) else cv_text.lower()
+            row = np.zeros(len(self.vocabulary), dtype=bool)
+            found = [self._column[term] for term in self.matcher.scan(lower, whole_words=True)]
+            row[found] = True
+            rows.append(row)
+
+        if not rows:
+            return np.zeros((0, len(self.vocabulary)), dtype=bool)
+        return np.vstack(rows)
+
+    @timed('batch.category_scores')
+    def category_scores(self, presence: np.ndarray) -> np.ndarray:
+        """
+        Kategori skorları (N x kategori), _analyze_category ile aynı sırada ve aynı
+        kayan nokta işlemleriyle hesaplanır
+        """
+        n_rows = presence.shape[0]
+        scores = np.empty((n_rows, len(self.categories)), dtype=np.float64)
+        rules = self.rules
+
+        for j, (core_columns, bonus_columns) in enumerate(zip(self._core_columns, self._bonus_columns)):
+            found_core = presence[:, core_columns].sum(axis=1)
+            found_bonus = presence[:, bonus_columns].sum(axis=1)
+
+            core_ratio = found_core / len(core_columns) if len(core_columns) else np.zeros(n_rows)
+            bonus_ratio = found_bonus / len(bonus_columns) if len(bonus_columns) else np.zeros(n_rows)
+
+            base_score = core_ratio * rules.core_points + np.minimum(bonus_ratio * rules.bonus_points,
+                                                                     rules.bonus_points)
+            base_score = np.where(found_core >= self._minimum_required[j], base_score,
+                                  base_score * rules.minimum_penalty)
+            base_score = np.where(core_ratio >= rules.excellence_threshold,
+                                  base_score * rules.excellence_bonus, base_score)
+
+            scores[:, j] = np.minimum(100, base_score * 1.0)
+
+        return self._round(scores)
+
+    @timed('batch.total_scores')
+    def total_scores(self, category_scores: np.ndarray) -> np.ndarray:
+        """Ağırlıklı toplam skor; toplama sırası _calculate_total_score ile aynıdır"""
+        total = np.zeros(category_scores.shape[0], dtype=np.float64)
+        total_weight = 0
+        for j, weight in enumerate(self._weights):
+            total = total + category_scores[:, j] * weight
+            total_weight += weight
+
+        if total_weight <= 0:
+            return np.zeros(category_scores.shape[0])
+        return self._round(total / total_weight)
+
+    def score(self, cv_texts: Iterable[Union[str, PreparedText]]) -> List[Dict[str, Any]]:
+        """
+        CV'leri toplu puanlar
+
+        Returns:
+            list: Her CV için {'total_score', 'category_scores'}; girdi sırasıyla
+        """
+        category_scores = self.category_scores(self.presence_matrix(cv_texts))
+        totals = self.total_scores(category_scores)
+
+        return [
+            {
+                'total_score': total,
+                'category_scores': dict(zip(self.categories, row))
+            }
+            for total, row in zip(totals.tolist(), category_scores.tolist())
+        ]
+
+    @staticmethod
+    def _round(values: np.ndarray) -> np.ndarray:
+        """
+        Python round(x, 1) ile bire bir aynı yuvarlama
+
+        np.round yalnızca yarıma çok yakın değerlerde (x*10 ~ n.5) farklı sonuç verebilir;
+        bu değerler Python round() ile yeniden yuvarlanır.
+        """
+        rounded = np.round(values, 1)
+        scaled = values * 10
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+        if near_half.any():
+            rounded[near_half] = [round(value, 1) for value in values[near_half].tolist()]
+        return rounded
@@ -0,0 +1,204 @@
+# analyzers/compact_result.py
+import json
+import sys
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.pipeline import ScoreSummary, collect_recommendations
+from analyzers.ruleset import CompiledRuleset
+from utils.lazy_result import LazyResult
+
+# Sonuçtan yeniden üretilen anahtarlar; sıkıştırılmış ayrıntılara yazılmaz
+DERIVED_KEYS = ('overall_score', 'keyword_analysis', 'recommendations')
+
+# Ayrıntılar bu seviyede sıkıştırılır (hız/boyut dengesi)
+COMPRESSION_LEVEL = 6
+
+# Öneri ve örnek üretimi analizör durumuna bağlı değil; kural seti her çağrıda açıkça verilir
+_KEYWORDS = KeywordAnalyzer()
+
+# Aynı anahtar sırası tüm sonuçlarda tek demetle tutulur
+_KEY_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+class RoleVocabulary:
+    """
+    Bir rolün anahtar kelimelerinin (rol otomatının terimleri) sabit sıralı listesi
+
+    Anahtar kelimeler sys.intern ile tekilleştirilir ve sıralarındaki bit ile temsil edilir;
+    bulunan kelimeler tek bir int (bit kümesi) olarak saklanır. Kural setine bağlıdır: yeniden
+    yüklenen kural seti için yeni sözlük oluşturulur, eski sonuçlar eskisiyle açılır.
+    """
+
+    __slots__ = ('ruleset', 'role', 'terms', '_ids')
+
+    def __init__(self, ruleset: CompiledRuleset, role: str):
+        self.ruleset = ruleset
+        self.role = sys.intern(role)
+        self.terms: Tuple[str, ...] = tuple(sys.intern(term) for term in ruleset.role_matchers[role].terms)
+        self._ids: Dict[str, int] = {term: term_id for term_id, term in enumerate(self.terms)}
+
+    def to_bits(self, keywords: Iterable[str]) -> int:
+        """
+        Anahtar kelimeleri bit kümesine çevirir
+
+        Raises:
+            KeyError: Kelime bu rolün sözlüğünde yoksa (sonuç başka bir kural setiyle üretilmiş)
+        """
+        bits = 0
+        for keyword in keywords:
+            bits |= 1 << self._ids[keyword]
+        return bits
+
+    def from_bits(self, bits: int) -> List[str]:
+        """Bit kümesindeki anahtar kelimeler (sözlük sırasıyla)"""
+        return [term for term_id, term in enumerate(self.terms) if bits >> term_id & 1]
+
+    def contains(self, bits: int, keyword: str) -> bool:
+        term_id = self._ids.get(keyword)
+        return term_id is not None and bool(bits >> term_id & 1)
+
+
+@lru_cache(maxsize=32)
+def role_vocabulary(ruleset: CompiledRuleset, role: str) -> RoleVocabulary:
+    """Kural seti ve rol başına paylaşılan sözlük"""
+    return RoleVocabulary(ruleset, role)
+
+
+class CompactResult:
+    """
+    Analiz sonucunun (ScoringPipeline.analyze) bellekte az yer kaplayan biçimi
+
+    Skorlar alan olarak, bulunan anahtar kelimeler rol sözlüğüne göre bit kümesi olarak tutulur;
+    anahtar kelime analizi (kategori sonuçları, eksikler, öneriler) ve genel öneri listesi
+    bunlardan yeniden üretilir. Yeniden üretilemeyen bölümler (format, içerik, ilan uyumu, metin
+    önizlemesi, ölçümler) sıkıştırılmış JSON olarak saklanır. Sıralama ve panolar skor alanlarını
+    okur; tam sözlük yalnızca to_dict() ile, bölüm bölüm ilk erişimde açılır.
+    """
+
+    __slots__ = ('vocabulary', 'overall_score', 'keyword_score', 'format_score', 'content_score',
+                 'job_match_score', 'keyword_bits', 'quantified_results', 'keys', '_details')
+
+    def __init__(self, vocabulary: Optional[RoleVocabulary], scores: ScoreSummary, keyword_bits: int,
+                 quantified_results: int, keys: Tuple[str, ...], details: bytes):
+        """
+        Args:
+            vocabulary: Rol sözlüğü; anahtar kelime analizi hata döndürdüyse None
+            keys: Sonuç sözlüğünün anahtar sırası
+            details: DERIVED_KEYS dışındaki bölümlerin sıkıştırılmış JSON'u
+        """
+        self.vocabulary = vocabulary
+        self.overall_score, self.keyword_score, self.format_score, self.content_score, \
+            self.job_match_score = scores
+        self.keyword_bits = keyword_bits
+        self.quantified_results = quantified_results
+        self.keys = _KEY_ORDERS.setdefault(keys, keys)
+        self._details = details
+
+    @classmethod
+    def from_results(cls, results: Dict[str, Any], role: str, ruleset: CompiledRuleset) -> 'CompactResult':
+        """
+        Analiz sonucunu sıkıştırır
+
+        Args:
+            role: Dahili rol anahtarı (resolve_role)
+            ruleset: Sonucun üretildiği kural seti
+
+        Raises:
+            KeyError: Bulunan anahtar kelimeler kural setinin rol sözlüğüyle uyuşmuyorsa
+        """
+        keyword_analysis = results['keyword_analysis']
+        job_match = results.get('job_match')
+        scores = ScoreSummary(
+            results['overall_score'],
+            keyword_analysis.get('total_score', 0),
+            results['format_analysis'].get('ats_compliance', 0),
+            results['content_analysis'].get('overall_score', 0),
+            job_match.get('score', 0) if job_match else None
+        )
+
+        derived = DERIVED_KEYS
+        vocabulary = None
+        keyword_bits = 0
+        quantified_results = 0
+        if 'error' in keyword_analysis or role not in ruleset.role_data:
+            # Hata sonucu olduğu gibi saklanır
+            derived = ('overall_score', 'recommendations')
+        else:
+            vocabulary = role_vocabulary(ruleset, role)
+            keyword_bits = vocabulary.to_bits(_found_keywords(keyword_analysis))
+            quantified_results = keyword_analysis['impact_analysis']['quantified_results']
+
+        details = {key: value for key, value in results.items() if key not in derived}
+        payload = json.dumps(details, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return cls(vocabulary, scores, keyword_bits, quantified_results, tuple(results),
+                   zlib.compress(payload, COMPRESSION_LEVEL))
+
+    @property
+    def role(self) -> Optional[str]:
+        return self.vocabulary.role if self.vocabulary is not None else None
+
+    def summary(self) -> ScoreSummary:
+        """Yalnızca skorlar (ScoringPipeline.score ile aynı yapı)"""
+        return ScoreSummary(self.overall_score, self.keyword_score, self.format_score,
+                            self.content_score, self.job_match_score)
+
+    def found_keywords(self) -> List[str]:
+        """CV'de bulunan rol anahtar kelimeleri"""
+        return self.vocabulary.from_bits(self.keyword_bits) if self.vocabulary is not None else []
+
+    def has_keyword(self, keyword: str) -> bool:
+        return self.vocabulary is not None and self.vocabulary.contains(self.keyword_bits, keyword)
+
+    @property
+    def size(self) -> int:
+        """Sıkıştırılmış ayrıntıların bayt cinsinden boyutu"""
+        return len(self._details)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Analiz sonucuyla aynı sözlük; her bölüm ilk erişimde açılır veya yeniden üretilir
+
+        Arayüz ve JSON çıktısı sözlüğü sıradan bir dict gibi kullanır (LazyResult).
+        """
+        decoded: List[Dict[str, Any]] = []
+
+        def detail(key: str) -> Any:
+            if not decoded:
+                decoded.append(json.loads(zlib.decompress(self._details)))
+            return decoded[0][key]
+
+        lazy = {}
+        for key in self.keys:
+            if key == 'overall_score':
+                continue
+            if key == 'keyword_analysis' and self.vocabulary is not None:
+                lazy[key] = self._keyword_analysis
+            elif key == 'recommendations':
+                lazy[key] = lambda: collect_recommendations(results)
+            else:
+                lazy[key] = lambda key=key: detail(key)
+
+        results = LazyResult({'overall_score': self.overall_score}, lazy=lazy)
+        return results
+
+    def _keyword_analysis(self) -> Dict[str, Any]:
+        vocabulary = self.vocabulary
+        found = dict.fromkeys(vocabulary.from_bits(self.keyword_bits))
+        return _KEYWORDS.analyze_hits(found, vocabulary.role, self.quantified_results, vocabulary.ruleset)
+
+    def __repr__(self) -> str:
+        return (f"CompactResult(role={self.role!r}, overall_score={self.overall_score}, "
+                f"keywords={bin(self.keyword_bits).count('1')}, details={self.size} B)")
+
+
+def _found_keywords(keyword_analysis: Dict[str, Any]) -> List[str]:
+    """Anahtar kelime analizindeki tüm bulunan kelimeler (kategoriler, deneyim, impact)"""
+    found = []
+    for result in keyword_analysis['category_results'].values():
+        found.extend(result['total_found'])
+    found.extend(keyword_analysis['experience_analysis']['found'])
+    found.extend(keyword_analysis['impact_analysis']['found_metrics'])
+    return found
@@ -1,8 +1,12 @@
 # analyzers/content_analyzer.py
-import re
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from collections import Counter
 
+from analyzers import patterns
+from utils.lazy_result import LazyResult
+from utils.prepared_text import PreparedText
+from utils.profiling import timed
+
 class ContentAnalyzer:
     """CV içerik kalitesi analizi yapan sınıf"""
     
@@ -32,40 +36,35 @@ class ContentAnalyzer:
             'streamlined', 'automated', 'eliminated', 'minimized', 'maximized'
         ]
         
-        # Quantification patterns
-        self.quantification_patterns = [
-            r'\d+%',  # Percentages
-            r'\$\d+[KMB]?',  # Dollar amounts
-            r'\d+[KMB]\+?',  # Large numbers with K/M/B
-            r'\d+x',  # Multipliers
-            r'\d+:\d+',  # Ratios
-            r'\d{1,3}(?:,\d{3})*',  # Comma-separated numbers
-            r'\d+\.\d+[KMB]?',  # Decimal numbers
-            r'\d+\s*(hours?|days?|weeks?|months?|years?)',  # Time periods
-            r'\d+\s*(people|users|customers|clients|teams?)',  # Scale indicators
-        ]
+        self.impact_pattern = patterns.literal_alternation(self.impact_keywords)
+        
+        # Quantification patterns (derlenmiş)
+        self.quantification_patterns = patterns.QUANTIFICATION_PATTERNS
     
-    def analyze_content_quality(self, cv_text: str, target_role: str) -> Dict[str, Any]:
-        """CV içerik kalitesini kapsamlı analiz eder"""
+    @timed('analyze_content_quality')
+    def analyze_content_quality(self, cv_text: Union[str, PreparedText], target_role: str,
+                                quantified_matches: Optional[List[List[Tuple[int, int, str]]]] = None,
+                                achievement_sentences: Optional[List[Tuple[str, str]]] = None) -> Dict[str, Any]:
+        """
+        CV içerik kalitesini kapsamlı analiz eder
+        
+        Args:
+            quantified_matches: find_quantified sonucu; verilirse metin desenlerle yeniden taranmaz
+            achievement_sentences: find_achievement_sentences sonucu; verilirse cümleler yeniden taranmaz
+        """
         try:
-            analysis = {
-                'quantification': self._analyze_quantification(cv_text),
-                'action_verbs': self._analyze_action_verbs(cv_text),
-                'impact_language': self._analyze_impact_language(cv_text),
-                'technical_depth': self._analyze_technical_depth(cv_text, target_role),
-                'achievement_quality': self._analyze_achievements(cv_text),
-                'language_quality': self._analyze_language_quality(cv_text),
-                'buzzwords': self._analyze_buzzwords(cv_text),
-                'consistency': self._analyze_consistency(cv_text),
+            doc = PreparedText.ensure(cv_text)
+            analysis = LazyResult({
+                **self._analyze_components(doc, target_role, quantified_matches, achievement_sentences),
                 'overall_score': 0
-            }
+            }, lazy={
+                # İçerik önerileri ilk erişimde generate edilir
+                'recommendations': lambda: self._generate_content_recommendations(analysis, target_role)
+            })
             
             # Genel içerik skorunu hesapla
             analysis['overall_score'] = self._calculate_content_score(analysis)
             
-            # İçerik önerilerini generate et
-            analysis['recommendations'] = self._generate_content_recommendations(analysis, target_role)
-            
             return analysis
             
         except Exception as e:
@@ -83,41 +82,79 @@ class ContentAnalyzer:
                 'recommendations': []
             }
     
-    def _analyze_quantification(self, text: str) -> Dict[str, Any]:
-        """Sayısal sonuçları ve metrikleri analiz eder"""
+    def find_quantified(self, text: str) -> List[List[Tuple[int, int, str]]]:
+        """Her quantification deseninin (desen sırasıyla) eşleşmeleri: (başlangıç, bitiş, değer)"""
+        return [
+            [(match.start(), match.end(), match.group()) for match in pattern.finditer(text)]
+            for pattern in self.quantification_patterns
+        ]
+    
+    def find_achievement_sentences(self, sentences: Tuple[str, ...],
+                                   lower_sentences: Tuple[str, ...]) -> List[Tuple[str, str]]:
+        """Achievement göstergesi içeren (cümle, küçük harfli cümle) çiftleri"""
+        # Achievement indicators tek alternation olarak taranır
+        return [
+            (sentence, sentence_lower)
+            for sentence, sentence_lower in zip(sentences, lower_sentences)
+            if patterns.ACHIEVEMENT.search(sentence_lower)
+        ]
+    
+    @timed('score_content')
+    def score_content(self, cv_text: Union[str, PreparedText], target_role: str) -> float:
+        """Yalnızca genel içerik skoru (analyze_content_quality'deki overall_score); örnek ve öneri üretilmez"""
         try:
-            quantified_statements = []
+            doc = PreparedText.ensure(cv_text)
+            return self._calculate_content_score(self._analyze_components(doc, target_role, details=False))
+        except Exception:
+            return 50
+    
+    def _analyze_components(self, doc: PreparedText, target_role: str,
+                            quantified_matches: Optional[List[List[Tuple[int, int, str]]]] = None,
+                            achievement_sentences: Optional[List[Tuple[str, str]]] = None,
+                            details: bool = True) -> Dict[str, Dict[str, Any]]:
+        """İçerik skorunu oluşturan alt analizler"""
+        return {
+            'quantification': self._analyze_quantification(doc, quantified_matches, details),
+            'action_verbs': self._analyze_action_verbs(doc),
+            'impact_language': self._analyze_impact_language(doc),
+            'technical_depth': self._analyze_technical_depth(doc, target_role),
+            'achievement_quality': self._analyze_achievements(doc, achievement_sentences),
+            'language_quality': self._analyze_language_quality(doc),
+            'buzzwords': self._analyze_buzzwords(doc),
+            'consistency': self._analyze_consistency(doc)
+        }
+    
+    @timed('content.analyze_quantification')
+    def _analyze_quantification(self, doc: PreparedText,
+                                matches: Optional[List[List[Tuple[int, int, str]]]] = None,
+                                details: bool = True) -> Dict[str, Any]:
+        """
+        Sayısal sonuçları ve metrikleri analiz eder
+        
+        Args:
+            details: False ise yalnızca skor ve sayılar döndürülür (örnek ve öneri üretilmez)
+        """
+        try:
+            text = doc.text
             
             # Tüm quantification pattern'larını bul
-            for pattern in self.quantification_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
-                    # Çevresel context'i al
-                    start = max(0, match.start() - 80)
-                    end = min(len(text), match.end() + 80)
-                    context = text[start:end].strip()
-                    
-                    # Impact keyword'ü var mı kontrol et
-                    has_impact = any(keyword in context.lower() for keyword in self.impact_keywords)
-                    
-                    quantified_statements.append({
-                        'value': match.group(),
-                        'context': context,
-                        'has_impact': has_impact,
-                        'pattern': pattern
-                    })
-            
-            # Duplicate'leri temizle
-            seen_contexts = set()
-            unique_statements = []
-            for stmt in quantified_statements:
-                if stmt['context'] not in seen_contexts:
-                    unique_statements.append(stmt)
-                    seen_contexts.add(stmt['context'])
-            
-            # Scoring
-            count = len(unique_statements)
-            impact_count = sum(1 for stmt in unique_statements if stmt['has_impact'])
+            if matches is None:
+                matches = self.find_quantified(text)
+            
+            # Çevresel context'leri al; duplicate context'ler bir kez sayılır (ilk geçiş sırasıyla)
+            contexts = {}
+            for pattern_matches in matches:
+                for match_start, match_end, _ in pattern_matches:
+                    start = max(0, match_start - 80)
+                    end = min(len(text), match_end + 80)
+                    contexts.setdefault(text[start:end].strip(), None)
+            unique_contexts = list(contexts)
+            
+            # Scoring: impact keyword'ü her unique context için bir kez aranır
+            count = len(unique_contexts)
+            impact_count = sum(
+                1 for context in unique_contexts if self.impact_pattern.search(context.lower()) is not None
+            )
             
             base_score = min(100, count * 12)  # Her quantified statement 12 puan
             impact_bonus = impact_count * 5    # Impact keyword'ü olan +5 puan
@@ -134,14 +171,19 @@ class ContentAnalyzer:
             else:
                 quality = "Poor"
             
-            return {
+            summary = {
                 'score': total_score,
                 'count': count,
                 'impact_count': impact_count,
-                'quality': quality,
-                'examples': [stmt['context'][:100] + "..." for stmt in unique_statements[:5]],
-                'recommendations': self._get_quantification_recommendations(count, impact_count)
+                'quality': quality
             }
+            if not details:
+                return summary
+            
+            return LazyResult(summary, lazy={
+                'examples': lambda: [context[:100] + "..." for context in unique_contexts[:5]],
+                'recommendations': lambda: self._get_quantification_recommendations(count, impact_count)
+            })
         except Exception as e:
             return {
                 'score': 50,
@@ -152,24 +194,21 @@ class ContentAnalyzer:
                 'recommendations': ['Add quantified achievements with specific numbers']
             }
     
-    def _analyze_action_verbs(self, text: str) -> Dict[str, Any]:
+    @timed('content.analyze_action_verbs')
+    def _analyze_action_verbs(self, doc: PreparedText) -> Dict[str, Any]:
         """Action verb kullanımını analiz eder"""
         try:
-            text_lower = text.lower()
+            index = doc.index
             
-            # Güçlü action verb'leri bul
+            # Güçlü action verb'leri bul (kelime sınırlı: 'led' 'enabled' içinde sayılmaz)
             found_strong = []
             for verb in self.strong_action_verbs:
-                if verb in text_lower:
-                    count = text_lower.count(verb)
-                    found_strong.extend([verb] * count)
+                found_strong.extend([verb] * index.count(verb))
             
             # Zayıf ifadeleri bul
             found_weak = []
             for phrase in self.weak_phrases:
-                if phrase in text_lower:
-                    count = text_lower.count(phrase)
-                    found_weak.extend([phrase] * count)
+                found_weak.extend([phrase] * index.count(phrase))
             
             # Unique verb'leri al
             unique_strong = list(set(found_strong))
@@ -209,17 +248,16 @@ class ContentAnalyzer:
                 'recommendations': ['Use more strong action verbs']
             }
     
-    def _analyze_impact_language(self, text: str) -> Dict[str, Any]:
+    @timed('content.analyze_impact_language')
+    def _analyze_impact_language(self, doc: PreparedText) -> Dict[str, Any]:
         """Impact ve achievement language analiz eder"""
         try:
-            text_lower = text.lower()
+            index = doc.index
             
             # Impact keyword'lerini bul
             found_impact = []
             for keyword in self.impact_keywords:
-                if keyword in text_lower:
-                    count = text_lower.count(keyword)
-                    found_impact.extend([keyword] * count)
+                found_impact.extend([keyword] * index.count(keyword))
             
             # Business value keywords
             business_keywords = [
@@ -228,10 +266,7 @@ class ContentAnalyzer:
                 'retention', 'conversion', 'roi', 'return on investment'
             ]
             
-            found_business = []
-            for keyword in business_keywords:
-                if keyword in text_lower:
-                    found_business.append(keyword)
+            found_business = index.present(business_keywords)
             
             # Results-oriented phrases
             results_phrases = [
@@ -239,10 +274,7 @@ class ContentAnalyzer:
                 'contributed to', 'enabled', 'facilitated', 'drove'
             ]
             
-            found_results = []
-            for phrase in results_phrases:
-                if phrase in text_lower:
-                    found_results.append(phrase)
+            found_results = index.present(results_phrases)
             
             # Scoring
             impact_score = min(40, len(set(found_impact)) * 5)
@@ -269,10 +301,11 @@ class ContentAnalyzer:
                 'recommendations': ['Add more impact-focused language']
             }
     
-    def _analyze_technical_depth(self, text: str, role: str) -> Dict[str, Any]:
+    @timed('content.analyze_technical_depth')
+    def _analyze_technical_depth(self, doc: PreparedText, role: str) -> Dict[str, Any]:
         """Technical depth ve expertise analiz eder"""
         try:
-            text_lower = text.lower()
+            index = doc.index
             
             # Role-specific technical indicators
             technical_indicators = self._get_technical_indicators(role)
@@ -281,10 +314,7 @@ class ContentAnalyzer:
             depth_score = 0
             
             for category, indicators in technical_indicators.items():
-                found = []
-                for indicator in indicators:
-                    if indicator.lower() in text_lower:
-                        found.append(indicator)
+                found = index.present(indicators)
                 
                 found_indicators[category] = found
                 depth_score += len(found) * 3  # Her indicator 3 puan
@@ -295,10 +325,7 @@ class ContentAnalyzer:
                 'data-driven', 'machine learning', 'deep learning', 'statistical modeling'
             ]
             
-            found_methodologies = []
-            for method in methodologies:
-                if method in text_lower:
-                    found_methodologies.append(method)
+            found_methodologies = index.present(methodologies)
             
             methodology_score = len(found_methodologies) * 4
             
@@ -308,7 +335,7 @@ class ContentAnalyzer:
                 'distributed', 'real-time', 'high-performance', 'scalable'
             ]
             
-            complexity_count = sum(1 for word in complexity_words if word in text_lower)
+            complexity_count = len(index.present(complexity_words))
             complexity_score = min(20, complexity_count * 3)
             
             total_score = min(100, depth_score + methodology_score + complexity_score)
@@ -341,31 +368,19 @@ class ContentAnalyzer:
                 'recommendations': ['Add more technical details']
             }
     
-    def _analyze_achievements(self, text: str) -> Dict[str, Any]:
+    @timed('content.analyze_achievements')
+    def _analyze_achievements(self, doc: PreparedText,
+                              achievement_sentences: Optional[List[Tuple[str, str]]] = None) -> Dict[str, Any]:
         """Achievement quality analiz eder"""
         try:
-            sentences = text.split('.')
-            
-            # Achievement indicators
-            achievement_patterns = [
-                r'(increased|improved|enhanced|optimized|reduced|decreased|eliminated|minimized|maximized|generated|delivered|achieved|exceeded|streamlined|automated)',
-                r'(awarded|recognized|promoted|selected|chosen|honored)',
-                r'(led|managed|directed|supervised|mentored|trained|coached)',
-                r'(created|developed|built|designed|implemented|established|launched|initiated)'
-            ]
-            
-            achievement_sentences = []
-            for sentence in sentences:
-                for pattern in achievement_patterns:
-                    if re.search(pattern, sentence.lower()):
-                        achievement_sentences.append(sentence)
-                        break
+            if achievement_sentences is None:
+                achievement_sentences = self.find_achievement_sentences(doc.sentences, doc.lower_sentences)
             
             # Quality metrics
             quantified_achievements = []
-            for sentence in achievement_sentences:
-                has_number = bool(re.search(r'\d+', sentence))
-                has_impact = any(keyword in sentence.lower() for keyword in self.impact_keywords)
+            for sentence, sentence_lower in achievement_sentences:
+                has_number = patterns.DIGITS.search(sentence) is not None
+                has_impact = self.impact_pattern.search(sentence_lower) is not None
                 if has_number and has_impact:
                     quantified_achievements.append(sentence)
             
@@ -396,18 +411,18 @@ class ContentAnalyzer:
                 'recommendations': ['Add more achievement-focused bullet points']
             }
     
-    def _analyze_language_quality(self, text: str) -> Dict[str, Any]:
+    @timed('content.analyze_language_quality')
+    def _analyze_language_quality(self, doc: PreparedText) -> Dict[str, Any]:
         """Language quality ve professionalism analiz eder"""
         try:
             # Sentence structure analysis
-            sentences = text.split('.')
-            total_sentences = len(sentences)
+            total_sentences = len(doc.sentences)
             
             if total_sentences == 0:
                 return {'score': 0, 'error': 'No sentences found'}
             
             # Average sentence length
-            words = text.split()
+            words = doc.tokens
             avg_sentence_length = len(words) / total_sentences
             
             # Vocabulary diversity
@@ -421,15 +436,15 @@ class ContentAnalyzer:
                 'innovative', 'collaborative', 'analytical', 'detail-oriented'
             ]
             
-            professional_count = sum(1 for word in professional_words if word in text.lower())
+            professional_count = len(doc.index.present(professional_words))
             
-            # Avoid informal language
+            # Avoid informal language ('very' 'every', 'cool' 'school' içinde sayılmaz)
             informal_words = [
                 'awesome', 'cool', 'stuff', 'things', 'lots', 'tons', 'crazy',
                 'super', 'really', 'very', 'pretty', 'quite', 'kinda', 'sorta'
             ]
             
-            informal_count = sum(1 for word in informal_words if word in text.lower())
+            informal_count = len(doc.index.present(informal_words))
             
             # Scoring
             length_score = 100 if 15 <= avg_sentence_length <= 25 else max(0, 100 - abs(avg_sentence_length - 20) * 3)
@@ -454,10 +469,11 @@ class ContentAnalyzer:
                 'recommendations': ['Improve language quality and professionalism']
             }
     
-    def _analyze_buzzwords(self, text: str) -> Dict[str, Any]:
+    @timed('content.analyze_buzzwords')
+    def _analyze_buzzwords(self, doc: PreparedText) -> Dict[str, Any]:
         """Buzzword ve cliche kullanımını analiz eder"""
         try:
-            text_lower = text.lower()
+            text_lower = doc.lower
             
             # Overused buzzwords
             buzzwords = [
@@ -507,32 +523,19 @@ class ContentAnalyzer:
                 'recommendations': []
             }
     
-    def _analyze_consistency(self, text: str) -> Dict[str, Any]:
+    @timed('content.analyze_consistency')
+    def _analyze_consistency(self, doc: PreparedText) -> Dict[str, Any]:
         """Tutarlılık ve formatting consistency analiz eder"""
         try:
-            lines = text.split('\n')
+            text = doc.text
             
             # Date format consistency
-            date_patterns = [
-                r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY
-                r'\d{4}-\d{2}-\d{2}',      # YYYY-MM-DD
-                r'\w+ \d{4}',              # Month YYYY
-                r'\d{1,2}/\d{4}',          # MM/YYYY
-            ]
-            
-            found_date_formats = []
-            for pattern in date_patterns:
-                if re.search(pattern, text):
-                    found_date_formats.append(pattern)
+            found_date_formats = [pattern for pattern in patterns.DATE_FORMATS if pattern.search(text)]
             
             date_consistency = len(found_date_formats) <= 1
             
             # Bullet point consistency
-            bullet_patterns = [r'•', r'-', r'\*', r'◦', r'▪']
-            found_bullets = []
-            for pattern in bullet_patterns:
-                if re.search(f'^\\s*{pattern}', text, re.MULTILINE):
-                    found_bullets.append(pattern)
+            found_bullets = [pattern for pattern in patterns.BULLET_STYLES if pattern.search(text)]
             
             bullet_consistency = len(found_bullets) <= 1
             
@@ -721,6 +724,7 @@ class ContentAnalyzer:
         except:
             return 50.0
     
+    @timed('content.generate_content_recommendations')
     def _generate_content_recommendations(self, analysis: Dict[str, Any], target_role: str) -> List[Dict[str, Any]]:
         """İçerik analizi sonuçlarından öneriler generate eder"""
         try:
@@ -0,0 +1,145 @@
+# analyzers/executor.py
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from utils.profiling import Profiler, active_profiler
+
+EXECUTOR_MODES = ('serial', 'thread', 'process')
+
+# process modunda her worker sürecinde bir kez oluşturulan saf Python analizörleri
+_worker_analyzers: Optional[Dict[str, Any]] = None
+
+
+def _init_process_worker():
+    """Worker başlangıcında anahtar kelime otomatlarını ve içerik desenlerini bir kez yükler"""
+    global _worker_analyzers
+    from analyzers.keyword_analyzer import KeywordAnalyzer
+    from analyzers.content_analyzer import ContentAnalyzer
+    _worker_analyzers = {'keyword': KeywordAnalyzer(), 'content': ContentAnalyzer()}
+
+
+def _run_analyzer(analyzer: str, method: str, args: Tuple) -> Tuple[Any, Dict[str, Dict[str, float]]]:
+    """Worker'da çalışır: analizör metodunu ölçerek çağırır, sonucu ve aşama sürelerini döndürür"""
+    profiler = Profiler()
+    with profiler.activate():
+        result = getattr(_worker_analyzers[analyzer], method)(*args)
+    return result, profiler.as_dict()
+
+
+def _completed(func: Callable, *args) -> Future:
+    """Fonksiyonu hemen çalıştırır ve sonucunu (veya hatasını) tamamlanmış bir Future olarak döndürür"""
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except BaseException as e:
+        future.set_exception(e)
+    return future
+
+
+class AnalyzerExecutor:
+    """
+    Metin hazırlandıktan sonra birbirinden bağımsız analiz adımlarını çalıştırır
+
+    Modlar:
+        serial: Adımlar çağrıldığı anda sırayla çalışır (mevcut davranış)
+        thread: Tüm adımlar iş parçacığı havuzunda çalışır; C ağırlıklı işler (PyMuPDF)
+            GIL'i bıraktığı için paralel ilerler
+        process: Saf Python regex analizörleri (anahtar kelime, içerik) süreç havuzuna,
+            diğer adımlar iş parçacığı havuzuna gönderilir
+
+    Sonuçlar Future'lar üzerinden, adımların veriliş sırasıyla toplanır; tamamlanma sırası
+    sonucu etkilemez. Etkin Profiler iş parçacıklarına bağlamla, süreçlerden aşama süreleri
+    olarak aktarılır.
+    """
+
+    def __init__(self, mode: str = 'serial', max_workers: Optional[int] = None):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Desteklenmeyen yürütücü modu: {mode} ({', '.join(EXECUTOR_MODES)})")
+
+        self.mode = mode
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='analyzer')
+            return self._threads
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                      initializer=_init_process_worker)
+            return self._processes
+
+    def submit(self, func: Callable, *args) -> Future:
+        """Adımı iş parçacığında çalıştırır (serial modda hemen); etkin Profiler korunur"""
+        if self.mode == 'serial':
+            return _completed(func, *args)
+
+        context = contextvars.copy_context()
+        return self._thread_pool().submit(context.run, func, *args)
+
+    def submit_analyzer(self, name: str, analyzer: Any, method: str, *args) -> Future:
+        """
+        Saf Python analizör metodunu çalıştırır
+
+        Args:
+            name: Worker süreçteki analizörün adı ('keyword' veya 'content'); process modunda
+                bu analizörün worker'daki eşi çağrılır, argümanlar pickle ile taşınır
+            analyzer: Diğer modlarda doğrudan çağrılan yerel analizör
+        """
+        if self.mode != 'process':
+            return self.submit(getattr(analyzer, method), *args)
+
+        profiler = active_profiler()
+        remote = self._process_pool().submit(_run_analyzer, name, method, args)
+        future = Future()
+
+        def unpack(done: Future):
+            try:
+                result, timings = done.result()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            if profiler is not None:
+                profiler.merge(timings)
+            future.set_result(result)
+
+        remote.add_done_callback(unpack)
+        return future
+
+    @staticmethod
+    def gather(futures: Dict[str, Future]) -> Dict[str, Any]:
+        """Sonuçları verilen anahtar sırasıyla toplar; ilk hatalı adımın hatası yükseltilir"""
+        return {name: future.result() for name, future in futures.items()}
+
+    def shutdown(self):
+        """Havuzları kapatır"""
+        with self._lock:
+            if self._threads is not None:
+                self._threads.shutdown()
+                self._threads = None
+            if self._processes is not None:
+                self._processes.shutdown()
+                self._processes = None
+
+
+# Süreç içindeki pipeline'ların paylaştığı yürütücüler (mod ve worker sayısına göre)
+_executors: Dict[Tuple[str, Optional[int]], AnalyzerExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(mode: str, max_workers: Optional[int] = None) -> AnalyzerExecutor:
+    """Paylaşılan yürütücüyü döndürür; havuzlar ilk kullanımda oluşturulur"""
+    with _executors_lock:
+        executor = _executors.get((mode, max_workers))
+        if executor is None:
+            executor = _executors[(mode, max_workers)] = AnalyzerExecutor(mode, max_workers)
+        return executor
@@ -1,8 +1,11 @@
 # analyzers/format_analyzer.py
-import re
-import fitz  # PyMuPDF
-from typing import Dict, List, Any, Optional
-import streamlit as st
+from typing import Dict, List, Any, Callable, Optional, Union
+
+from analyzers import patterns
+from utils.lazy_result import LazyResult
+from utils.prepared_text import PreparedText
+from utils.file_processor import ParsedDocument, parse_pdf_bytes, upload_buffer
+from utils.profiling import timed
 
 class FormatAnalyzer:
     """CV format ve yapı analizi yapan sınıf"""
@@ -46,45 +49,93 @@ class FormatAnalyzer:
                 'critical': False
             }
         }
+        
+        # Bölüm başına tek bir derlenmiş başlık deseni
+        self.section_patterns = {
+            name: patterns.section_heading_pattern(config['keywords'])
+            for name, config in self.required_sections.items()
+        }
     
-    def analyze_format(self, uploaded_file, cv_text: str) -> Dict[str, Any]:
-        """CV formatını kapsamlı analiz eder"""
+    @timed('analyze_format')
+    def analyze_format(self, uploaded_file, cv_text: Union[str, PreparedText],
+                       parsed_document: Optional[ParsedDocument] = None,
+                       found_sections: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
+        """
+        CV formatını kapsamlı analiz eder
+        
+        Args:
+            parsed_document: FileProcessor.parse_document sonucu; verilirse PDF yeniden açılmaz
+            found_sections: Sayfa sayfa toplanmış find_sections sonucu; verilirse metin yeniden taranmaz
+        """
         try:
-            analysis = {
-                'file_format': self._check_file_format(uploaded_file),
-                'length': self._check_length(cv_text),
-                'sections': self._check_sections(cv_text),
-                'contact_info': self._check_contact_info(cv_text),
-                'fonts': self._check_fonts(uploaded_file),
-                'formatting': self._check_formatting_elements(uploaded_file, cv_text),
-                'readability': self._check_readability(cv_text),
-                'structure': self._check_structure(cv_text),
-                'ats_compliance': 0
-            }
-            
-            # Genel ATS uyumluluk skorunu hesapla
-            analysis['ats_compliance'] = self._calculate_format_score(analysis)
-            
-            # Format önerilerini generate et
-            analysis['recommendations'] = self._generate_format_recommendations(analysis)
-            
-            return analysis
+            doc = PreparedText.ensure(cv_text)
+            checks = self.format_checks(uploaded_file, doc, parsed_document, found_sections)
+            return self.combine_checks({name: check() for name, check in checks.items()})
             
         except Exception as e:
-            return {
-                'ats_compliance': 50,
-                'error': str(e),
-                'file_format': {'score': 50, 'status': 'Error in analysis'},
-                'length': {'score': 50, 'status': 'Error in analysis'},
-                'sections': {'score': 50, 'found_sections': {}, 'missing_sections': []},
-                'contact_info': {'score': 50, 'details': {}},
-                'fonts': {'score': 50, 'primary_font': 'Unknown'},
-                'formatting': {'score': 50, 'issues': []},
-                'readability': {'score': 50},
-                'structure': {'score': 50},
-                'recommendations': []
-            }
+            return self.error_result(e)
     
+    @timed('score_format')
+    def score_format(self, uploaded_file, cv_text: Union[str, PreparedText],
+                     parsed_document: Optional[ParsedDocument] = None,
+                     found_sections: Optional[Dict[str, bool]] = None) -> float:
+        """Yalnızca ATS uyumluluk skoru (analyze_format'taki ats_compliance); öneri üretilmez"""
+        try:
+            doc = PreparedText.ensure(cv_text)
+            checks = self.format_checks(uploaded_file, doc, parsed_document, found_sections)
+            return self._calculate_format_score({name: check() for name, check in checks.items()})
+        except Exception as e:
+            return self.error_result(e)['ats_compliance']
+    
+    def format_checks(self, uploaded_file, doc: PreparedText,
+                      parsed_document: Optional[ParsedDocument] = None,
+                      found_sections: Optional[Dict[str, bool]] = None) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """
+        analyze_format'ın birbirinden bağımsız alt kontrolleri (paralel çalıştırılabilir)
+        
+        Returns:
+            dict: Sonuç anahtarı -> argümansız kontrol; sonuçlar combine_checks ile birleştirilir
+        """
+        return {
+            'file_format': lambda: self._check_file_format(uploaded_file),
+            'length': lambda: self._check_length(doc),
+            'sections': lambda: self._check_sections(doc, found_sections),
+            'contact_info': lambda: self._check_contact_info(doc),
+            'fonts': lambda: self._check_fonts(uploaded_file, parsed_document),
+            'formatting': lambda: self._check_formatting_elements(uploaded_file, doc),
+            'readability': lambda: self._check_readability(doc),
+            'structure': lambda: self._check_structure(doc)
+        }
+    
+    def combine_checks(self, checks: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Alt kontrol sonuçlarından ATS uyumluluk skorunu ve önerileri üretir"""
+        # Format önerileri ilk erişimde generate edilir
+        analysis = LazyResult(checks, lazy={
+            'recommendations': lambda: self._generate_format_recommendations(analysis)
+        })
+        
+        # Genel ATS uyumluluk skorunu hesapla
+        analysis['ats_compliance'] = self._calculate_format_score(analysis)
+        
+        return analysis
+    
+    def error_result(self, e: Exception) -> Dict[str, Any]:
+        """Analiz hata verdiğinde döndürülen nötr sonuç"""
+        return {
+            'ats_compliance': 50,
+            'error': str(e),
+            'file_format': {'score': 50, 'status': 'Error in analysis'},
+            'length': {'score': 50, 'status': 'Error in analysis'},
+            'sections': {'score': 50, 'found_sections': {}, 'missing_sections': []},
+            'contact_info': {'score': 50, 'details': {}},
+            'fonts': {'score': 50, 'primary_font': 'Unknown'},
+            'formatting': {'score': 50, 'issues': []},
+            'readability': {'score': 50},
+            'structure': {'score': 50},
+            'recommendations': []
+        }
+    
+    @timed('format.check_file_format')
     def _check_file_format(self, uploaded_file) -> Dict[str, Any]:
         """Dosya formatını kontrol eder"""
         try:
@@ -130,11 +181,11 @@ class FormatAnalyzer:
                 'recommendations': ['Please check file format']
             }
     
-    def _check_length(self, text: str) -> Dict[str, Any]:
+    @timed('format.check_length')
+    def _check_length(self, doc: PreparedText) -> Dict[str, Any]:
         """CV uzunluğunu analiz eder"""
         try:
-            words = text.split()
-            word_count = len(words)
+            word_count = len(doc.tokens)
             estimated_pages = word_count / 250
             
             if 400 <= word_count <= 1000:
@@ -190,35 +241,30 @@ class FormatAnalyzer:
                 'recommendations': []
             }
     
-    def _check_sections(self, text: str) -> Dict[str, Any]:
+    def find_sections(self, text_lower: str) -> Dict[str, bool]:
+        """Metinde hangi bölümlerin başlığının geçtiğini döndürür (sayfa parçalarına da uygulanabilir)"""
+        return {
+            section_name: pattern.search(text_lower) is not None
+            for section_name, pattern in self.section_patterns.items()
+        }
+    
+    def check_sections(self, found_sections: Dict[str, bool]) -> Dict[str, Any]:
+        """Önceden bulunmuş bölüm başlıklarından (find_sections) bölüm kontrolü sonucunu hesaplar"""
+        return self._check_sections(None, found_sections)
+    
+    @timed('format.check_sections')
+    def _check_sections(self, doc: Optional[PreparedText],
+                        found_sections: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """CV bölümlerini kontrol eder"""
         try:
-            text_lower = text.lower()
-            found_sections = {}
+            if found_sections is None:
+                found_sections = self.find_sections(doc.lower)
+            found_sections = dict(found_sections)
             missing_sections = []
             section_scores = {}
             
             for section_name, section_config in self.required_sections.items():
-                keywords = section_config['keywords']
-                found = False
-                
-                for keyword in keywords:
-                    patterns = [
-                        rf'\b{re.escape(keyword)}\b',
-                        rf'^{re.escape(keyword)}[:.]',
-                        rf'\n{re.escape(keyword)}[:.]',
-                        rf'\b{re.escape(keyword)}\s*\n',
-                    ]
-                    
-                    for pattern in patterns:
-                        if re.search(pattern, text_lower, re.MULTILINE):
-                            found = True
-                            break
-                    
-                    if found:
-                        break
-                
-                found_sections[section_name] = found
+                found = found_sections[section_name]
                 
                 if found:
                     section_scores[section_name] = 100
@@ -250,15 +296,16 @@ class FormatAnalyzer:
                 'recommendations': []
             }
     
-    def _check_contact_info(self, text: str) -> Dict[str, Any]:
+    @timed('format.check_contact_info')
+    def _check_contact_info(self, doc: PreparedText) -> Dict[str, Any]:
         """İletişim bilgilerini kontrol eder"""
         try:
             contact_analysis = {
-                'email': self._find_email(text),
-                'phone': self._find_phone(text),
-                'linkedin': self._find_linkedin(text),
-                'location': self._find_location(text),
-                'website': self._find_website(text)
+                'email': self._find_email(doc.text),
+                'phone': self._find_phone(doc.text),
+                'linkedin': self._find_linkedin(doc.lower),
+                'location': self._find_location(doc.text),
+                'website': self._find_website(doc.lower)
             }
             
             found_count = sum(1 for item in contact_analysis.values() if item['found'])
@@ -283,11 +330,12 @@ class FormatAnalyzer:
                 'recommendations': ['Please check contact information']
             }
     
-    def _check_fonts(self, uploaded_file) -> Dict[str, Any]:
+    @timed('format.check_fonts')
+    def _check_fonts(self, uploaded_file, parsed_document: Optional[ParsedDocument] = None) -> Dict[str, Any]:
         """Font analizi"""
         try:
             if uploaded_file.type == 'application/pdf':
-                return self._analyze_pdf_fonts(uploaded_file)
+                return self._analyze_pdf_fonts(uploaded_file, parsed_document)
             else:
                 return {
                     'score': 85,
@@ -310,27 +358,12 @@ class FormatAnalyzer:
                 'recommendations': ['Use standard fonts like Arial or Calibri']
             }
     
-    def _analyze_pdf_fonts(self, uploaded_file) -> Dict[str, Any]:
+    def _analyze_pdf_fonts(self, uploaded_file, parsed_document: Optional[ParsedDocument] = None) -> Dict[str, Any]:
         """PDF font detaylı analizi"""
         try:
-            doc = fitz.open(stream=uploaded_file.getvalue(), filetype="pdf")
-            font_usage = {}
-            
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
-                blocks = page.get_text("dict")
-                
-                for block in blocks.get("blocks", []):
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            for span in line["spans"]:
-                                font_name = span.get("font", "Unknown")
-                                if font_name in font_usage:
-                                    font_usage[font_name] += 1
-                                else:
-                                    font_usage[font_name] = 1
-            
-            doc.close()
+            if parsed_document is None or parsed_document.font_usage is None:
+                parsed_document = parse_pdf_bytes(upload_buffer(uploaded_file))
+            font_usage = parsed_document.font_usage
             
             primary_font = max(font_usage, key=font_usage.get) if font_usage else "Unknown"
             ats_safe = any(safe_font.lower() in primary_font.lower() for safe_font in self.ats_safe_fonts)
@@ -367,14 +400,15 @@ class FormatAnalyzer:
                 'recommendations': ['Use Arial, Calibri, or Times New Roman fonts']
             }
     
-    def _check_formatting_elements(self, uploaded_file, cv_text: str) -> Dict[str, Any]:
+    @timed('format.check_formatting_elements')
+    def _check_formatting_elements(self, uploaded_file, doc: PreparedText) -> Dict[str, Any]:
         """Formatting elementlerini kontrol eder"""
         try:
             issues = []
             score = 100
             
             # Metin analizi
-            text_issues = self._analyze_text_formatting(cv_text)
+            text_issues = self._analyze_text_formatting(doc)
             issues.extend(text_issues['issues'])
             score -= text_issues['penalty']
             
@@ -397,11 +431,12 @@ class FormatAnalyzer:
                 'recommendations': []
             }
     
-    def _check_readability(self, text: str) -> Dict[str, Any]:
+    @timed('format.check_readability')
+    def _check_readability(self, doc: PreparedText) -> Dict[str, Any]:
         """Okunabilirlik analizi"""
         try:
-            words = text.split()
-            sentences = text.split('.')
+            words = doc.tokens
+            sentences = doc.sentences
             
             avg_words_per_sentence = len(words) / len(sentences) if sentences else 0
             
@@ -428,16 +463,17 @@ class FormatAnalyzer:
                 'recommendations': ['Ensure text is clear and well-structured']
             }
     
-    def _check_structure(self, text: str) -> Dict[str, Any]:
+    @timed('format.check_structure')
+    def _check_structure(self, doc: PreparedText) -> Dict[str, Any]:
         """CV yapısını analiz eder"""
         try:
-            lines = text.split('\n')
+            lines = doc.lines
             total_lines = len(lines)
             
-            bullet_count = sum(1 for line in lines if re.match(r'^\s*[•\-\*\u2022]', line.strip()))
+            bullet_count = sum(1 for line in lines if patterns.BULLET_LINE.match(line.strip()))
             bullet_percentage = (bullet_count / total_lines) * 100 if total_lines > 0 else 0
             
-            numbers_count = len(re.findall(r'\d+[%\$KMB]?', text))
+            numbers_count = len(patterns.NUMBER_TOKEN.findall(doc.text))
             
             score = 100
             if bullet_percentage < 10:
@@ -468,8 +504,7 @@ class FormatAnalyzer:
     def _find_email(self, text: str) -> Dict[str, Any]:
         """Email adresi bulur"""
         try:
-            pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            matches = re.findall(pattern, text)
+            matches = patterns.EMAIL.findall(text)
             
             if matches:
                 return {'found': True, 'value': matches[0], 'count': len(matches)}
@@ -480,14 +515,8 @@ class FormatAnalyzer:
     def _find_phone(self, text: str) -> Dict[str, Any]:
         """Telefon numarası bulur"""
         try:
-            patterns = [
-                r'(\+\d{1,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-                r'\d{3}-\d{3}-\d{4}',
-                r'\(\d{3}\)\s?\d{3}-\d{4}'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
+            for pattern in patterns.PHONE_PATTERNS:
+                matches = pattern.findall(text)
                 if matches:
                     return {'found': True, 'value': matches[0], 'count': len(matches)}
             
@@ -495,18 +524,11 @@ class FormatAnalyzer:
         except:
             return {'found': False, 'value': None, 'count': 0}
     
-    def _find_linkedin(self, text: str) -> Dict[str, Any]:
-        """LinkedIn profili bulur"""
+    def _find_linkedin(self, text_lower: str) -> Dict[str, Any]:
+        """LinkedIn profili bulur (küçük harfli metin bekler)"""
         try:
-            patterns = [
-                r'linkedin\.com/in/[A-Za-z0-9-]+',
-                r'linkedin\.com/pub/[A-Za-z0-9-]+',
-                r'www\.linkedin\.com/in/[A-Za-z0-9-]+'
-            ]
-            
-            text_lower = text.lower()
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower)
+            for pattern in patterns.LINKEDIN_PATTERNS:
+                matches = pattern.findall(text_lower)
                 if matches:
                     return {'found': True, 'value': matches[0], 'count': len(matches)}
             
@@ -517,14 +539,8 @@ class FormatAnalyzer:
     def _find_location(self, text: str) -> Dict[str, Any]:
         """Konum bilgisi bulur"""
         try:
-            patterns = [
-                r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b',
-                r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b',
-                r'\b[A-Z][a-z]+\s+\d{5}\b'
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
+            for pattern in patterns.LOCATION_PATTERNS:
+                matches = pattern.findall(text)
                 if matches:
                     return {'found': True, 'value': matches[0], 'count': len(matches)}
             
@@ -532,20 +548,11 @@ class FormatAnalyzer:
         except:
             return {'found': False, 'value': None, 'count': 0}
     
-    def _find_website(self, text: str) -> Dict[str, Any]:
-        """Website/portfolio bulur"""
+    def _find_website(self, text_lower: str) -> Dict[str, Any]:
+        """Website/portfolio bulur (küçük harfli metin bekler)"""
         try:
-            patterns = [
-                r'https?://[A-Za-z0-9.-]+\.[A-Za-z]{2,}',
-                r'www\.[A-Za-z0-9.-]+\.[A-Za-z]{2,}',
-                r'[A-Za-z0-9.-]+\.com\b',
-                r'github\.com/[A-Za-z0-9-]+',
-                r'portfolio\.[A-Za-z0-9.-]+'
-            ]
-            
-            text_lower = text.lower()
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower)
+            for pattern in patterns.WEBSITE_PATTERNS:
+                matches = pattern.findall(text_lower)
                 if matches:
                     clean_matches = [m for m in matches if 'linkedin' not in m.lower()]
                     if clean_matches:
@@ -555,18 +562,19 @@ class FormatAnalyzer:
         except:
             return {'found': False, 'value': None, 'count': 0}
     
-    def _analyze_text_formatting(self, text: str) -> Dict[str, Any]:
+    def _analyze_text_formatting(self, doc: PreparedText) -> Dict[str, Any]:
         """Metin formatting analizi"""
         try:
             issues = []
             penalty = 0
+            text_length = len(doc.text)
             
-            caps_ratio = sum(1 for c in text if c.isupper()) / len(text) if text else 0
+            caps_ratio = doc.upper_count / text_length if text_length else 0
             if caps_ratio > 0.15:
                 issues.append("excessive_caps")
                 penalty += 10
             
-            punct_ratio = sum(1 for c in text if c in '!@#$%^&*()') / len(text) if text else 0
+            punct_ratio = doc.special_char_count / text_length if text_length else 0
             if punct_ratio > 0.05:
                 issues.append("excessive_punctuation")
                 penalty += 5
@@ -630,6 +638,7 @@ class FormatAnalyzer:
         except:
             return 50.0
     
+    @timed('format.generate_format_recommendations')
     def _generate_format_recommendations(self, analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Format analizi sonuçlarından öneriler generate eder"""
         try:
@@ -0,0 +1,73 @@
+# analyzers/incremental.py
+from typing import Dict, List, Any, Callable, Optional
+
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.format_analyzer import FormatAnalyzer
+
+
+class IncrementalScan:
+    """
+    Sayfa metinlerini geldikçe tüketen anahtar kelime ve bölüm taraması
+
+    FileProcessor.parse_document(on_page=...) ile kullanılır: her sayfa rol otomatına
+    (durum sayfalar arasında korunur) ve bölüm desenlerine beslenir, ardından ara skor
+    üretilir. Tarama bitince toplanan eşleşmeler analizörlere verilir; metin yeniden taranmaz.
+    """
+
+    def __init__(self, keyword_analyzer: KeywordAnalyzer, format_analyzer: FormatAnalyzer, role: str,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Args:
+            on_progress: Her sayfadan sonra ara sonuçla (provisional()) çağrılır
+        """
+        self.keyword_analyzer = keyword_analyzer
+        self.format_analyzer = format_analyzer
+        self.role = role
+        self.on_progress = on_progress
+
+        self._stream = None
+        if role in keyword_analyzer.role_matchers:
+            # Tam metin taramasıyla (analyze_keywords) aynı kelime sınırı kuralı
+            self._stream = keyword_analyzer.role_matchers[role].stream(whole_words=True)
+        self.found_sections: Dict[str, bool] = {name: False for name in format_analyzer.required_sections}
+        self.pages_read = 0
+        self.page_count = 0
+
+    def feed_page(self, page_text: str, page_number: int, page_count: int):
+        """Bir sayfa metnini taramaya ekler (FileProcessor on_page geri çağrısı)"""
+        page_lower = page_text.lower()
+
+        if self._stream is not None:
+            self._stream.feed(page_lower)
+
+        # Sayfalar satır sonuyla bittiği için başlık desenleri sayfa sınırında bölünmez
+        for name, found in self.format_analyzer.find_sections(page_lower).items():
+            if found:
+                self.found_sections[name] = True
+
+        self.pages_read = page_number
+        self.page_count = page_count
+
+        if self.on_progress is not None:
+            self.on_progress(self.provisional())
+
+    @property
+    def keyword_hits(self) -> Optional[Dict[str, List[int]]]:
+        """Şimdiye kadarki anahtar kelime eşleşmeleri (rol bilinmiyorsa None)"""
+        return self._stream.hits if self._stream is not None else None
+
+    def provisional(self) -> Dict[str, Any]:
+        """Okunan sayfalara göre ara anahtar kelime ve bölüm skorları"""
+        keyword_score = 0.0
+        if self._stream is not None:
+            keyword_score = self.keyword_analyzer.score_hits(self._stream.hits, self.role)
+
+        sections = self.format_analyzer.check_sections(self.found_sections)
+
+        return {
+            'pages_read': self.pages_read,
+            'page_count': self.page_count,
+            'keyword_score': keyword_score,
+            'section_score': sections['score'],
+            'found_sections': [name for name, found in self.found_sections.items() if found]
+        }
@@ -0,0 +1,312 @@
+# analyzers/job_description_analyzer.py
+import bisect
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+from analyzers import patterns
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.keyword_matcher import KeywordMatcher
+from analyzers.ruleset import CompiledRuleset
+from utils.lazy_result import LazyResult
+from utils.prepared_text import PreparedText
+from utils.profiling import timed
+
+# TECH_TERM adaylarından atılan kelimeler (küçük harf): İngilizce sık kelimeler, ilan başlıklarında
+# ve metninde geçen genel kelimeler, unvan/derece kısaltmaları ve şirket adı ekleri. CamelCase bir
+# aday ('DataCorp') tüm parçaları bu kümedeyse atılır.
+NON_SKILL_WORDS = frozenset('''
+    a about above across after again against all also am an and any are as at be because been before
+    being below between both but by can could did do does doing down during each either every few for
+    from further get had has have having he her here hers him his how i if in into is it its itself
+    just let like make may me might more most must my no nor not now of off on once one only or other
+    our ours out over own same she should so some such than that the their them then there these they
+    this those through to too under until up upon us very via was way we well were what when where
+    which while who whom why will with within without would yet you your yours
+    ability about apply benefits bonus career company culture day description do environment equal
+    excellent experience field full good great growth help hiring hybrid ideal job join key lead level
+    location looking mission new nice office opportunity overview part people plus position preferred
+    product qualifications remote required requirements responsibilities role salary senior junior
+    skills strong success summary team teams time today value values week work working world year years
+    analyst engineer manager scientist specialist intern data business
+    corp corporation inc llc ltd co group labs tech technologies solutions systems global international
+    usa uk eu cv hr ceo cto cfo coo vp svp evp tbd etc eoe pto faq id ok asap wfh dei
+    phd msc bsc mba ba bs ms ma mphil
+'''.split())
+
+# Kapsama skorunda tercih sebebi terimlerin ağırlığı (zorunlu terimler 1.0)
+PREFERRED_WEIGHT = 0.5
+
+# Rol sözlüklerinde olmayan, ilanlarda sık geçen araçlar (kanonik yazım -> küçük harf yazımlar).
+# TECH_TERM yalnızca CamelCase, kısaltma ve sembollü adları yakalar; düz yazılan adlar buradan bulunur.
+# Bir rol dosyası aynı yazımı eklerse terim sözlükten gelir.
+EXTRA_TECH_TERMS = {
+    'Airflow': ['airflow', 'apache airflow'],
+    'Ansible': ['ansible'],
+    'dbt': ['dbt', 'dbt core', 'dbt cloud'],
+    'Django': ['django'],
+    'Elasticsearch': ['elasticsearch'],
+    'FastAPI': ['fastapi'],
+    'Fivetran': ['fivetran'],
+    'Flask': ['flask'],
+    'GitHub': ['github', 'github actions'],
+    'GitLab': ['gitlab', 'gitlab ci'],
+    'Go': ['golang'],
+    'Hadoop': ['hadoop'],
+    'Hive': ['hive', 'apache hive'],
+    'JavaScript': ['javascript'],
+    'Jenkins': ['jenkins'],
+    'Kafka': ['kafka', 'apache kafka'],
+    'Kubeflow': ['kubeflow'],
+    'Kubernetes': ['kubernetes', 'k8s'],
+    'Linux': ['linux'],
+    'Metabase': ['metabase'],
+    'MLflow': ['mlflow'],
+    'React': ['react.js', 'reactjs'],
+    'Redis': ['redis'],
+    'Rust': ['rust'],
+    'SciPy': ['scipy'],
+    'Spark': ['spark', 'apache spark', 'pyspark'],
+    'SPSS': ['spss'],
+    'Stata': ['stata'],
+    'Superset': ['superset', 'apache superset'],
+    'Terraform': ['terraform'],
+    'TypeScript': ['typescript']
+}
+
+EXTRA_TERM_MATCHER = KeywordMatcher(EXTRA_TECH_TERMS)
+EXTRA_TERM_SURFACES = frozenset(surface for surfaces in EXTRA_TECH_TERMS.values() for surface in surfaces)
+
+
+@dataclass(frozen=True)
+class JobDescriptionIndex:
+    """Bir iş ilanından çıkarılan terimler ve bu terimler için derlenmiş eşleştirici"""
+
+    posting_hash: str
+    required: Tuple[str, ...]
+    preferred: Tuple[str, ...]
+    matcher: KeywordMatcher
+
+    @property
+    def terms(self) -> Tuple[str, ...]:
+        return self.required + self.preferred
+
+
+def is_non_skill(term: str) -> bool:
+    """Aday terim yaygın bir kelime mi (CamelCase ise tüm parçaları)"""
+    if term.lower() in NON_SKILL_WORDS:
+        return True
+    parts = patterns.CAMEL_CASE_PART.findall(term)
+    return len(parts) > 1 and all(part.lower() in NON_SKILL_WORDS for part in parts)
+
+
+class JobDescriptionAnalyzer:
+    """İş ilanından yetenek terimleri çıkarır ve CV'nin ilanı ne kadar karşıladığını ölçer"""
+
+    def __init__(self, keyword_analyzer: KeywordAnalyzer, cache_size: int = 128):
+        """
+        Args:
+            keyword_analyzer: Rol sözlükleri ve varyasyonları (derlenmiş kural seti) buradan alınır
+            cache_size: Bellekte tutulacak ilan indeksi sayısı (ilan hash'ine göre LRU)
+        """
+        self.keyword_analyzer = keyword_analyzer
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, JobDescriptionIndex]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(job_description: str) -> str:
+        """Satır yapısını koruyarak boşlukları normalize eder (hash bu metin üzerinden alınır)"""
+        lines = (' '.join(line.split()) for line in job_description.strip().splitlines())
+        return '\n'.join(line for line in lines if line)
+
+    def posting_hash(self, job_description: str, ruleset_version: Optional[str] = None) -> str:
+        """İlan metni ve sözlük sürümünden kısa hash üretir"""
+        if ruleset_version is None:
+            ruleset_version = self.keyword_analyzer.ruleset_version
+        digest = hashlib.sha256(self.normalize(job_description).encode('utf-8'))
+        digest.update(b'\0' + ruleset_version.encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def get_index(self, job_description: str) -> JobDescriptionIndex:
+        """İlan indeksini önbellekten döndürür; yoksa çıkarır ve önbelleğe ekler"""
+        ruleset = self.keyword_analyzer.ruleset
+        posting_hash = self.posting_hash(job_description, ruleset.version)
+
+        with self._lock:
+            index = self._cache.get(posting_hash)
+            if index is not None:
+                self._cache.move_to_end(posting_hash)
+                return index
+
+        index = self._extract(self.normalize(job_description), posting_hash, ruleset)
+
+        with self._lock:
+            self._cache[posting_hash] = index
+            self._cache.move_to_end(posting_hash)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return index
+
+    @timed('job_description.extract')
+    def _extract(self, text: str, posting_hash: str, ruleset: CompiledRuleset) -> JobDescriptionIndex:
+        """İlan metninden zorunlu ve tercih sebebi terimleri çıkarır (sözlük: kural setindeki tüm roller)"""
+        lower = text.lower()
+
+        # Satır başlangıçları ve her satırın zorunlu/tercih durumu
+        line_starts = []
+        line_preferred = []
+        preferred_mode = False
+        offset = 0
+        for line in lower.split('\n'):
+            if patterns.PREFERRED_MARKER.search(line):
+                preferred_mode = True
+            elif patterns.REQUIRED_MARKER.search(line):
+                preferred_mode = False
+            line_starts.append(offset)
+            line_preferred.append(preferred_mode)
+            offset += len(line) + 1
+
+        def is_preferred(position: int) -> bool:
+            return line_preferred[bisect.bisect_right(line_starts, position) - 1]
+
+        # Terim -> herhangi bir geçişi zorunlu bölümde mi
+        found: Dict[str, bool] = {}
+        surfaces: Dict[str, List[str]] = {}
+
+        # Sözlük ve ek araç listesi eşleşmeleri; daha uzun bir eşleşmenin içinde kalanlar atılır
+        # ('power bi' içindeki 'bi' -> 'business intelligence', 'spark mllib' içindeki 'spark' sayılmaz)
+        spans = []
+        for matcher, term_surfaces in ((ruleset.vocabulary_matcher, ruleset.vocabulary_surfaces),
+                                       (EXTRA_TERM_MATCHER, EXTRA_TECH_TERMS)):
+            for keyword, offsets in matcher.scan(lower, whole_words=True).items():
+                if term_surfaces is EXTRA_TECH_TERMS and not ruleset.known_surfaces.isdisjoint(term_surfaces[keyword]):
+                    continue
+                for start in offsets:
+                    length = max(len(surface) for surface in term_surfaces[keyword]
+                                 if lower.startswith(surface, start))
+                    spans.append((start, start + length, keyword, term_surfaces[keyword]))
+
+        for start, end, keyword, keyword_surfaces in spans:
+            if any(o_start <= start and end <= o_end and (o_end - o_start) > (end - start)
+                   for o_start, o_end, _, _ in spans):
+                continue
+            found[keyword] = found.get(keyword, False) or not is_preferred(start)
+            surfaces[keyword] = list(keyword_surfaces)
+
+        # Sözlük dışı teknik terimler; aynı terimin ilk yazımı kanonik kabul edilir
+        canonical: Dict[str, str] = {}
+        for start, match in self._tech_term_candidates(text):
+            term_lower = match.group().lower()
+            if (is_non_skill(match.group()) or term_lower in ruleset.known_surfaces
+                    or term_lower in EXTRA_TERM_SURFACES):
+                continue
+            term = canonical.setdefault(term_lower, match.group())
+            found[term] = found.get(term, False) or not is_preferred(start + match.start())
+            surfaces[term] = [term_lower]
+
+        required = tuple(term for term, is_required in found.items() if is_required)
+        preferred = tuple(term for term, is_required in found.items() if not is_required)
+
+        return JobDescriptionIndex(
+            posting_hash=posting_hash,
+            required=required,
+            preferred=preferred,
+            matcher=KeywordMatcher(surfaces)
+        )
+
+    @staticmethod
+    def _tech_term_candidates(text: str):
+        """
+        TECH_TERM eşleşmeleri (satır offset'i, eşleşme); başlıklar taranmaz
+
+        Tamamı büyük harfli, liste ayırıcısı içermeyen çok kelimeli satırlar ('ABOUT THE ROLE')
+        atlanır. Bölüm işareti içeren satırlarda ('Nice to have: Kafka') yalnızca ':' sonrası taranır.
+        """
+        offset = 0
+        for line in text.split('\n'):
+            line_offset = offset
+            offset += len(line) + 1
+            lower_line = line.lower()
+            if patterns.PREFERRED_MARKER.search(lower_line) or patterns.REQUIRED_MARKER.search(lower_line):
+                colon = line.find(':')
+                if colon < 0:
+                    continue
+                line_offset += colon + 1
+                line = line[colon + 1:]
+            elif line.isupper() and len(line.split()) > 1 and not patterns.LIST_SEPARATOR.search(line):
+                continue
+            for match in patterns.TECH_TERM.finditer(line):
+                yield line_offset, match
+
+    @timed('analyze_job_description')
+    def analyze(self, cv_text: Union[str, PreparedText], job_description: str) -> Dict[str, Any]:
+        """CV'yi iş ilanındaki terimlerle tek geçişte eşleştirir ve kapsama skoru hesaplar"""
+        index = self.get_index(job_description)
+        if not index.terms:
+            return {
+                'error': "İlanda tanınan yetenek terimi bulunamadı",
+                'score': 0,
+                'posting_hash': index.posting_hash,
+                'term_count': 0
+            }
+
+        doc = PreparedText.ensure(cv_text)
+        hits = index.matcher.scan(doc.lower, whole_words=True)
+
+        matched_required = [term for term in index.required if term in hits]
+        missing_required = [term for term in index.required if term not in hits]
+        matched_preferred = [term for term in index.preferred if term in hits]
+        missing_preferred = [term for term in index.preferred if term not in hits]
+
+        total_weight = len(index.required) + PREFERRED_WEIGHT * len(index.preferred)
+        matched_weight = len(matched_required) + PREFERRED_WEIGHT * len(matched_preferred)
+        score = matched_weight / total_weight * 100
+
+        return LazyResult({
+            'score': round(score, 1),
+            'posting_hash': index.posting_hash,
+            'term_count': len(index.terms),
+            'required_coverage': len(matched_required) / len(index.required) if index.required else 1.0,
+            'preferred_coverage': len(matched_preferred) / len(index.preferred) if index.preferred else 1.0,
+            'matched_required': matched_required,
+            'missing_required': missing_required,
+            'matched_preferred': matched_preferred,
+            'missing_preferred': missing_preferred
+        }, lazy={
+            'recommendations': lambda: self._generate_recommendations(missing_required, missing_preferred)
+        })
+
+    def _generate_recommendations(self, missing_required: List[str], missing_preferred: List[str]) -> List[Dict[str, Any]]:
+        """İlanla eşleşmeyen terimler için öneriler"""
+        recommendations = []
+
+        if missing_required:
+            recommendations.append({
+                'type': 'job_description',
+                'priority': 'HIGH',
+                'title': "İş İlanındaki Zorunlu Yetenekler Eksik",
+                'description': f"İlanda istenen {len(missing_required)} yetenek CV'nizde geçmiyor",
+                'recommendations': [
+                    f"Sahip olduğunuz yetenekleri ilandaki ifadeyle yazın: {', '.join(missing_required[:5])}",
+                    "Bu yetenekleri kullandığınız proje ve deneyimleri somut örneklerle belirtin"
+                ],
+                'impact': '+15-25 puan'
+            })
+
+        if missing_preferred:
+            recommendations.append({
+                'type': 'job_description',
+                'priority': 'LOW',
+                'title': "Tercih Sebebi Yetenekleri Değerlendirin",
+                'description': "İlandaki tercih sebebi yeteneklerden bazıları CV'nizde yok",
+                'recommendations': [
+                    f"Deneyiminiz varsa ekleyin: {', '.join(missing_preferred[:5])}"
+                ],
+                'impact': '+5-10 puan'
+            })
+
+        return recommendations
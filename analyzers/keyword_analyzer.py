@@ -1,47 +1,80 @@
 # analyzers/keyword_analyzer.py
-import json
-import re
-from typing import Dict, List, Any
-from pathlib import Path
+from typing import Dict, List, Any, Mapping, Optional, Union
+
+from analyzers import patterns
+from analyzers.keyword_matcher import KeywordMatcher
+from analyzers.role_schema import ScoringRules
+from analyzers.ruleset import CompiledRuleset, RulesetRegistry, RULESETS
+from utils.lazy_result import LazyResult
+from utils.prepared_text import PreparedText
+from utils.profiling import timed
 
 class KeywordAnalyzer:
     """Akıllı anahtar kelime analizi yapan sınıf"""
     
-    def __init__(self):
-        self.data_path = Path("data/keywords")
-        self.role_data = {}
-        self._load_role_data()
+    def __init__(self, registry: Optional[RulesetRegistry] = None):
+        """
+        Args:
+            registry: Rol kural setlerinin alındığı kayıt (varsayılan: süreçte paylaşılan RULESETS);
+                JSON'lar analizör başına değil, kayıt başına bir kez okunup derlenir
+        """
+        self.registry = registry or RULESETS
     
-    def _load_role_data(self):
-        """Role-specific keyword verilerini yükler"""
-        role_files = {
-            'data_scientist': 'data_scientist.json',
-            'data_analyst': 'data_analyst.json', 
-            'business_analyst': 'business_analyst.json'
-        }
-        
-        for role, filename in role_files.items():
-            try:
-                file_path = self.data_path / filename
-                if file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.role_data[role] = json.load(f)
-                else:
-                    print(f"Uyarı: {filename} dosyası bulunamadı")
-            except Exception as e:
-                print(f"Hata: {filename} yüklenirken hata: {e}")
+    @property
+    def ruleset(self) -> CompiledRuleset:
+        """Güncel derlenmiş kural seti (dosyalar değiştiyse yeniden yüklenmiş olabilir)"""
+        return self.registry.get()
     
-    def analyze_keywords(self, cv_text: str, target_role: str) -> Dict[str, Any]:
-        """CV metninde akıllı anahtar kelime analizi yapar"""
-        
-        if target_role not in self.role_data:
+    @property
+    def role_data(self) -> Mapping[str, Dict[str, Any]]:
+        return self.ruleset.role_data
+    
+    @property
+    def role_matchers(self) -> Mapping[str, KeywordMatcher]:
+        return self.ruleset.role_matchers
+    
+    @property
+    def ruleset_version(self) -> str:
+        return self.ruleset.version
+    
+    @timed('analyze_keywords')
+    def analyze_keywords(self, cv_text: Union[str, PreparedText], target_role: str,
+                         keyword_hits: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
+        """
+        CV metninde akıllı anahtar kelime analizi yapar
+        
+        Args:
+            keyword_hits: Sayfa sayfa toplanmış eşleşmeler (MatchStream.hits); verilirse metin yeniden taranmaz
+        """
+        
+        # Analiz boyunca aynı kural seti kullanılır (yeniden yükleme araya girse bile)
+        ruleset = self.ruleset
+        if target_role not in ruleset.role_data:
             return {
                 'error': f"Desteklenmeyen rol: {target_role}",
                 'total_score': 0
             }
         
-        role_config = self.role_data[target_role]
-        cv_text_lower = cv_text.lower()
+        doc = PreparedText.ensure(cv_text)
+        
+        # Tüm anahtar kelimeler tek geçişte bulunur
+        if keyword_hits is None:
+            keyword_hits = ruleset.role_matchers[target_role].scan(doc.lower, whole_words=True)
+        
+        return self.analyze_hits(keyword_hits, target_role, self.count_quantified(doc), ruleset)
+    
+    def analyze_hits(self, keyword_hits: Mapping[str, Any], target_role: str, quantified_results: int,
+                     ruleset: Optional[CompiledRuleset] = None) -> Dict[str, Any]:
+        """
+        Eşleşmelerden ve sayısal ifade sayısından anahtar kelime analizini oluşturur (metin gerekmez)
+        
+        Args:
+            keyword_hits: Bulunan anahtar kelimeler; yalnızca üyelik kontrol edilir
+            quantified_results: count_quantified sonucu
+        """
+        ruleset = ruleset or self.ruleset
+        role_config = ruleset.role_data[target_role]
+        rules = ruleset.scoring_rules[target_role]
         
         # Skill kategorilerini analiz et
         category_results = {}
@@ -50,7 +83,7 @@ class KeywordAnalyzer:
         missing_keywords = {}
         
         for category, config in role_config['critical_skills'].items():
-            result = self._analyze_category(cv_text_lower, config)
+            result = self._analyze_category(keyword_hits, config, rules)
             category_results[category] = result
             category_scores[category] = result['score']
             found_keywords[category] = result['total_found']
@@ -61,65 +94,91 @@ class KeywordAnalyzer:
         
         # Experience keywords analizi
         experience_analysis = self._analyze_experience_keywords(
-            cv_text_lower, role_config.get('experience_keywords', [])
+            keyword_hits, role_config.get('experience_keywords', [])
         )
         
         # Impact metrics analizi
         impact_analysis = self._analyze_impact_metrics(
-            cv_text_lower, role_config.get('impact_metrics', [])
+            keyword_hits, role_config.get('impact_metrics', []), quantified_results
         )
         
-        return {
+        return LazyResult({
             'total_score': round(total_score, 1),
             'category_scores': category_scores,
             'category_results': category_results,
             'found_keywords': found_keywords,
             'missing_keywords': missing_keywords,
             'experience_analysis': experience_analysis,
-            'impact_analysis': impact_analysis,
-            'recommendations': self._generate_smart_recommendations(
-                category_results, target_role
-            )
+            'impact_analysis': impact_analysis
+        }, lazy={
+            # Öneriler ve kullanım örnekleri ilk erişimde generate edilir
+            'recommendations': lambda: self._generate_smart_recommendations(category_results, target_role)
+        })
+    
+    @timed('score_keywords')
+    def score_keywords(self, cv_text: Union[str, PreparedText], target_role: str,
+                       keyword_hits: Optional[Dict[str, List[int]]] = None) -> float:
+        """Yalnızca toplam anahtar kelime skoru (analyze_keywords'teki total_score); öneri üretilmez"""
+        ruleset = self.ruleset
+        if target_role not in ruleset.role_data:
+            return 0
+        if keyword_hits is None:
+            keyword_hits = ruleset.role_matchers[target_role].scan(PreparedText.ensure(cv_text).lower, whole_words=True)
+        return self.score_hits(keyword_hits, target_role, ruleset)
+    
+    @staticmethod
+    @timed('keywords.count_quantified')
+    def count_quantified(cv_text: Union[str, PreparedText]) -> int:
+        """Impact analizindeki sayısal değer (yüzde, para, çarpan) eşleşme sayısı"""
+        doc = PreparedText.ensure(cv_text)
+        return sum(len(pattern.findall(doc.lower)) for pattern in patterns.IMPACT_NUMBER_PATTERNS)
+    
+    def score_hits(self, keyword_hits: Dict[str, List[int]], target_role: str,
+                   ruleset: Optional[CompiledRuleset] = None) -> float:
+        """Yalnızca eşleşmelerden toplam anahtar kelime skorunu hesaplar (ör. ara skor için)"""
+        ruleset = ruleset or self.ruleset
+        role_config = ruleset.role_data[target_role]
+        rules = ruleset.scoring_rules[target_role]
+        category_results = {
+            category: self._analyze_category(keyword_hits, config, rules)
+            for category, config in role_config['critical_skills'].items()
         }
+        return round(self._calculate_total_score(category_results, role_config), 1)
     
-    def _analyze_category(self, cv_text_lower: str, category_config: Dict) -> Dict[str, Any]:
-        """Kategori skorunu yeni akıllı mantıkla hesapla"""
+    @timed('keywords.analyze_category')
+    def _analyze_category(self, keyword_hits: Dict[str, List[int]], category_config: Dict,
+                          rules: ScoringRules) -> Dict[str, Any]:
+        """Kategori skorunu rolün skor kurallarıyla (scoring_rules) hesapla"""
         
-        core_keywords = category_config.get('core_keywords', [])
-        bonus_keywords = category_config.get('bonus_keywords', [])
-        minimum_required = category_config.get('minimum_required', 1)
-        importance = category_config.get('category_importance', 'medium')
+        core_keywords = category_config['core_keywords']
+        bonus_keywords = category_config['bonus_keywords']
+        minimum_required = category_config['minimum_required']
+        importance = category_config['category_importance']
         
         # Core keywords'leri bul
-        found_core = []
-        for keyword in core_keywords:
-            if self._keyword_exists(cv_text_lower, keyword):
-                found_core.append(keyword)
+        found_core = [keyword for keyword in core_keywords if keyword in keyword_hits]
         
         # Bonus keywords'leri bul
-        found_bonus = []
-        for keyword in bonus_keywords:
-            if self._keyword_exists(cv_text_lower, keyword):
-                found_bonus.append(keyword)
+        found_bonus = [keyword for keyword in bonus_keywords if keyword in keyword_hits]
         
         # Akıllı skor hesaplama
         core_ratio = len(found_core) / len(core_keywords) if core_keywords else 0
         bonus_ratio = len(found_bonus) / len(bonus_keywords) if bonus_keywords else 0
         
         # Base score calculation
-        core_score = core_ratio * 70  # Core skills = 70% max
-        bonus_score = min(bonus_ratio * 30, 30)  # Bonus skills = 30% max
+        core_score = core_ratio * rules.core_points  # Core skills (varsayılan %70 max)
+        bonus_score = min(bonus_ratio * rules.bonus_points, rules.bonus_points)  # Bonus skills (varsayılan %30 max)
         
         base_score = core_score + bonus_score
         
         # Minimum requirement kontrolü
         meets_minimum = len(found_core) >= minimum_required
         if not meets_minimum:
-            base_score *= 0.5  # %50 ceza if minimum not met
+            base_score *= rules.minimum_penalty  # ceza if minimum not met
         
-        # Excellence bonus (eğer core'un %80+'ı varsa)
-        if core_ratio >= 0.8:
-            base_score *= 1.1  # %10 bonus for excellence
+        # Excellence bonus (core oranı eşiği geçtiyse)
+        if core_ratio >= rules.excellence_threshold:
+            base_score *= rules.excellence_bonus
         
         # Category importance adjustment
         importance_multiplier = {
@@ -143,56 +202,6 @@ class KeywordAnalyzer:
             'importance': importance
         }
     
-    def _keyword_exists(self, text: str, keyword: str) -> bool:
-        """Anahtar kelimenin metinde var olup olmadığını kontrol eder"""
-        keyword_lower = keyword.lower()
-        
-        # Direkt eşleşme
-        if keyword_lower in text:
-            return True
-        
-        # Variation kontrolü
-        variations = self._get_keyword_variations(keyword_lower)
-        for variation in variations:
-            if variation in text:
-                return True
-        
-        return False
-    
-    def _get_keyword_variations(self, keyword: str) -> List[str]:
-        """Anahtar kelimenin çeşitli varyasyonlarını döndürür"""
-        variations = [keyword]
-        
-        # Yaygın varyasyonlar
-        variation_map = {
-            'power bi': ['powerbi', 'power-bi', 'microsoft power bi'],
-            'tableau': ['tableau desktop', 'tableau server'],
-            'excel': ['microsoft excel', 'ms excel', 'excel vba'],
-            'sql': ['mysql', 'postgresql', 'sql server', 't-sql'],
-            'python': ['python3', 'python 3'],
-            'r': ['r programming', 'r language', 'r-programming'],
-            'data cleaning': ['data cleansing', 'data preprocessing'],
-            'data visualization': ['data viz', 'dataviz'],
-            'business intelligence': ['bi', 'business-intelligence'],
-            'etl': ['extract transform load', 'extract-transform-load'],
-            'kpi': ['key performance indicator', 'key performance indicators'],
-            'dashboard': ['dashboards', 'interactive dashboard']
-        }
-        
-        if keyword in variation_map:
-            variations.extend(variation_map[keyword])
-        
-        # Dash ve underscore varyasyonları
-        if '-' in keyword:
-            variations.append(keyword.replace('-', ' '))
-            variations.append(keyword.replace('-', '_'))
-        
-        if '_' in keyword:
-            variations.append(keyword.replace('_', ' '))
-            variations.append(keyword.replace('_', '-'))
-        
-        return variations
-    
     def _calculate_total_score(self, category_results: Dict[str, Dict], role_config: Dict[str, Any]) -> float:
         """Kategori sonuçlarından toplam skoru hesaplar"""
         total_score = 0
@@ -214,13 +223,10 @@ class KeywordAnalyzer:
         
         return normalized_score
     
-    def _analyze_experience_keywords(self, text: str, keywords: List[str]) -> Dict[str, Any]:
+    @timed('keywords.analyze_experience_keywords')
+    def _analyze_experience_keywords(self, keyword_hits: Dict[str, List[int]], keywords: List[str]) -> Dict[str, Any]:
         """Experience keywords analizi"""
-        found_keywords = []
-        
-        for keyword in keywords:
-            if self._keyword_exists(text, keyword):
-                found_keywords.append(keyword)
+        found_keywords = [keyword for keyword in keywords if keyword in keyword_hits]
         
         # Experience için daha yumuşak puanlama
         score = min(100, len(found_keywords) * 8)  # Her keyword 8 puan
@@ -231,22 +237,11 @@ class KeywordAnalyzer:
             'missing': [kw for kw in keywords if kw not in found_keywords][:5]
         }
     
-    def _analyze_impact_metrics(self, text: str, metrics: List[str]) -> Dict[str, Any]:
-        """Impact metrics analizi"""
-        found_metrics = []
-        
-        for metric in metrics:
-            if self._keyword_exists(text, metric):
-                found_metrics.append(metric)
-        
-        # Sayısal değerlerin varlığını kontrol et
-        number_patterns = [
-            r'\d+%', r'\$\d+', r'\d+[KMB]', r'\d+x', r'\d+:\d+', r'\d{1,3}(?:,\d{3})*'
-        ]
-        
-        quantified_results = 0
-        for pattern in number_patterns:
-            quantified_results += len(re.findall(pattern, text))
+    @timed('keywords.analyze_impact_metrics')
+    def _analyze_impact_metrics(self, keyword_hits: Dict[str, List[int]], metrics: List[str],
+                                quantified_results: int) -> Dict[str, Any]:
+        """Impact metrics analizi (quantified_results: count_quantified sonucu)"""
+        found_metrics = [metric for metric in metrics if metric in keyword_hits]
         
         # Impact için balanced puanlama
         metric_score = min(60, len(found_metrics) * 10)  # Metrics = 60% max
@@ -260,6 +255,7 @@ class KeywordAnalyzer:
             'quantified_results': quantified_results
         }
     
+    @timed('keywords.generate_smart_recommendations')
     def _generate_smart_recommendations(self, category_results: Dict[str, Dict], target_role: str) -> List[Dict[str, Any]]:
         """Akıllı öneriler generate eder"""
         recommendations = []
@@ -0,0 +1,173 @@
+# analyzers/keyword_matcher.py
+from collections import deque
+from typing import Dict, List, Iterable, Tuple
+
+from utils.profiling import timed
+
+
+class KeywordMatcher:
+    """Aho-Corasick otomatı ile metni tek geçişte tarayan çoklu anahtar kelime eşleştirici"""
+
+    def __init__(self, terms: Dict[str, Iterable[str]]):
+        """
+        Args:
+            terms: Kanonik anahtar kelime -> metinde aranacak yazımları (varyasyonlar dahil)
+        """
+        self.terms = list(terms)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[tuple]] = [[]]
+        # En uzun yazım; akış taramasında sınır kontrolü için bu kadar karakter geriye bakılır
+        self.max_length = 0
+
+        for term_id, (term, surfaces) in enumerate(terms.items()):
+            for surface in set(s.lower() for s in surfaces):
+                if surface:
+                    self._add_surface(surface, term_id)
+
+        self._build_failure_links()
+
+    def _add_surface(self, surface: str, term_id: int):
+        """Bir yazımı trie'ye ekler"""
+        state = 0
+        for char in surface:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((term_id, len(surface)))
+        self.max_length = max(self.max_length, len(surface))
+
+    def _build_failure_links(self):
+        """BFS ile failure linklerini ve birleşik çıktı listelerini kurar"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    @timed('keywords.match')
+    def scan(self, text_lower: str, whole_words: bool = False) -> Dict[str, List[int]]:
+        """
+        Küçük harfli metni tek geçişte tarar
+
+        Args:
+            whole_words: True ise yalnızca önü ve arkası harf/rakam olmayan eşleşmeler sayılır
+                ('r' teriminin her kelimede bulunmaması için)
+
+        Returns:
+            dict: Bulunan kanonik anahtar kelime -> eşleşme başlangıç offset'leri (sıralı)
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        hits: Dict[int, List[int]] = {}
+        text_length = len(text_lower)
+
+        state = 0
+        for position, char in enumerate(text_lower):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for term_id, length in output[state]:
+                start = position - length + 1
+                if whole_words and (
+                    (start > 0 and text_lower[start - 1].isalnum())
+                    or (position + 1 < text_length and text_lower[position + 1].isalnum())
+                ):
+                    continue
+                hits.setdefault(term_id, []).append(start)
+
+        return {self.terms[term_id]: sorted(set(offsets)) for term_id, offsets in hits.items()}
+
+    def stream(self, whole_words: bool = False) -> 'MatchStream':
+        """Metni parça parça (ör. sayfa sayfa) taramak için yeni bir akış döndürür (whole_words: scan ile aynı)"""
+        return MatchStream(self, whole_words)
+
+
+class MatchStream:
+    """
+    KeywordMatcher ile parça parça tarama; otomat durumu parçalar arasında korunur
+
+    Parçalar art arda eklenmiş tek bir metin gibi taranır, bu yüzden sayfa sınırına
+    denk gelen eşleşmeler de bulunur. Offset'ler birleşik metne göredir. whole_words ile
+    kelime sınırı kontrolü de parçalar arasında yapılır: önceki parçaların son karakterleri
+    saklanır, parça sonunda biten eşleşmeler sonraki parçanın ilk karakteriyle doğrulanır.
+    """
+
+    def __init__(self, matcher: KeywordMatcher, whole_words: bool = False):
+        self.matcher = matcher
+        self.whole_words = whole_words
+        self._state = 0
+        self._position = 0
+        self._hits: Dict[int, List[int]] = {}
+        # Önceki parçaların son max_length karakteri ve sonraki karakteri bekleyen eşleşmeler
+        self._tail = ''
+        self._pending: List[Tuple[int, int]] = []
+
+    def feed(self, text_lower: str):
+        """Küçük harfli bir parçayı taramaya ekler"""
+        if not text_lower:
+            return
+        goto = self.matcher._goto
+        fail = self.matcher._fail
+        output = self.matcher._output
+        hits = self._hits
+        whole_words = self.whole_words
+        chunk_start = self._position
+        chunk_end = chunk_start + len(text_lower)
+        tail = self._tail
+
+        if self._pending:
+            if not text_lower[0].isalnum():
+                for term_id, start in self._pending:
+                    hits.setdefault(term_id, []).append(start)
+            self._pending = []
+
+        state = self._state
+        for position, char in enumerate(text_lower, start=chunk_start):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for term_id, length in output[state]:
+                start = position - length + 1
+                if whole_words:
+                    before = start - 1 - chunk_start
+                    before_char = text_lower[before] if before >= 0 else tail[before:len(tail) + before + 1]
+                    if before_char.isalnum():
+                        continue
+                    if position + 1 == chunk_end:
+                        self._pending.append((term_id, start))
+                        continue
+                    if text_lower[position + 1 - chunk_start].isalnum():
+                        continue
+                hits.setdefault(term_id, []).append(start)
+
+        self._state = state
+        self._position = chunk_end
+        if whole_words and self.matcher.max_length:
+            self._tail = (tail + text_lower)[-self.matcher.max_length:]
+
+    @property
+    def hits(self) -> Dict[str, List[int]]:
+        """Şimdiye kadar bulunan kanonik anahtar kelime -> başlangıç offset'leri (scan ile aynı biçim)"""
+        terms = self.matcher.terms
+        hits = {term_id: list(offsets) for term_id, offsets in self._hits.items()}
+        # Metnin sonunda biten eşleşmeler (şimdilik) kelime sınırındadır
+        for term_id, start in self._pending:
+            hits.setdefault(term_id, []).append(start)
+        return {terms[term_id]: sorted(set(offsets)) for term_id, offsets in hits.items()}
@@ -0,0 +1,161 @@
+# analyzers/patterns.py
+"""
+Analizörlerin kullandığı derlenmiş regex kayıt defteri.
+
+Desenler modül yüklenirken bir kez derlenir; böylece analiz sırasında Python'un
+sınırlı iç regex önbelleğine (re._cache) bağımlı kalınmaz. Yalnızca "var mı?" sorusu
+sorulan ilişkili desenler tek bir alternation'da birleştirilir ve tek taramada denetlenir.
+"""
+import re
+from typing import Iterable, Pattern
+
+# --- ContentAnalyzer -------------------------------------------------------
+
+# Her desenin eşleşmeleri ayrı kaydedilir (örtüşen eşleşmeler ayrı ifade sayılır),
+# bu yüzden bunlar birleştirilmez
+QUANTIFICATION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\d+%',  # Percentages
+        r'\$\d+[KMB]?',  # Dollar amounts
+        r'\d+[KMB]\+?',  # Large numbers with K/M/B
+        r'\d+x',  # Multipliers
+        r'\d+:\d+',  # Ratios
+        r'\d{1,3}(?:,\d{3})*',  # Comma-separated numbers
+        r'\d+\.\d+[KMB]?',  # Decimal numbers
+        r'\d+\s*(hours?|days?|weeks?|months?|years?)',  # Time periods
+        r'\d+\s*(people|users|customers|clients|teams?)',  # Scale indicators
+    )
+]
+
+# Achievement indicators: cümlede herhangi birinin geçmesi yeterli
+ACHIEVEMENT = re.compile(
+    r'(increased|improved|enhanced|optimized|reduced|decreased|eliminated|minimized|maximized|generated|delivered|achieved|exceeded|streamlined|automated)'
+    r'|(awarded|recognized|promoted|selected|chosen|honored)'
+    r'|(led|managed|directed|supervised|mentored|trained|coached)'
+    r'|(created|developed|built|designed|implemented|established|launched|initiated)'
+)
+
+DIGITS = re.compile(r'\d+')
+
+# Tarih formatı tutarlılığı: kaç farklı formatın kullanıldığı sayılır
+DATE_FORMATS = [
+    re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),  # MM/DD/YYYY
+    re.compile(r'\d{4}-\d{2}-\d{2}'),      # YYYY-MM-DD
+    re.compile(r'\w+ \d{4}'),              # Month YYYY
+    re.compile(r'\d{1,2}/\d{4}'),          # MM/YYYY
+]
+
+# Madde işareti tutarlılığı: kaç farklı işaretin kullanıldığı sayılır
+BULLET_STYLES = [
+    re.compile(f'^\\s*{pattern}', re.MULTILINE)
+    for pattern in (r'•', r'-', r'\*', r'◦', r'▪')
+]
+
+# --- FormatAnalyzer --------------------------------------------------------
+
+BULLET_LINE = re.compile(r'^\s*[•\-\*\u2022]')
+NUMBER_TOKEN = re.compile(r'\d+[%\$KMB]?')
+
+EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# İletişim desenleri sırayla denenir; ilk eşleşen desen sonucu belirler
+PHONE_PATTERNS = [
+    re.compile(r'(\+\d{1,3}[-.\s]?)?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+    re.compile(r'\d{3}-\d{3}-\d{4}'),
+    re.compile(r'\(\d{3}\)\s?\d{3}-\d{4}')
+]
+
+LINKEDIN_PATTERNS = [
+    re.compile(r'linkedin\.com/in/[A-Za-z0-9-]+'),
+    re.compile(r'linkedin\.com/pub/[A-Za-z0-9-]+'),
+    re.compile(r'www\.linkedin\.com/in/[A-Za-z0-9-]+')
+]
+
+LOCATION_PATTERNS = [
+    re.compile(r'\b[A-Z][a-z]+,\s*[A-Z]{2}\b'),
+    re.compile(r'\b[A-Z][a-z]+,\s*[A-Z][a-z]+\b'),
+    re.compile(r'\b[A-Z][a-z]+\s+\d{5}\b')
+]
+
+WEBSITE_PATTERNS = [
+    re.compile(r'https?://[A-Za-z0-9.-]+\.[A-Za-z]{2,}'),
+    re.compile(r'www\.[A-Za-z0-9.-]+\.[A-Za-z]{2,}'),
+    re.compile(r'[A-Za-z0-9.-]+\.com\b'),
+    re.compile(r'github\.com/[A-Za-z0-9-]+'),
+    re.compile(r'portfolio\.[A-Za-z0-9.-]+')
+]
+
+# --- KeywordAnalyzer -------------------------------------------------------
+
+# Sayısal sonuç sayımı: desenler ayrı ayrı sayılır (toplam, örtüşmeleri de içerir)
+IMPACT_NUMBER_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'\d+%', r'\$\d+', r'\d+[KMB]', r'\d+x', r'\d+:\d+', r'\d{1,3}(?:,\d{3})*'
+    )
+]
+
+# --- JobDescriptionAnalyzer ------------------------------------------------
+
+# İlan metninde sözlük dışı teknik terim adayları (orijinal harf büyüklüğünde aranır):
+# CamelCase (PyTorch, BigQuery), kısaltmalar (AWS, GCP) ve sembollü adlar (C++, C#, Node.js)
+TECH_TERM = re.compile(
+    r'\b[A-Za-z][A-Za-z0-9]*(?:\+\+|#|\.(?:js|JS|NET|net|py))(?![A-Za-z0-9])'
+    r'|\b[A-Z][a-z0-9]+(?:[A-Z][a-z0-9]*)+\b'
+    r'|\b[A-Z]{2,6}[0-9]?\b'
+)
+
+# CamelCase adayın parçaları ('DataCorp' -> 'Data', 'Corp'; 'PhD' -> 'Ph', 'D')
+CAMEL_CASE_PART = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+')
+
+# Tamamı büyük harfli başlık satırlarını liste satırlarından ('AWS, GCP') ayıran ayırıcılar
+LIST_SEPARATOR = re.compile(r'[,;/]')
+
+# Bu satırdan itibaren terimler "tercih sebebi" sayılır. İşaretler tam kelime olmalı ('artı'
+# 'artış' içinde, 'bonus' başka kelimenin içinde eşleşmez); Türkçe kökler ek alabilir (tercihen)
+PREFERRED_MARKER = re.compile(
+    r'\b(?:preferred|nice[ -]to[ -]have|bonus|a plus|desirable|artı|tercih\w*|avantaj\w*)\b'
+)
+
+# Bu satırdan itibaren terimler yeniden "zorunlu" sayılır
+REQUIRED_MARKER = re.compile(
+    r'\b(?:required|requirements?|must|qualifications|responsibilities'
+    r'|gereksinim\w*|aranan|zorunlu\w*|nitelik\w*)\b'
+)
+
+
+def section_heading_pattern(keywords: Iterable[str]) -> Pattern:
+    """
+    Bir bölümün tüm anahtar kelimeleri için tek bir başlık deseni derler
+
+    Kelime başına denenen dört biçim (kelime sınırı, satır başı + ':' / '.', satır sonu)
+    tek bir alternation'da birleşir; böylece bölüm kontrolü tek taramadır.
+    """
+    alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+    return re.compile(
+        rf'\b(?:{alternation})\b'
+        rf'|^(?:{alternation})[:.]'
+        rf'|\n(?:{alternation})[:.]'
+        rf'|\b(?:{alternation})\s*\n',
+        re.MULTILINE
+    )
+
+
+def section_start_pattern(keywords: Iterable[str]) -> Pattern:
+    """
+    Bölüm başlangıcı sayılan satırlar: bir bölüm anahtar kelimesiyle başlayan kısa satırlar
+
+    Düzenlenen metni bağımsız taranabilen bölümlere ayırmakta kullanılır. Başlık satırı bir
+    harfle ve birim olmayan bir kelimeyle başladığı için QUANTIFICATION_PATTERNS eşleşmeleri
+    (ör. '5\\n years') bölüm sınırını aşamaz.
+    """
+    alternation = '|'.join(re.escape(keyword) for keyword in keywords)
+    return re.compile(rf'^[^\S\n]*(?:{alternation})\b[^\n]{{0,40}}$', re.MULTILINE | re.IGNORECASE)
+
+
+def literal_alternation(phrases: Iterable[str]) -> Pattern:
+    """Düz metin ifadelerinden 'herhangi biri alt dize olarak geçiyor mu' deseni derler"""
+    # Uzun ifadeler önce denenir; varlık kontrolünde sonuç sıradan bağımsızdır
+    ordered = sorted(set(phrases), key=len, reverse=True)
+    if not ordered:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(re.escape(phrase) for phrase in ordered))
@@ -0,0 +1,304 @@
+# analyzers/pipeline.py
+from typing import Dict, List, Any, NamedTuple, Optional, Callable, Union
+
+from utils.file_processor import FileProcessor, spooled
+from utils.lazy_result import LazyResult
+from utils.memory_budget import MemoryBudget
+from utils.prepared_text import PreparedText
+from utils.profiling import Profiler, METRICS, timed
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.format_analyzer import FormatAnalyzer
+from analyzers.content_analyzer import ContentAnalyzer
+from analyzers.job_description_analyzer import JobDescriptionAnalyzer
+from analyzers.incremental import IncrementalScan
+from analyzers.executor import AnalyzerExecutor, get_executor
+from config import Config
+
+# Arayüzdeki rol adları -> dahili rol anahtarları
+ROLE_MAPPING = {
+    'Veri Bilimci': 'data_scientist',
+    'Veri Analisti': 'data_analyst',
+    'İş Analisti': 'business_analyst'
+}
+
+
+def resolve_role(role: str) -> str:
+    """Arayüz rol adını dahili anahtara çevirir; dahili anahtarlar aynen geçer"""
+    if role in ROLE_MAPPING.values():
+        return role
+    return ROLE_MAPPING.get(role, 'data_scientist')
+
+
+@timed('collect_recommendations')
+def collect_recommendations(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Tüm analizörlerin önerilerini öncelik sırasıyla birleştirir"""
+    all_recommendations = []
+    if results.get('job_match'):
+        all_recommendations.extend(results['job_match'].get('recommendations', []))
+    all_recommendations.extend(results['keyword_analysis'].get('recommendations', []))
+    all_recommendations.extend(results['format_analysis'].get('recommendations', []))
+    all_recommendations.extend(results['content_analysis'].get('recommendations', []))
+
+    priority_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
+    all_recommendations.sort(key=lambda x: priority_order.get(x.get('priority', 'LOW'), 2))
+    return all_recommendations
+
+
+def scoring_version(keyword_analyzer: KeywordAnalyzer) -> str:
+    """Önbellek ve aday indeksinde kullanılan puanlama + kural seti sürümü"""
+    return f"{Config.SCORING_VERSION}:{keyword_analyzer.ruleset_version}"
+
+
+class ScoreSummary(NamedTuple):
+    """Yalnızca skorlar (ScoringPipeline.score); toplu ön elemede tam sonuç sözlüğü yerine"""
+    overall_score: float
+    keyword_score: float
+    format_score: float
+    content_score: float
+    job_match_score: Optional[float] = None
+
+
+# Süreçteki tüm pipeline'ların paylaştığı yükleme bellek bütçesi
+UPLOAD_BUDGET = MemoryBudget(Config.MEMORY_BUDGET_MB * 1024 * 1024)
+
+
+class ScoringPipeline:
+    """Arayüzden bağımsız CV puanlama akışı: metin çıkarma, üç analizör ve genel skor"""
+
+    def __init__(self, memory_budget: Optional[MemoryBudget] = None,
+                 executor: Optional[AnalyzerExecutor] = None):
+        """
+        Args:
+            memory_budget: Yüklemelerin sıraya girdiği bellek bütçesi (varsayılan: UPLOAD_BUDGET)
+            executor: Analizörlerin çalıştırıldığı yürütücü (varsayılan: Config.ANALYZER_EXECUTOR
+                modunda paylaşılan yürütücü)
+        """
+        self.memory_budget = memory_budget or UPLOAD_BUDGET
+        self.executor = executor or get_executor(Config.ANALYZER_EXECUTOR, Config.ANALYZER_WORKERS)
+        self.file_processor = FileProcessor()
+        self.keyword_analyzer = KeywordAnalyzer()
+        self.format_analyzer = FormatAnalyzer()
+        self.content_analyzer = ContentAnalyzer()
+        self.job_description_analyzer = JobDescriptionAnalyzer(
+            self.keyword_analyzer, cache_size=Config.JOB_DESCRIPTION_CACHE_SIZE
+        )
+
+    @property
+    def ruleset_version(self) -> str:
+        """Önbellek anahtarlarında kullanılan puanlama + kural seti sürümü"""
+        return scoring_version(self.keyword_analyzer)
+
+    def posting_hash(self, job_description: Optional[str]) -> str:
+        """Önbellek anahtarları için ilan hash'i; ilan yoksa boş dize"""
+        if not job_description or not job_description.strip():
+            return ''
+        return self.job_description_analyzer.posting_hash(job_description)
+
+    def analyze(self, uploaded_file, role: str, profiler: Optional[Profiler] = None,
+                job_description: Optional[str] = None,
+                on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Dosyayı analiz eder
+
+        Args:
+            uploaded_file: Streamlit UploadedFile veya aynı arayüzü sunan nesne (ör. LocalFile);
+                SpooledUpload değilse bir kez geçici dosyaya yazılıp eşlenir
+            role: Dahili rol anahtarı veya arayüz rol adı
+            profiler: Aşama ölçümlerinin toplanacağı Profiler (ör. Chrome trace için);
+                verilmezse yeni bir tane oluşturulur
+            job_description: İsteğe bağlı iş ilanı metni; verilirse 'job_match' sonucu eklenir
+            on_progress: Her sayfa okunduğunda ara skorlarla çağrılır (IncrementalScan.provisional)
+
+        Returns:
+            dict: Analiz sonuçları ('timings' anahtarında aşama süreleri); dosyada metin yoksa None
+
+        Raises:
+            FileProcessingError: Dosya okunamazsa veya formatı desteklenmiyorsa
+            MemoryBudgetTimeout: Bellek bütçesinde süresi içinde yer açılmazsa
+        """
+        if profiler is None:
+            profiler = Profiler(trace_memory=Config.PROFILE_MEMORY)
+
+        estimated_bytes = uploaded_file.size * Config.UPLOAD_MEMORY_FACTOR
+        with profiler.activate():
+            with profiler.stage('memory_budget.wait'):
+                reservation = self.memory_budget.acquire(estimated_bytes, timeout=Config.MEMORY_BUDGET_TIMEOUT)
+            try:
+                with spooled(uploaded_file) as upload:
+                    results = self._analyze(upload, resolve_role(role), job_description, on_progress)
+            finally:
+                self.memory_budget.release(reservation)
+
+        if results is not None:
+            results['timings'] = profiler.as_dict()
+            METRICS.observe(results['timings'])
+
+        return results
+
+    def score(self, uploaded_file, role: str, job_description: Optional[str] = None) -> Optional[ScoreSummary]:
+        """
+        Dosyayı yalnızca skorlar için analiz eder (yüksek hacimli ön eleme)
+
+        Skorlar analyze() ile aynıdır; öneriler, örnekler, bağlam metinleri ve ayrıntı
+        sözlükleri üretilmez, analizörler çağıran iş parçacığında seri çalışır.
+
+        Returns:
+            ScoreSummary: Genel ve bileşen skorları (ilan verildiyse ilan uyum skoru); dosyada
+                metin yoksa None
+
+        Raises:
+            FileProcessingError: Dosya okunamazsa veya formatı desteklenmiyorsa
+            MemoryBudgetTimeout: Bellek bütçesinde süresi içinde yer açılmazsa
+        """
+        estimated_bytes = uploaded_file.size * Config.UPLOAD_MEMORY_FACTOR
+        reservation = self.memory_budget.acquire(estimated_bytes, timeout=Config.MEMORY_BUDGET_TIMEOUT)
+        try:
+            with spooled(uploaded_file) as upload:
+                return self._score(upload, resolve_role(role), job_description)
+        finally:
+            self.memory_budget.release(reservation)
+
+    def _score(self, uploaded_file, internal_role: str,
+               job_description: Optional[str] = None) -> Optional[ScoreSummary]:
+        scan = IncrementalScan(self.keyword_analyzer, self.format_analyzer, internal_role)
+        parsed_document = self.file_processor.parse_document(uploaded_file, on_page=scan.feed_page)
+        cv_text = parsed_document.text
+
+        if not cv_text:
+            return None
+
+        cv_doc = PreparedText.from_text(cv_text)
+        keyword_score = self.keyword_analyzer.score_keywords(cv_doc, internal_role, scan.keyword_hits)
+        format_score = self.format_analyzer.score_format(uploaded_file, cv_doc, parsed_document, scan.found_sections)
+        content_score = self.content_analyzer.score_content(cv_doc, internal_role)
+
+        job_match_score = None
+        if job_description and job_description.strip():
+            job_match_score = self.job_description_analyzer.analyze(cv_doc, job_description).get('score', 0)
+
+        return ScoreSummary(
+            self.calculate_overall_score(keyword_score, format_score, content_score, score_only=True),
+            keyword_score, format_score, content_score, job_match_score
+        )
+
+    def _analyze(self, uploaded_file, internal_role: str, job_description: Optional[str] = None,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+        """Ölçüm bağlamı içinde çalışan asıl analiz akışı"""
+        # Anahtar kelime ve bölüm taraması sayfalar çözüldükçe yapılır
+        scan = IncrementalScan(self.keyword_analyzer, self.format_analyzer, internal_role, on_progress)
+        parsed_document = self.file_processor.parse_document(uploaded_file, on_page=scan.feed_page)
+        cv_text = parsed_document.text
+
+        if not cv_text:
+            return None
+
+        # Metin tüm analizörler için tek seferde hazırlanır
+        cv_doc = PreparedText.from_text(cv_text)
+
+        if self.executor.mode == 'serial':
+            keyword_analysis = self.keyword_analyzer.analyze_keywords(cv_doc, internal_role, scan.keyword_hits)
+            format_analysis = self.format_analyzer.analyze_format(
+                uploaded_file, cv_doc, parsed_document, scan.found_sections
+            )
+            content_analysis = self.content_analyzer.analyze_content_quality(cv_doc, internal_role)
+
+            # İlan eşleşmesi genel skoru değiştirmez; ayrı bir kapsama skoru olarak raporlanır ve
+            # ilk erişimde hesaplanır
+            job_match = None
+            if job_description and job_description.strip():
+                job_match = lambda: self.job_description_analyzer.analyze(cv_doc, job_description)
+        else:
+            keyword_analysis, format_analysis, content_analysis, job_match = self._run_parallel(
+                uploaded_file, cv_doc, parsed_document, scan, internal_role, job_description
+            )
+
+        return self.build_results(cv_text, keyword_analysis, format_analysis, content_analysis, job_match)
+
+    def build_results(self, cv_text: str, keyword_analysis: Dict[str, Any], format_analysis: Dict[str, Any],
+                      content_analysis: Dict[str, Any],
+                      job_match: Optional[Union[Dict[str, Any], Callable[[], Dict[str, Any]]]] = None) -> Dict[str, Any]:
+        """
+        Analizör sonuçlarından genel skoru ve sonuç sözlüğünü oluşturur
+
+        Genel skor hemen hesaplanır; öncelik sıralı öneri listesi (ve hesaplayıcı olarak
+        verilmişse ilan uyumu) ilk erişimde hesaplanır.
+
+        Args:
+            job_match: İlan uyumu sonucu veya onu döndüren argümansız hesaplayıcı
+        """
+        overall_score = self.calculate_overall_score(keyword_analysis, format_analysis, content_analysis)
+
+        lazy = {'recommendations': lambda: collect_recommendations(results)}
+        if callable(job_match):
+            lazy['job_match'] = job_match
+
+        results = LazyResult({
+            'overall_score': overall_score,
+            'keyword_analysis': keyword_analysis,
+            'format_analysis': format_analysis,
+            'content_analysis': content_analysis,
+            'cv_text': cv_text[:500] + "..." if len(cv_text) > 500 else cv_text
+        }, lazy=lazy)
+        if job_match is not None and not callable(job_match):
+            results['job_match'] = job_match
+
+        return results
+
+    @timed('analyze_parallel')
+    def _run_parallel(self, uploaded_file, cv_doc: PreparedText, parsed_document, scan: IncrementalScan,
+                      internal_role: str, job_description: Optional[str]):
+        """
+        Analizörleri ve format alt kontrollerini yürütücüde eşzamanlı çalıştırır
+
+        Sonuçlar görev sırasıyla birleştirilir; seri akışla aynı sonuçları üretir.
+        """
+        analyzers = {
+            'keyword': self.executor.submit_analyzer(
+                'keyword', self.keyword_analyzer, 'analyze_keywords', cv_doc, internal_role, scan.keyword_hits
+            ),
+            'content': self.executor.submit_analyzer(
+                'content', self.content_analyzer, 'analyze_content_quality', cv_doc, internal_role
+            )
+        }
+        if job_description and job_description.strip():
+            analyzers['job_match'] = self.executor.submit(
+                self.job_description_analyzer.analyze, cv_doc, job_description
+            )
+
+        format_checks = {
+            name: self.executor.submit(check)
+            for name, check in self.format_analyzer.format_checks(
+                uploaded_file, cv_doc, parsed_document, scan.found_sections
+            ).items()
+        }
+
+        try:
+            format_analysis = self.format_analyzer.combine_checks(self.executor.gather(format_checks))
+        except Exception as e:
+            format_analysis = self.format_analyzer.error_result(e)
+
+        results = self.executor.gather(analyzers)
+        return results['keyword'], format_analysis, results['content'], results.get('job_match')
+
+    def calculate_overall_score(self, keyword_analysis, format_analysis, content_analysis, score_only: bool = False):
+        """
+        Genel puanı hesapla
+
+        Args:
+            score_only: True ise argümanlar analiz sözlükleri değil, doğrudan bileşen skorlarıdır
+                (score_keywords, score_format, score_content)
+        """
+        if score_only:
+            keyword_score, format_score, content_score = keyword_analysis, format_analysis, content_analysis
+        else:
+            keyword_score = keyword_analysis.get('total_score', 0)
+            format_score = format_analysis.get('ats_compliance', 0)
+            content_score = content_analysis.get('overall_score', 0)
+
+        overall = (
+            keyword_score * Config.KEYWORD_WEIGHT +
+            format_score * Config.FORMAT_WEIGHT +
+            content_score * Config.CONTENT_WEIGHT
+        )
+
+        return round(overall, 1)
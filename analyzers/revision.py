@@ -0,0 +1,255 @@
+# analyzers/revision.py
+import difflib
+import hashlib
+from collections import OrderedDict
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+from analyzers import patterns
+from analyzers.keyword_matcher import KeywordMatcher
+from analyzers.pipeline import ScoringPipeline, resolve_role
+from utils.prepared_text import PreparedText
+from utils.profiling import Profiler, timed
+from config import Config
+
+# Dosyaya bağlı format kontrolleri: metin düzenlemesi bunları değiştirmez, ilk analizden alınır
+FILE_CHECKS = ('file_format', 'fonts')
+
+# Değişen bölümler arayüzde başlık satırlarının bu kadar karakteriyle gösterilir
+SECTION_TITLE_LENGTH = 40
+
+
+class SectionPartial(NamedTuple):
+    """Bir bölümün komşularından bağımsız ara sonuçları (offset'ler bölüm başına göre)"""
+    lower_length: int
+    keyword_hits: Dict[str, List[int]]
+    found_sections: Dict[str, bool]
+    quantified: List[List[Tuple[int, int, str]]]
+    # '.' ile bölünmüş parçalar: ilk ve son parça komşu bölümlerle birleşerek cümle olur,
+    # aradakiler bölümün içinde kalan tam cümlelerdir
+    has_period: bool
+    head: Tuple[str, str]
+    tail: Tuple[str, str]
+    inner_achievements: List[Tuple[str, str]]
+
+
+class TextRevisionScorer:
+    """
+    Arayüzde düzenlenen CV metnini artımlı olarak yeniden puanlar
+
+    Metin, bölüm başlığı satırlarından (patterns.section_start_pattern) bölümlere ayrılır. Her
+    bölümün anahtar kelime eşleşmeleri, bölüm başlıkları, sayısal ifade eşleşmeleri ve bölüm
+    içindeki achievement cümleleri bölüm metninin hash'iyle önbelleğe alınır; düzenlemeden sonra
+    yalnızca metni değişen bölümler taranır, diğerleri önbellekten birleştirilir. Bölüm sınırını
+    aşan cümleler ve bağlam gerektiren adımlar (sayısal ifade bağlamları, metin geneli format ve
+    içerik ölçümleri) tüm metin üzerinde hesaplanır; sonuç metnin baştan analiziyle aynıdır.
+    Dosya biçimi ve yazı tipi kontrolleri yüklenen dosyaya bağlı olduğundan ilk analizden alınır.
+    """
+
+    def __init__(self, pipeline: ScoringPipeline, role: str, original_text: str,
+                 file_checks: Dict[str, Dict[str, Any]], job_description: Optional[str] = None,
+                 cache_size: int = Config.REVISION_CACHE_SIZE):
+        """
+        Args:
+            original_text: Yüklenen dosyadan çıkarılan tam metin (düzenlemenin başlangıcı)
+            file_checks: İlk analizin format sonucundaki dosya kontrolleri (FILE_CHECKS)
+            cache_size: Önbellekte tutulan en fazla bölüm sonucu
+        """
+        self.pipeline = pipeline
+        self.role = resolve_role(role)
+        self.original_text = original_text
+        self.file_checks = {name: file_checks.get(name, {'score': 50}) for name in FILE_CHECKS}
+        self.job_description = job_description
+        self.cache_size = cache_size
+        self.section_start = patterns.section_start_pattern(
+            keyword
+            for config in pipeline.format_analyzer.required_sections.values()
+            for keyword in config['keywords']
+        )
+
+        self._partials: 'OrderedDict[str, SectionPartial]' = OrderedDict()
+        self._ruleset_version: Optional[str] = None
+        self._text: Optional[str] = None
+        self._section_keys = frozenset(
+            self._section_key(original_text[start:end]) for start, end in self.split_sections(original_text)
+        )
+        self._results: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_results(cls, pipeline: ScoringPipeline, role: str, original_text: str,
+                     results: Dict[str, Any], job_description: Optional[str] = None) -> 'TextRevisionScorer':
+        """Yüklenen dosyanın analiz sonucundan (ScoringPipeline.analyze) düzenleyici oluşturur"""
+        return cls(pipeline, role, original_text, results.get('format_analysis', {}), job_description)
+
+    def rescore(self, text: str, profiler: Optional[Profiler] = None) -> Optional[Dict[str, Any]]:
+        """
+        Düzenlenmiş metni puanlar
+
+        Returns:
+            dict: ScoringPipeline.analyze ile aynı yapıda sonuçlar; 'revision' anahtarında
+                önceki sürüme göre değişen satır ve bölümler. Metin boşsa None
+        """
+        if text == self._text:
+            return self._results
+        if not text.strip():
+            return None
+
+        if profiler is None:
+            profiler = Profiler(trace_memory=Config.PROFILE_MEMORY)
+
+        with profiler.activate():
+            results, revision = self._rescore(text)
+
+        results['timings'] = profiler.as_dict()
+        results['revision'] = revision
+        self._text = text
+        self._results = results
+        return results
+
+    def split_sections(self, text: str) -> List[Tuple[int, int]]:
+        """Metni başlık satırlarından bölümlere ayırır; (başlangıç, bitiş) aralıkları metni tam kaplar"""
+        # Desen satır başında eşleşir; böylece her bölüm (sonuncusu hariç) satır sonuyla biter
+        starts = [0] + [match.start() for match in self.section_start.finditer(text) if match.start() > 0]
+        return list(zip(starts, starts[1:] + [len(text)]))
+
+    @staticmethod
+    def _section_key(section: str) -> str:
+        return hashlib.sha256(section.encode('utf-8')).hexdigest()
+
+    def _rescore(self, text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        pipeline = self.pipeline
+        ruleset = pipeline.keyword_analyzer.ruleset
+        if ruleset.version != self._ruleset_version:
+            # Kural seti değiştiyse anahtar kelime eşleşmeleri geçersizdir
+            self._partials.clear()
+            self._ruleset_version = ruleset.version
+        matcher = ruleset.role_matchers.get(self.role)
+
+        spans = self.split_sections(text)
+        partials = []
+        keys = []
+        changed_sections = []
+        rescanned = 0
+        for start, end in spans:
+            section = text[start:end]
+            key = self._section_key(section)
+            partial = self._partials.get(key)
+            if partial is None:
+                partial = self._scan_section(section, matcher)
+                rescanned += 1
+                self._partials[key] = partial
+                if len(self._partials) > self.cache_size:
+                    self._partials.popitem(last=False)
+            else:
+                self._partials.move_to_end(key)
+            if key not in self._section_keys:
+                changed_sections.append(section.strip().split('\n', 1)[0][:SECTION_TITLE_LENGTH])
+            partials.append(partial)
+            keys.append(key)
+
+        keyword_hits, found_sections, quantified, achievement_sentences = self._merge(spans, partials)
+
+        doc = PreparedText.from_text(text)
+        keyword_analysis = pipeline.keyword_analyzer.analyze_keywords(doc, self.role, keyword_hits)
+        format_analysis = self._analyze_format(doc, found_sections)
+        content_analysis = pipeline.content_analyzer.analyze_content_quality(
+            doc, self.role, quantified, achievement_sentences
+        )
+
+        job_match = None
+        if self.job_description and self.job_description.strip():
+            job_match = lambda: pipeline.job_description_analyzer.analyze(doc, self.job_description)
+
+        results = pipeline.build_results(text, keyword_analysis, format_analysis, content_analysis, job_match)
+        revision = {
+            'changed_lines': self._count_changed_lines(self._text or self.original_text, text),
+            'changed_sections': changed_sections,
+            'rescanned_sections': rescanned,
+            'section_count': len(spans)
+        }
+        self._section_keys = frozenset(keys)
+        return results, revision
+
+    @timed('revision.scan_section')
+    def _scan_section(self, section: str, matcher: Optional[KeywordMatcher]) -> SectionPartial:
+        """Bölüm metnini analizörlerin tam metinde yapacağı taramalarla tarar"""
+        content_analyzer = self.pipeline.content_analyzer
+        lower = section.lower()
+
+        pieces = section.split('.')
+        lower_pieces = lower.split('.')
+        has_period = len(pieces) > 1
+        inner_achievements = []
+        if len(pieces) > 2:
+            inner_achievements = content_analyzer.find_achievement_sentences(pieces[1:-1], lower_pieces[1:-1])
+
+        return SectionPartial(
+            lower_length=len(lower),
+            keyword_hits=matcher.scan(lower, whole_words=True) if matcher is not None else {},
+            found_sections=self.pipeline.format_analyzer.find_sections(lower),
+            quantified=content_analyzer.find_quantified(section),
+            has_period=has_period,
+            head=(pieces[0], lower_pieces[0]),
+            tail=(pieces[-1], lower_pieces[-1]),
+            inner_achievements=inner_achievements
+        )
+
+    @timed('revision.merge_sections')
+    def _merge(self, spans: List[Tuple[int, int]], partials: List[SectionPartial]):
+        """Bölüm sonuçlarını tam metin offset'leriyle birleştirir; sınırı aşan cümleleri tarar"""
+        content_analyzer = self.pipeline.content_analyzer
+        keyword_hits: Dict[str, List[int]] = {}
+        found_sections = {name: False for name in self.pipeline.format_analyzer.required_sections}
+        quantified: List[List[Tuple[int, int, str]]] = [[] for _ in content_analyzer.quantification_patterns]
+        achievement_sentences: List[Tuple[str, str]] = []
+
+        lower_start = 0
+        carry, carry_lower = '', ''
+        for (start, _), partial in zip(spans, partials):
+            # Küçük harfe çevirme uzunluğu değiştirebilir ('İ'); anahtar kelime offset'leri doc.lower'a göredir
+            for keyword, offsets in partial.keyword_hits.items():
+                keyword_hits.setdefault(keyword, []).extend(offset + lower_start for offset in offsets)
+            lower_start += partial.lower_length
+
+            for name, found in partial.found_sections.items():
+                if found:
+                    found_sections[name] = True
+
+            for merged, matches in zip(quantified, partial.quantified):
+                merged.extend((match_start + start, match_end + start, value)
+                              for match_start, match_end, value in matches)
+
+            head, head_lower = partial.head
+            if not partial.has_period:
+                carry += head
+                carry_lower += head_lower
+                continue
+            achievement_sentences.extend(
+                content_analyzer.find_achievement_sentences((carry + head,), (carry_lower + head_lower,))
+            )
+            achievement_sentences.extend(partial.inner_achievements)
+            carry, carry_lower = partial.tail
+
+        achievement_sentences.extend(content_analyzer.find_achievement_sentences((carry,), (carry_lower,)))
+        return keyword_hits, found_sections, quantified, achievement_sentences
+
+    def _analyze_format(self, doc: PreparedText, found_sections: Dict[str, bool]) -> Dict[str, Any]:
+        """Metne bağlı format kontrollerini çalıştırır, dosya kontrollerini ilk analizden alır"""
+        format_analyzer = self.pipeline.format_analyzer
+        try:
+            checks = format_analyzer.format_checks(None, doc, None, found_sections)
+            return format_analyzer.combine_checks({
+                name: self.file_checks[name] if name in self.file_checks else check()
+                for name, check in checks.items()
+            })
+        except Exception as e:
+            return format_analyzer.error_result(e)
+
+    @staticmethod
+    @timed('revision.diff_lines')
+    def _count_changed_lines(previous: str, text: str) -> int:
+        """Önceki sürüme göre eklenen, silinen veya değişen satır sayısı"""
+        matcher = difflib.SequenceMatcher(None, previous.split('\n'), text.split('\n'), autojunk=False)
+        return sum(
+            max(i2 - i1, j2 - j1)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal'
+        )
@@ -0,0 +1,205 @@
+# analyzers/role_schema.py
+import copy
+import json
+import math
+from typing import Dict, List, Any, NamedTuple
+
+# Rol JSON'larının güncel şema sürümü
+SCHEMA_VERSION = 2
+
+CATEGORY_IMPORTANCE = ('high', 'medium', 'low')
+
+# scoring_rules verilmeyen (veya eksik verilen) rollerde kullanılan değerler
+DEFAULT_SCORING_RULES = {
+    'core_weight': 0.7,           # Core yetenekler: kategori skorunun en fazla %70'i
+    'bonus_weight': 0.3,          # Bonus yetenekler: en fazla %30'u
+    'minimum_penalty': 0.5,       # minimum_required karşılanmazsa çarpan
+    'excellence_bonus': 1.1,      # Core oranı excellence_threshold'u geçerse çarpan
+    'excellence_threshold': 0.8
+}
+
+# Eski şemadaki düz 'keywords' listesinin ilk üçte biri (en fazla 3) core sayılır
+LEGACY_MAX_CORE = 3
+
+
+class RoleSchemaError(ValueError):
+    """Rol yapılandırması şemaya uymadığında fırlatılır"""
+    pass
+
+
+class ScoringRules(NamedTuple):
+    """Kategori skorunda kullanılan, puana çevrilmiş rol kuralları"""
+    core_points: float
+    bonus_points: float
+    minimum_penalty: float
+    excellence_bonus: float
+    excellence_threshold: float
+
+
+def compile_scoring_rules(role_config: Dict[str, Any]) -> ScoringRules:
+    """scoring_rules bloğunu (eksik alanlar varsayılanla) kategori skoru kurallarına çevirir"""
+    rules = {**DEFAULT_SCORING_RULES, **role_config.get('scoring_rules', {})}
+    return ScoringRules(
+        # 0.3 * 100 = 30.000000000000004 olmaması için yuvarlanır
+        core_points=round(rules['core_weight'] * 100, 6),
+        bonus_points=round(rules['bonus_weight'] * 100, 6),
+        minimum_penalty=rules['minimum_penalty'],
+        excellence_bonus=rules['excellence_bonus'],
+        excellence_threshold=rules['excellence_threshold']
+    )
+
+
+def is_current(role_config: Dict[str, Any]) -> bool:
+    return role_config.get('schema_version') == SCHEMA_VERSION
+
+
+def migrate_role_config(role_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Eski şemadaki rol yapılandırmasını güncel şemaya yükseltir (girdi değiştirilmez)
+
+    Sürüm 1 (schema_version yok): kategoriler ya core/bonus ayrımlı ya da yalnızca düz
+    'keywords' listesi içerir. Düz listelerin ilk üçte biri (en fazla LEGACY_MAX_CORE) core,
+    kalanı bonus olur; minimum_required 1, önem derecesi kategori ağırlığından türetilir.
+    Eksik scoring_rules alanları DEFAULT_SCORING_RULES ile tamamlanır.
+    """
+    migrated = copy.deepcopy(role_config)
+    version = migrated.get('schema_version', 1)
+    if version > SCHEMA_VERSION:
+        raise RoleSchemaError(f"Desteklenmeyen şema sürümü: {version}")
+
+    for config in migrated.get('critical_skills', {}).values():
+        if not isinstance(config, dict):
+            continue
+        keywords = config.pop('keywords', None)
+        if keywords is not None and 'core_keywords' not in config:
+            core_count = min(LEGACY_MAX_CORE, math.ceil(len(keywords) / 3))
+            config['core_keywords'] = keywords[:core_count]
+            config['bonus_keywords'] = keywords[core_count:]
+        elif keywords:
+            config.setdefault('bonus_keywords', [])
+            config['bonus_keywords'] += [k for k in keywords if k not in config['bonus_keywords']]
+        config.setdefault('core_keywords', [])
+        config.setdefault('bonus_keywords', [])
+        config.setdefault('minimum_required', 1 if config['core_keywords'] else 0)
+        config.setdefault('category_importance', _importance_from_weight(config.get('weight', 0)))
+
+    migrated['scoring_rules'] = {**DEFAULT_SCORING_RULES, **migrated.get('scoring_rules', {})}
+
+    # schema_version en başta dursun
+    return {'schema_version': SCHEMA_VERSION, **{k: v for k, v in migrated.items() if k != 'schema_version'}}
+
+
+def _importance_from_weight(weight: float) -> str:
+    if weight >= 0.2:
+        return 'high'
+    if weight >= 0.15:
+        return 'medium'
+    return 'low'
+
+
+def validate_role_config(filename: str, role_config: Any):
+    """
+    Rol yapılandırmasının güncel şemaya uyduğunu doğrular
+
+    Raises:
+        RoleSchemaError: Sürüm, eksik alan veya hatalı tip varsa
+    """
+    if not isinstance(role_config, dict):
+        raise RoleSchemaError(f"{filename}: kök öğe bir nesne olmalı")
+    if not is_current(role_config):
+        raise RoleSchemaError(
+            f"{filename}: schema_version {role_config.get('schema_version', 1)}, beklenen {SCHEMA_VERSION}"
+        )
+
+    critical_skills = role_config.get('critical_skills')
+    if not isinstance(critical_skills, dict) or not critical_skills:
+        raise RoleSchemaError(f"{filename}: 'critical_skills' boş olmayan bir nesne olmalı")
+
+    for category, config in critical_skills.items():
+        if not isinstance(config, dict):
+            raise RoleSchemaError(f"{filename}: '{category}' kategorisi bir nesne olmalı")
+        if 'keywords' in config:
+            raise RoleSchemaError(f"{filename}: '{category}.keywords' eski şema alanı; core/bonus kullanın")
+        weight = config.get('weight')
+        if not isinstance(weight, (int, float)) or weight <= 0:
+            raise RoleSchemaError(f"{filename}: '{category}.weight' pozitif bir sayı olmalı")
+        for field in ('core_keywords', 'bonus_keywords'):
+            _check_keyword_list(filename, f"{category}.{field}", config.get(field))
+        minimum_required = config.get('minimum_required')
+        if (not isinstance(minimum_required, int)
+                or not 0 <= minimum_required <= len(config['core_keywords'])):
+            raise RoleSchemaError(
+                f"{filename}: '{category}.minimum_required' 0 ile core anahtar kelime sayısı arasında olmalı"
+            )
+        if config.get('category_importance') not in CATEGORY_IMPORTANCE:
+            raise RoleSchemaError(
+                f"{filename}: '{category}.category_importance' {', '.join(CATEGORY_IMPORTANCE)} olmalı"
+            )
+
+    for field in ('experience_keywords', 'impact_metrics'):
+        _check_keyword_list(filename, field, role_config.get(field, []))
+
+    scoring_rules = role_config.get('scoring_rules', {})
+    if not isinstance(scoring_rules, dict):
+        raise RoleSchemaError(f"{filename}: 'scoring_rules' bir nesne olmalı")
+    for field, value in scoring_rules.items():
+        if field not in DEFAULT_SCORING_RULES:
+            raise RoleSchemaError(f"{filename}: bilinmeyen scoring_rules alanı '{field}'")
+        if not isinstance(value, (int, float)) or value < 0:
+            raise RoleSchemaError(f"{filename}: 'scoring_rules.{field}' negatif olmayan bir sayı olmalı")
+
+
+def _check_keyword_list(filename: str, field: str, value: Any):
+    if not isinstance(value, list) or not all(isinstance(keyword, str) for keyword in value):
+        raise RoleSchemaError(f"{filename}: '{field}' bir metin listesi olmalı")
+
+
+# dump_role_config: bu genişliği aşan kelime listeleri JSON_WRAP_WIDTH'lik satırlara bölünür
+JSON_INLINE_WIDTH = 200
+JSON_WRAP_WIDTH = 88
+
+
+def dump_role_config(role_config: Dict[str, Any], newline: str = '\n') -> str:
+    """
+    Rol yapılandırmasını depodaki biçimde yazar: 2 boşluk girinti, kısa kelime listeleri
+    tek satırda, uzunlar köşeli parantez içinde satırlara bölünmüş
+    """
+    return newline.join(_format_value(role_config, 0, 0).split('\n'))
+
+
+def _format_value(value: Any, indent: int, prefix_length: int) -> str:
+    if isinstance(value, dict) and value:
+        inner = ' ' * (indent + 2)
+        items = []
+        for key, item in value.items():
+            prefix = f"{inner}{json.dumps(key, ensure_ascii=False)}: "
+            items.append(prefix + _format_value(item, indent + 2, len(prefix)))
+        return '{\n' + ',\n'.join(items) + '\n' + ' ' * indent + '}'
+
+    inline = json.dumps(value, ensure_ascii=False)
+    if not isinstance(value, list) or prefix_length + len(inline) <= JSON_INLINE_WIDTH:
+        return inline
+
+    inner = ' ' * (indent + 2)
+    lines = []
+    line = ''
+    for item in value:
+        text = json.dumps(item, ensure_ascii=False) + ','
+        if line and len(inner) + len(line) + len(text) + 1 > JSON_WRAP_WIDTH:
+            lines.append(line)
+            line = ''
+        line = f"{line} {text}" if line else text
+    lines.append(line)
+    return '[\n' + '\n'.join(inner + line for line in lines)[:-1] + '\n' + ' ' * indent + ']'
+
+
+def role_keywords(role_config: Dict[str, Any], include_impact: bool = True) -> List[str]:
+    """Rol yapılandırmasındaki tüm anahtar kelimeler (JSON sırasıyla, tekrarlar dahil)"""
+    keywords = []
+    for config in role_config.get('critical_skills', {}).values():
+        keywords.extend(config.get('core_keywords', []))
+        keywords.extend(config.get('bonus_keywords', []))
+    keywords.extend(role_config.get('experience_keywords', []))
+    if include_impact:
+        keywords.extend(role_config.get('impact_metrics', []))
+    return keywords
@@ -0,0 +1,265 @@
+# analyzers/ruleset.py
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+from analyzers.keyword_matcher import KeywordMatcher
+from analyzers.role_schema import (
+    RoleSchemaError, ScoringRules, compile_scoring_rules, is_current, migrate_role_config, role_keywords,
+    validate_role_config
+)
+from config import Config
+
+# Çalışma dizininden bağımsız mutlak veri yolu
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "keywords"
+
+ROLE_FILES = {
+    'data_scientist': 'data_scientist.json',
+    'data_analyst': 'data_analyst.json',
+    'business_analyst': 'business_analyst.json'
+}
+
+# Yaygın varyasyonlar (küçük harf anahtar kelime -> ek yazımlar)
+VARIATION_MAP = {
+    'power bi': ['powerbi', 'power-bi', 'microsoft power bi'],
+    'tableau': ['tableau desktop', 'tableau server'],
+    'excel': ['microsoft excel', 'ms excel', 'excel vba'],
+    'sql': ['mysql', 'postgresql', 'sql server', 't-sql'],
+    'python': ['python3', 'python 3'],
+    'r': ['r programming', 'r language', 'r-programming'],
+    'data cleaning': ['data cleansing', 'data preprocessing'],
+    'data visualization': ['data viz', 'dataviz'],
+    'business intelligence': ['bi', 'business-intelligence'],
+    'etl': ['extract transform load', 'extract-transform-load'],
+    'kpi': ['key performance indicator', 'key performance indicators'],
+    'dashboard': ['dashboards', 'interactive dashboard']
+}
+
+
+class RulesetError(ValueError):
+    """Rol JSON dosyası okunamadığında veya beklenen yapıda olmadığında fırlatılır"""
+    pass
+
+
+def plural_surface(surface: str) -> Optional[str]:
+    """
+    Yazımın çoğulu (son kelime): 'kpi' -> 'kpis', 'data pipeline' -> 'data pipelines',
+    'company' -> 'companies', 'process' -> 'processes'
+
+    TokenIndex.normalize_token'ın tersidir; tam kelime eşleşmesinde çoğul geçişler de bulunur.
+    Harfle bitmeyen ('c++'), zaten 's' ile biten ve normalize_token gibi çoğulu 3 harfi
+    geçmeyen ('r' -> 'rs', 'bi' -> 'bis') yazımlar için None.
+    """
+    last_word = re.split(r'[ _-]', surface)[-1]
+    if not last_word.isalpha() or len(last_word) < 3:
+        return None
+    if surface.endswith(('ss', 'x', 'z', 'ch', 'sh')):
+        return surface + 'es'
+    if surface.endswith('s'):
+        return None
+    if surface.endswith('y') and surface[-2] not in 'aeiou':
+        return surface[:-1] + 'ies'
+    return surface + 's'
+
+
+def keyword_variations(keyword: str) -> List[str]:
+    """Küçük harf anahtar kelimenin metinde aranacak yazımlarını (çoğullar dahil) döndürür"""
+    variations = [keyword]
+
+    if keyword in VARIATION_MAP:
+        variations.extend(VARIATION_MAP[keyword])
+
+    # Dash ve underscore varyasyonları
+    if '-' in keyword:
+        variations.append(keyword.replace('-', ' '))
+        variations.append(keyword.replace('-', '_'))
+
+    if '_' in keyword:
+        variations.append(keyword.replace('_', ' '))
+        variations.append(keyword.replace('_', '-'))
+
+    # Boşluklu ifadelerin tireli ve alt çizgili yazımları ('data-cleaning', 'data_cleaning')
+    if ' ' in keyword:
+        variations.append(keyword.replace(' ', '-'))
+        variations.append(keyword.replace(' ', '_'))
+
+    variations.extend(plural for plural in map(plural_surface, list(variations)) if plural)
+
+    # Sıra korunarak tekrarlar atılır
+    return list(dict.fromkeys(variations))
+
+
+class CompiledRuleset:
+    """
+    Rol JSON'larından bir kez derlenen, değişmez kural seti
+
+    Rol yapılandırmaları (güncel şemada), puana çevrilmiş skor kuralları, rol otomatları ve iş
+    ilanı sözlüğü (tüm rollerin yetenekleri ve varyasyonları) bir arada tutulur. Tüm roller aynı
+    core/bonus skor yapısına derlenir. Nesne oturumlar ve iş parçacıkları arasında paylaşılır;
+    yapılandırmalar yalnızca okunmalıdır. Yeniden yüklemede yerinde değiştirilmez, yenisi derlenir.
+    """
+
+    def __init__(self, role_data: Dict[str, Dict[str, Any]], version: str,
+                 signature: Tuple = ()):
+        """
+        Args:
+            role_data: Rol anahtarı -> güncel şemada doğrulanmış JSON yapılandırması
+            version: Dosya içeriklerinin kısa hash'i (önbellek anahtarlarında kullanılır)
+            signature: Derlendiği dosyaların (ad, mtime, boyut) imzası
+        """
+        self.version = version
+        self.signature = signature
+        self.role_data: Mapping[str, Dict[str, Any]] = MappingProxyType(dict(role_data))
+        self.scoring_rules: Mapping[str, ScoringRules] = MappingProxyType({
+            role: compile_scoring_rules(role_config) for role, role_config in role_data.items()
+        })
+        self.role_matchers: Mapping[str, KeywordMatcher] = MappingProxyType({
+            role: KeywordMatcher({
+                keyword: keyword_variations(keyword.lower()) for keyword in role_keywords(role_config)
+            })
+            for role, role_config in role_data.items()
+        })
+
+        # Tüm rollerin yetenek sözlüğü (iş ilanı analizi): küçük harf -> JSON'daki yazım
+        vocabulary: Dict[str, str] = {}
+        for role_config in role_data.values():
+            for keyword in role_keywords(role_config, include_impact=False):
+                vocabulary.setdefault(keyword.lower(), keyword)
+        self.vocabulary: Mapping[str, str] = MappingProxyType(vocabulary)
+        self.vocabulary_surfaces: Mapping[str, List[str]] = MappingProxyType({
+            keyword: keyword_variations(lower) for lower, keyword in vocabulary.items()
+        })
+        self.vocabulary_matcher = KeywordMatcher(self.vocabulary_surfaces)
+        self.known_surfaces = frozenset(
+            surface for surfaces in self.vocabulary_surfaces.values() for surface in surfaces
+        )
+
+
+def file_signature(data_path: Path) -> Tuple:
+    """Rol dosyalarının (ad, mtime_ns, boyut) imzası; eksik dosyalar None ile temsil edilir"""
+    signature = []
+    for filename in ROLE_FILES.values():
+        try:
+            stat = os.stat(data_path / filename)
+            signature.append((filename, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((filename, None, None))
+    return tuple(signature)
+
+
+def load_ruleset(data_path: Path = DATA_PATH, strict: bool = False) -> CompiledRuleset:
+    """
+    Rol JSON'larını okur, doğrular ve derler
+
+    Eski şemadaki dosyalar bellekte yükseltilir (kalıcı yükseltme: migrate_roles.py).
+
+    Args:
+        strict: True ise eksik veya hatalı dosyada RulesetError fırlatılır; False ise
+            uyarı yazılıp o rol atlanır
+
+    Raises:
+        RulesetError: strict modda bir dosya yüklenemezse
+    """
+    signature = file_signature(data_path)
+    role_data = {}
+
+    # Kural seti sürümü: dosya içeriklerinin hash'i (önbellek anahtarlarında kullanılır)
+    version_hash = hashlib.sha256()
+
+    for role, filename in ROLE_FILES.items():
+        file_path = data_path / filename
+        try:
+            if not file_path.exists():
+                raise RulesetError(f"{filename} dosyası bulunamadı")
+            raw = file_path.read_bytes()
+            role_config = json.loads(raw.decode('utf-8'))
+            if isinstance(role_config, dict) and not is_current(role_config):
+                print(f"Uyarı: {filename} eski şemada, bellekte yükseltildi (python migrate_roles.py)")
+                role_config = migrate_role_config(role_config)
+            validate_role_config(filename, role_config)
+        except (OSError, ValueError) as e:
+            if strict:
+                # Şema hataları dosya adını zaten içerir
+                message = str(e) if isinstance(e, (RulesetError, RoleSchemaError)) else f"{filename}: {e}"
+                raise RulesetError(message) from e
+            print(f"Hata: {filename} yüklenirken hata: {e}")
+            continue
+
+        version_hash.update(filename.encode('utf-8') + b'\0' + raw)
+        role_data[role] = role_config
+
+    return CompiledRuleset(role_data, version_hash.hexdigest()[:16], signature)
+
+
+class RulesetRegistry:
+    """
+    Süreç genelinde paylaşılan kural seti
+
+    İlk erişimde derlenir. Sonraki erişimlerde en fazla check_interval saniyede bir dosya
+    imzası (mtime, boyut) kontrol edilir; değiştiyse yeni kural seti arka planda değil, o
+    çağrıda derlenir ve tek atamayla değiştirilir. Eski nesneyi kullanan analizler onunla
+    tamamlanır. Yeni dosyalar geçersizse mevcut kural seti korunur.
+    """
+
+    def __init__(self, data_path: Path = DATA_PATH, check_interval: float = 2.0):
+        """
+        Args:
+            check_interval: Dosya değişikliği kontrolleri arasındaki en kısa süre (saniye);
+                0 veya negatifse yeniden yükleme yapılmaz
+        """
+        self.data_path = Path(data_path)
+        self.check_interval = check_interval
+        self._current: Optional[CompiledRuleset] = None
+        self._failed_signature: Optional[Tuple] = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> CompiledRuleset:
+        """Güncel kural setini döndürür"""
+        ruleset = self._current
+        if ruleset is None:
+            with self._lock:
+                if self._current is None:
+                    self._current = load_ruleset(self.data_path)
+                    self._next_check = time.monotonic() + self.check_interval
+                return self._current
+
+        if self.check_interval > 0 and time.monotonic() >= self._next_check:
+            return self._reload_if_changed()
+        return ruleset
+
+    def _reload_if_changed(self) -> CompiledRuleset:
+        with self._lock:
+            ruleset = self._current
+            if time.monotonic() < self._next_check:
+                return ruleset
+            self._next_check = time.monotonic() + self.check_interval
+
+            signature = file_signature(self.data_path)
+            if signature in (ruleset.signature, self._failed_signature):
+                return ruleset
+
+            try:
+                self._current = load_ruleset(self.data_path, strict=True)
+            except RulesetError as e:
+                # Aynı hatalı dosyalar için uyarı tekrarlanmaz
+                self._failed_signature = signature
+                print(f"Uyarı: Kural seti yeniden yüklenemedi, önceki sürüm kullanılıyor: {e}")
+            return self._current
+
+    def reload(self) -> CompiledRuleset:
+        """Dosyaları değişiklik kontrolü yapmadan yeniden derler"""
+        with self._lock:
+            self._current = load_ruleset(self.data_path)
+            self._next_check = time.monotonic() + self.check_interval
+            return self._current
+
+
+# Süreçteki tüm analizörlerin paylaştığı kural seti
+RULESETS = RulesetRegistry(check_interval=Config.RULESET_RELOAD_INTERVAL)
@@ -0,0 +1,399 @@
+# api_service.py - Asenkron CV analiz servisi (ASGI)
+"""
+CV yüklemesini kabul edip iş kimliği döndüren, analizi sınırlı bir süreç havuzunda
+çalıştıran HTTP/JSON servisi. Streamlit arayüzü ATS_SERVICE_URL tanımlandığında bu
+servisin bir istemcisi olarak çalışır (utils/service_client.py).
+
+Uç noktalar:
+    POST /jobs           {"filename", "content" (base64), "role", "job_description"?}
+                         -> 202 {"job_id", "status"}
+    GET  /jobs/<job_id>  İş durumu (queued, running, done, failed) ve bitince sonuç;
+                         ?wait=<saniye> iş bitene kadar (en fazla o kadar) bekler
+    GET  /health         Havuz ve kuyruk durumu
+    GET  /metrics        Aşama süreleri ve iş sayıları (Prometheus metin formatı)
+
+Örnek (depo kökünden):
+    python api_service.py --port 8000 --workers 4
+    uvicorn api_service:app --port 8000
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import parse_qs
+
+from analyzers.compact_result import CompactResult
+from analyzers.pipeline import ROLE_MAPPING, resolve_role
+from analyzers.ruleset import CompiledRuleset, RULESETS
+from utils.file_processor import LocalFile, MIME_TYPES
+from utils.profiling import MetricsRegistry
+from config import Config
+
+# Her worker sürecinde bir kez oluşturulan pipeline
+_pipeline = None
+
+
+def _init_worker():
+    """Worker başlangıcında analizörleri (ve anahtar kelime otomatlarını) bir kez yükler"""
+    global _pipeline
+    from analyzers.pipeline import ScoringPipeline
+    from analyzers.executor import get_executor
+    # Paralellik süreç düzeyinde; worker içinde analizörler seri çalışır
+    _pipeline = ScoringPipeline(executor=get_executor('serial'))
+
+
+def _analyze_job(path: str, filename: str, role: str,
+                 job_description: Optional[str]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Worker'da çalışır: biriktirilmiş yüklemeyi eşler ve pipeline'dan geçirir
+
+    Returns:
+        tuple: (kural seti sürümü, sonuç); ana süreç sonucu aynı kural setiyle sıkıştırabilsin
+    """
+    version = _pipeline.keyword_analyzer.ruleset_version
+    with LocalFile(path) as upload:
+        upload.name = filename
+        return version, _pipeline.analyze(upload, role, job_description=job_description)
+
+
+class HTTPError(Exception):
+    """İstek reddedildiğinde durum kodu ve mesajla fırlatılır"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class AnalysisJob:
+    """
+    Kuyruğa alınmış tek bir analiz işi
+
+    İş bitince sonuç future'dan alınıp CompactResult olarak saklanır ve future bırakılır;
+    job_ttl boyunca bellekte tutulan tamamlanmış işler tam sonuç sözlüğü taşımaz.
+    """
+
+    def __init__(self, job_id: str, filename: str, role: str, path: str):
+        self.job_id = job_id
+        self.filename = filename
+        self.role = role
+        self.path = path
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.future = None
+        self.waiter: Optional[asyncio.Future] = None
+        # Tamamlanınca: CompactResult (sıkıştırılamadıysa sonuç sözlüğü) veya hata mesajı
+        self.result: Any = None
+        self.error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        if self.future is None:
+            return 'failed' if self.error is not None else 'done'
+        if self.future.done():
+            return 'failed' if self.future.cancelled() or self.future.exception() else 'done'
+        return 'running' if self.future.running() else 'queued'
+
+    def to_dict(self) -> Dict[str, Any]:
+        status = self.status
+        data = {
+            'job_id': self.job_id,
+            'status': status,
+            'filename': self.filename,
+            'role': self.role,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at
+        }
+        if status == 'done':
+            # Dosyada metin yoksa sonuç None'dır (arayüzdeki "metin çıkarılamadı" durumu)
+            data['result'] = self.result_dict()
+        elif status == 'failed':
+            data['error'] = self.error if self.future is None else self._future_error()
+        return data
+
+    def result_dict(self) -> Optional[Dict[str, Any]]:
+        if self.future is not None:
+            # Future bitti ama finish() henüz olay döngüsünde çalışmadı
+            return self.future.result()[1]
+        if isinstance(self.result, CompactResult):
+            return self.result.to_dict()
+        return self.result
+
+    def finish(self, ruleset: CompiledRuleset) -> Optional[Dict[str, Any]]:
+        """
+        Biten işin sonucunu veya hatasını saklar ve future'ı bırakır
+
+        Sonuç, worker'ın kullandığı kural seti ana süreçtekiyle aynıysa sıkıştırılır.
+
+        Returns:
+            dict: Sıkıştırılmamış sonuç (metrikler için); iş başarısızsa veya metin yoksa None
+        """
+        result = None
+        if self.future.cancelled() or self.future.exception() is not None:
+            self.error = self._future_error()
+        else:
+            version, result = self.future.result()
+            self.result = result
+            if result is not None and version == ruleset.version:
+                try:
+                    self.result = CompactResult.from_results(result, self.role, ruleset)
+                except KeyError:
+                    pass
+        self.future = None
+        self.waiter = None
+        return result
+
+    def _future_error(self) -> str:
+        return 'İş iptal edildi' if self.future.cancelled() else str(self.future.exception())
+
+
+class AnalysisService:
+    """
+    CV analiz işlerini kabul eden ve sınırlı bir süreç havuzunda çalıştıran ASGI uygulaması
+
+    Yükleme ana süreçte geçici dosyaya yazılır, worker dosyayı kopyalamadan eşler; böylece
+    belge içeriği süreçler arasında taşınmaz. Bekleyen iş sayısı max_pending'i aşarsa yeni
+    işler 503 ile reddedilir, tamamlanan işler job_ttl saniye sonra bellekten atılır.
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None,
+                 job_ttl: Optional[float] = None):
+        self.workers = workers or Config.SERVICE_WORKERS
+        self.max_pending = max_pending or Config.SERVICE_MAX_PENDING
+        self.job_ttl = job_ttl if job_ttl is not None else Config.SERVICE_JOB_TTL
+        self.jobs: Dict[str, AnalysisJob] = {}
+        self.metrics = MetricsRegistry()
+        self.completed = 0
+        self.failed = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._spool_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    # --- Yaşam döngüsü ---
+
+    def start(self):
+        """Süreç havuzunu ve yükleme klasörünü oluşturur"""
+        if self._executor is None:
+            self._spool_dir = tempfile.TemporaryDirectory(prefix='ats_service_')
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    def shutdown(self):
+        """Bekleyen işleri iptal eder, havuzu ve geçici dosyaları kapatır"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._spool_dir is not None:
+            self._spool_dir.cleanup()
+            self._spool_dir = None
+
+    @property
+    def pending(self) -> int:
+        """Henüz bitmemiş iş sayısı"""
+        return sum(1 for job in self.jobs.values() if job.future is not None and not job.future.done())
+
+    # --- ASGI ---
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        content_type = 'application/json'
+        try:
+            status, payload = await self._route(scope, receive)
+            if isinstance(payload, str):
+                content_type = 'text/plain; version=0.0.4'
+        except HTTPError as e:
+            status, payload = e.status, {'error': e.message}
+        except Exception as e:
+            status, payload = 500, {'error': f"Sunucu hatası: {e}"}
+
+        body = payload.encode('utf-8') if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [
+                (b'content-type', f'{content_type}; charset=utf-8'.encode('ascii')),
+                (b'content-length', str(len(body)).encode('ascii'))
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _route(self, scope, receive) -> Tuple[int, Any]:
+        method = scope['method']
+        path = scope['path'].rstrip('/')
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+
+        if path == '/jobs':
+            if method != 'POST':
+                raise HTTPError(405, "Yalnızca POST desteklenir")
+            return 202, await self._submit(await self._read_body(receive))
+
+        if path.startswith('/jobs/'):
+            if method != 'GET':
+                raise HTTPError(405, "Yalnızca GET desteklenir")
+            return 200, await self._get_job(path[len('/jobs/'):], query)
+
+        if path == '/health' and method == 'GET':
+            return 200, {'status': 'ok', 'workers': self.workers, 'pending': self.pending, 'jobs': len(self.jobs)}
+
+        if path == '/metrics' and method == 'GET':
+            return 200, self._render_metrics()
+
+        raise HTTPError(404, "Bulunamadı")
+
+    async def _read_body(self, receive) -> bytes:
+        """İstek gövdesini okur; base64 yüklemenin izin verilen en büyük boyutunu aşarsa reddeder"""
+        limit = Config.MAX_FILE_SIZE * 4 // 3 + 64 * 1024
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > limit:
+                raise HTTPError(413, "Dosya boyutu sınırı aşıldı")
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    # --- İşler ---
+
+    async def _submit(self, body: bytes) -> Dict[str, Any]:
+        """Yüklemeyi doğrular, geçici dosyaya yazar ve havuza gönderir"""
+        try:
+            data = json.loads(body)
+            filename = str(data['filename'])
+            content = base64.b64decode(data['content'], validate=True)
+        except (ValueError, KeyError, TypeError, binascii.Error):
+            raise HTTPError(400, "Gövde 'filename' ve base64 'content' alanlarını içeren JSON olmalı")
+
+        suffix = Path(filename).suffix.lower()
+        if suffix not in MIME_TYPES:
+            raise HTTPError(415, f"Desteklenmeyen dosya formatı: {suffix or filename}")
+        if len(content) > Config.MAX_FILE_SIZE:
+            raise HTTPError(413, "Dosya boyutu sınırı aşıldı")
+
+        role = data.get('role')
+        job_description = data.get('job_description') or None
+        if not role:
+            raise HTTPError(400, "'role' gerekli")
+        if role not in ROLE_MAPPING and role not in ROLE_MAPPING.values():
+            raise HTTPError(400, f"Desteklenmeyen rol: {role}")
+        role = resolve_role(role)
+
+        self._purge_expired()
+        if self.pending >= self.max_pending:
+            raise HTTPError(503, "Kuyruk dolu, lütfen biraz sonra tekrar deneyin")
+
+        self.start()
+        job_id = uuid.uuid4().hex
+        path = os.path.join(self._spool_dir.name, f"{job_id}{suffix}")
+        with open(path, 'wb') as f:
+            f.write(content)
+        del content
+
+        job = AnalysisJob(job_id, filename, role, path)
+        job.future = self._executor.submit(_analyze_job, path, filename, role, job_description)
+        job.waiter = asyncio.wrap_future(job.future)
+        job.waiter.add_done_callback(lambda waiter: self._finish(job, waiter))
+        self.jobs[job_id] = job
+
+        return {'job_id': job_id, 'status': job.status}
+
+    def _finish(self, job: AnalysisJob, waiter: asyncio.Future):
+        """Tamamlanan işin geçici dosyasını siler, sonucu saklar ve metrikleri günceller (olay döngüsünde)"""
+        # Hata iş durumunda raporlanır; okunmazsa asyncio her başarısız iş için uyarı yazar
+        if not waiter.cancelled():
+            waiter.exception()
+        job.finished_at = time.time()
+        try:
+            os.remove(job.path)
+        except OSError:
+            pass
+
+        result = job.finish(RULESETS.get())
+        if job.status == 'done':
+            self.completed += 1
+            if result is not None and result.get('timings'):
+                self.metrics.observe(result['timings'])
+        else:
+            self.failed += 1
+
+    async def _get_job(self, job_id: str, query: Dict[str, list]) -> Dict[str, Any]:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise HTTPError(404, f"İş bulunamadı: {job_id}")
+
+        if 'wait' in query and job.waiter is not None and not job.waiter.done():
+            try:
+                wait = min(float(query['wait'][0]), Config.SERVICE_MAX_WAIT)
+            except ValueError:
+                raise HTTPError(400, "'wait' saniye cinsinden sayı olmalı")
+            await asyncio.wait([job.waiter], timeout=max(wait, 0))
+
+        return job.to_dict()
+
+    def _purge_expired(self):
+        """job_ttl süresinden önce tamamlanmış işleri bellekten atar"""
+        cutoff = time.time() - self.job_ttl
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def _render_metrics(self) -> str:
+        lines = [
+            '# TYPE ats_service_jobs_pending gauge',
+            f'ats_service_jobs_pending {self.pending}',
+            '# TYPE ats_service_jobs_total counter',
+            f'ats_service_jobs_total{{status="done"}} {self.completed}',
+            f'ats_service_jobs_total{{status="failed"}} {self.failed}'
+        ]
+        return '\n'.join(lines) + '\n' + self.metrics.render()
+
+
+# uvicorn api_service:app
+app = AnalysisService()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='CV analiz servisini (ASGI) başlatır')
+    parser.add_argument('--host', default=Config.SERVICE_HOST, help='Dinlenecek adres')
+    parser.add_argument('--port', type=int, default=Config.SERVICE_PORT, help='Dinlenecek port')
+    parser.add_argument('--workers', type=int, help='Analiz süreç sayısı (varsayılan: Config.SERVICE_WORKERS)')
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("Hata: servis için uvicorn gerekli (pip install uvicorn)", file=sys.stderr)
+        return 1
+
+    uvicorn.run(AnalysisService(workers=args.workers), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
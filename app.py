@@ -30,17 +30,43 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
-import sqlite3
+import atexit
 import hashlib
 import json
 
 # Local imports
-from utils.file_processor import FileProcessor
-from analyzers.keyword_analyzer import KeywordAnalyzer
-from analyzers.format_analyzer import FormatAnalyzer
-from analyzers.content_analyzer import ContentAnalyzer
+from analyzers.pipeline import ScoringPipeline, resolve_role
+from analyzers.revision import TextRevisionScorer
+from utils.file_processor import FileProcessingError, SpooledUpload
+from utils.memory_budget import MemoryBudgetTimeout
+from utils.result_cache import ResultCache
+from utils.service_client import AnalysisServiceClient, ServiceError
+from utils.database import get_database
+from utils.session_store import SessionStore
 from config import Config
 
+@st.cache_resource
+def get_result_cache():
+    """Oturumlar ve yeniden çalıştırmalar arasında paylaşılan sonuç önbelleği"""
+    db_path = Config.DATABASE_PATH if Config.RESULT_CACHE_PERSIST else None
+    return ResultCache(max_entries=Config.RESULT_CACHE_SIZE, db_path=db_path)
+
+@st.cache_resource
+def get_pipeline():
+    """Oturumlar ve yeniden çalıştırmalar arasında paylaşılan analiz akışı (kural seti değişince kendini günceller)"""
+    return ScoringPipeline()
+
+@st.cache_resource
+def get_session_store():
+    """Oturumlar arasında paylaşılan, kayıtları arka planda toplu yazan oturum deposu"""
+    store = SessionStore(
+        get_database(Config.DATABASE_PATH),
+        batch_size=Config.SESSION_WRITE_BATCH_SIZE,
+        flush_interval=Config.SESSION_FLUSH_INTERVAL
+    )
+    atexit.register(store.close)
+    return store
+
 # Sayfa yapılandırması
 st.set_page_config(
     page_title="ATS CV Puanlayıcı - Veri Profesyonelleri",
@@ -92,33 +118,20 @@ st.markdown("""
 
 class ATSCVScorer:
     def __init__(self):
-        self.file_processor = FileProcessor()
-        self.keyword_analyzer = KeywordAnalyzer()
-        self.format_analyzer = FormatAnalyzer()
-        self.content_analyzer = ContentAnalyzer()
+        self.pipeline = get_pipeline()
+        self.file_processor = self.pipeline.file_processor
+        self.result_cache = get_result_cache()
+        # ATS_SERVICE_URL tanımlıysa analiz ayrı ölçeklenen servise gönderilir
+        self.service = None
+        if Config.SERVICE_URL:
+            self.service = AnalysisServiceClient(Config.SERVICE_URL, timeout=Config.SERVICE_TIMEOUT)
         self.init_database()
     
     def init_database(self):
-        """Veritabanını başlat"""
+        """Veritabanını başlat (tablolar oturum deposu ilk oluşturulurken kurulur)"""
+        self.session_store = None
         try:
-            conn = sqlite3.connect('ats_scorer.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id TEXT UNIQUE,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    role TEXT,
-                    overall_score REAL,
-                    file_name TEXT,
-                    file_size INTEGER,
-                    ip_hash TEXT
-                )
-            ''')
-            
-            conn.commit()
-            conn.close()
+            self.session_store = get_session_store()
         except Exception as e:
             st.error(f"Veritabanı hatası: {e}")
     
@@ -133,30 +146,15 @@ class ATSCVScorer:
     def get_stats(self):
         """Güncel istatistikleri al"""
         try:
-            conn = sqlite3.connect('ats_scorer.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM user_sessions')
-            total_scans = cursor.fetchone()[0]
-            
-            today = datetime.now().date()
-            cursor.execute('SELECT COUNT(*) FROM user_sessions WHERE DATE(timestamp) = ?', (today,))
-            today_scans = cursor.fetchone()[0]
-            
-            conn.close()
-            
-            return {
-                'total_scans': total_scans if total_scans > 0 else 12847,
-                'today_scans': today_scans if today_scans > 0 else 47,
-                'avg_score': 67.3,
-                'success_rate': 78.2
-            }
-        except:
+            # daily_stats'taki hazır toplamlar; kayıt sayısından bağımsız sabit maliyet
+            return self.session_store.stats()
+        except Exception as e:
+            print(f"Uyarı: İstatistikler okunamadı: {e}")
             return {
-                'total_scans': 12847,
-                'today_scans': 47,
-                'avg_score': 67.3,
-                'success_rate': 78.2
+                'total_scans': 0,
+                'today_scans': 0,
+                'avg_score': 0,
+                'success_rate': 0
             }
     
     def run(self):
@@ -221,10 +219,10 @@ class ATSCVScorer:
             st.metric("🎯 Analiz Edilen CV", f"{stats['total_scans']:,}", f"↗ +{stats['today_scans']} bugün")
         
         with col2:
-            st.metric("📈 Ortalama Puan", f"{stats['avg_score']}/100", "↗ +2.3 bu hafta")
+            st.metric("📈 Ortalama Puan", f"{stats['avg_score']}/100")
         
         with col3:
-            st.metric("💼 Başarı Oranı", f"{stats['success_rate']}%", "↗ +5.2% bu ay")
+            st.metric("💼 Başarı Oranı", f"{stats['success_rate']}%")
         
         with col4:
             st.metric("⭐ Kullanıcı Puanı", "4.8/5", "1,247 değerlendirme")
@@ -281,68 +279,176 @@ class ATSCVScorer:
                     st.warning(f"⚠️ {warning}")
             
             with st.spinner("🔍 CV'niz analiz ediliyor... Bu biraz zaman alabilir."):
-                results = self.process_cv(uploaded_file, selected_role, job_description)
+                # Uzun belgelerde sayfalar okunurken ara skor gösterilir
+                progress_placeholder = st.empty()
+                results = self.process_cv(uploaded_file, selected_role, job_description, progress_placeholder)
+                progress_placeholder.empty()
             
             if results:
-                self.display_results(results, selected_role)
+                revised = self.display_text_editor(uploaded_file, selected_role, job_description, results)
+                self.display_results(revised or results, selected_role)
     
-    def process_cv(self, uploaded_file, role, job_description=None):
-        """CV'yi işle ve analiz sonuçlarını döndür"""
+    def process_cv(self, uploaded_file, role, job_description=None, progress_placeholder=None):
+        """CV'yi işle ve analiz sonuçlarını döndür (aynı dosya için önbellekten)"""
         try:
-            cv_text = self.file_processor.extract_text(uploaded_file)
-            
-            if not cv_text:
-                st.error("❌ Dosyadan metin çıkarılamadı.")
-                return None
-            
-            role_mapping = {
-                'Veri Bilimci': 'data_scientist',
-                'Veri Analisti': 'data_analyst', 
-                'İş Analisti': 'business_analyst'
-            }
+            internal_role = resolve_role(role)
             
-            internal_role = role_mapping.get(role, 'data_scientist')
-            
-            keyword_analysis = self.keyword_analyzer.analyze_keywords(cv_text, internal_role)
-            format_analysis = self.format_analyzer.analyze_format(uploaded_file, cv_text)
-            content_analysis = self.content_analyzer.analyze_content_quality(cv_text, internal_role)
+            ruleset_version = self.pipeline.ruleset_version
+            self.result_cache.sync_ruleset(ruleset_version)
+            cache_key = ResultCache.make_key(
+                self.upload_sha256(uploaded_file), internal_role, ruleset_version,
+                self.pipeline.posting_hash(job_description)
+            )
             
-            overall_score = self.calculate_overall_score(keyword_analysis, format_analysis, content_analysis)
+            # Sayfa yeniden çalıştığında yükleme kopyalanmadan önbellekten döner
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.record_session(cache_key, internal_role, cached, uploaded_file)
+                return cached
             
-            all_recommendations = []
-            all_recommendations.extend(keyword_analysis.get('recommendations', []))
-            all_recommendations.extend(format_analysis.get('recommendations', []))
-            all_recommendations.extend(content_analysis.get('recommendations', []))
+            # Yükleme bir kez geçici dosyaya yazılır; ayrıştırıcılar aynı eşlemeyi kullanır
+            with SpooledUpload(uploaded_file) as upload:
+                if self.service is not None:
+                    results = self.service.analyze(upload, internal_role, job_description)
+                else:
+                    on_progress = None
+                    if progress_placeholder is not None:
+                        on_progress = lambda provisional: self.display_provisional_score(progress_placeholder, provisional)
+                    
+                    results = self.pipeline.analyze(
+                        upload, internal_role, job_description=job_description, on_progress=on_progress
+                    )
             
-            priority_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
-            all_recommendations.sort(key=lambda x: priority_order.get(x.get('priority', 'LOW'), 2))
+            if results is None:
+                st.error("❌ Dosyadan metin çıkarılamadı.")
+                return None
             
-            return {
-                'overall_score': overall_score,
-                'keyword_analysis': keyword_analysis,
-                'format_analysis': format_analysis,
-                'content_analysis': content_analysis,
-                'recommendations': all_recommendations,
-                'cv_text': cv_text[:500] + "..." if len(cv_text) > 500 else cv_text
-            }
+            self.result_cache.put(cache_key, results)
+            self.record_session(cache_key, internal_role, results, uploaded_file)
+            return results
             
+        except FileProcessingError as e:
+            st.error(f"❌ {str(e)}")
+            return None
+        except MemoryBudgetTimeout as e:
+            st.warning(f"⏳ {str(e)}")
+            return None
+        except ServiceError as e:
+            st.error(f"❌ {str(e)}")
+            return None
         except Exception as e:
             st.error(f"❌ Analiz hatası: {str(e)}")
             return None
     
-    def calculate_overall_score(self, keyword_analysis, format_analysis, content_analysis):
-        """Genel puanı hesapla"""
-        keyword_score = keyword_analysis.get('total_score', 0)
-        format_score = format_analysis.get('ats_compliance', 0)
-        content_score = content_analysis.get('overall_score', 0)
-        
-        overall = (
-            keyword_score * Config.KEYWORD_WEIGHT +
-            format_score * Config.FORMAT_WEIGHT +
-            content_score * Config.CONTENT_WEIGHT
+    def upload_sha256(self, uploaded_file):
+        """Yüklemenin SHA-256 özeti; aynı yükleme (file_id) için oturumda bir kez hesaplanır"""
+        file_id = getattr(uploaded_file, 'file_id', None)
+        digests = st.session_state.setdefault('upload_digests', {})
+        if file_id is not None and file_id in digests:
+            return digests[file_id]
+        
+        digest = hashlib.sha256()
+        uploaded_file.seek(0)
+        while True:
+            chunk = uploaded_file.read(SpooledUpload.CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+        uploaded_file.seek(0)
+        
+        if file_id is not None:
+            # Oturumda yalnızca son yüklemenin özeti tutulur
+            digests.clear()
+            digests[file_id] = digest.hexdigest()
+        return digest.hexdigest()
+    
+    def record_session(self, cache_key, role, results, uploaded_file):
+        """Analizi oturum istatistiklerine bir kez kaydet (sayfa yeniden çalıştığında tekrar sayılmaz)"""
+        if self.session_store is None:
+            return
+        
+        recorded = st.session_state.setdefault('recorded_analyses', set())
+        if cache_key in recorded:
+            return
+        recorded.add(cache_key)
+        
+        self.session_store.record(
+            self.get_session_id(), role, results['overall_score'],
+            uploaded_file.name, uploaded_file.size,
+            hashlib.md5("anonymous".encode()).hexdigest()  # Anonim takip
         )
+    
+    def display_text_editor(self, uploaded_file, role, job_description, results):
+        """Çıkarılan metni düzenleme modu; düzenlenen metnin sonuçlarını (yoksa None) döndürür"""
+        if not st.checkbox("✏️ CV metnini düzenle ve anında yeniden puanla",
+                           help="Değişiklikler yalnızca etkilenen bölümler yeniden taranarak puanlanır"):
+            return None
         
-        return round(overall, 1)
+        try:
+            scorer = self.get_text_scorer(uploaded_file, role, job_description, results)
+        except FileProcessingError as e:
+            st.error(f"❌ {str(e)}")
+            return None
+        if scorer is None:
+            return None
+        
+        text = st.text_area("CV metni:", value=scorer.original_text, height=400, key=f"cv_text_{id(scorer)}")
+        revised = scorer.rescore(text)
+        if revised is None:
+            st.warning("⚠️ Puanlamak için metin girin.")
+            return None
+        
+        revision = revised['revision']
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.metric(
+                "Düzenlenmiş Metin Puanı", f"{revised['overall_score']:.1f}/100",
+                f"{revised['overall_score'] - results['overall_score']:+.1f}"
+            )
+        with col2:
+            st.caption(
+                f"{revision['changed_lines']} satır değişti · {revision['rescanned_sections']}/"
+                f"{revision['section_count']} bölüm yeniden tarandı"
+            )
+            if revision['changed_sections']:
+                st.caption("Değişen bölümler: " + ", ".join(revision['changed_sections']))
+        return revised
+    
+    def get_text_scorer(self, uploaded_file, role, job_description, results):
+        """Yüklenen dosya, rol ve ilan için oturumdaki düzenleyiciyi döndürür (yoksa metni çıkarıp oluşturur)"""
+        internal_role = resolve_role(role)
+        key = (self.upload_sha256(uploaded_file), internal_role, self.pipeline.posting_hash(job_description))
+        scorers = st.session_state.setdefault('text_scorers', {})
+        if key not in scorers:
+            with SpooledUpload(uploaded_file) as upload:
+                parsed_document = self.file_processor.parse_document(upload)
+            if parsed_document is None or not parsed_document.text:
+                return None
+            # Oturumda yalnızca son dosyanın bölüm önbelleği tutulur
+            scorers.clear()
+            scorers[key] = TextRevisionScorer.from_results(
+                self.pipeline, internal_role, parsed_document.text, results, job_description
+            )
+        return scorers[key]
+    
+    def display_provisional_score(self, placeholder, provisional):
+        """Belge ayrıştırılırken okunan sayfalara göre ara skorları göster"""
+        page_count = max(provisional['page_count'], 1)
+        
+        with placeholder.container():
+            st.progress(
+                min(provisional['pages_read'] / page_count, 1.0),
+                text=f"📄 {provisional['pages_read']}/{page_count} sayfa okundu"
+            )
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Ara Anahtar Kelime Puanı", f"{provisional['keyword_score']:.1f}/100")
+            with col2:
+                st.metric("Ara Bölüm Puanı", f"{provisional['section_score']:.1f}/100")
+    
+    def calculate_overall_score(self, keyword_analysis, format_analysis, content_analysis):
+        """Genel puanı hesapla"""
+        return self.pipeline.calculate_overall_score(keyword_analysis, format_analysis, content_analysis)
     
     def display_results(self, results, role):
         """Kapsamlı sonuçları göster"""
@@ -352,19 +458,26 @@ class ATSCVScorer:
         self.display_overall_score(results['overall_score'])
         self.display_score_breakdown(results)
         
-        tab1, tab2, tab3, tab4 = st.tabs(["🎯 Öneriler", "🔍 Anahtar Kelimeler", "📄 Format", "✍️ İçerik"])
+        tab_names = ["🎯 Öneriler", "🔍 Anahtar Kelimeler", "📄 Format", "✍️ İçerik"]
+        if 'job_match' in results:
+            tab_names.append("📌 İlan Uyumu")
+        tabs = st.tabs(tab_names)
         
-        with tab1:
+        with tabs[0]:
             self.display_recommendations(results['recommendations'])
         
-        with tab2:
+        with tabs[1]:
             self.display_keyword_analysis(results['keyword_analysis'])
         
-        with tab3:
+        with tabs[2]:
             self.display_format_analysis(results['format_analysis'])
         
-        with tab4:
+        with tabs[3]:
             self.display_content_analysis(results['content_analysis'])
+        
+        if 'job_match' in results:
+            with tabs[4]:
+                self.display_job_match(results['job_match'])
     
     def display_overall_score(self, score):
         """Genel puanı görsel gösterge ile göster"""
@@ -552,6 +665,49 @@ class ATSCVScorer:
                     else:
                         st.success("Tüm kritik yetenekler mevcut!")
     
+    def display_job_match(self, job_match):
+        """İş ilanı eşleşme sonuçlarını göster"""
+        st.markdown("### 📌 İş İlanı Uyumu")
+        
+        if 'error' in job_match:
+            st.warning(f"⚠️ {job_match['error']}")
+            return
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric("İlan Kapsama Puanı", f"{job_match['score']:.1f}/100")
+        
+        with col2:
+            st.metric("Zorunlu Yetenek Kapsamı", f"%{job_match['required_coverage'] * 100:.0f}")
+        
+        with col3:
+            st.metric("İlandaki Terim Sayısı", job_match['term_count'])
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**✅ Eşleşen Yetenekler:**")
+            matched = job_match['matched_required'] + job_match['matched_preferred']
+            if matched:
+                for skill in matched:
+                    st.write(f"• {skill}")
+            else:
+                st.write("İlandaki yeteneklerden hiçbiri bulunamadı")
+        
+        with col2:
+            st.markdown("**❌ Eksik Zorunlu Yetenekler:**")
+            if job_match['missing_required']:
+                for skill in job_match['missing_required']:
+                    st.write(f"• {skill}")
+            else:
+                st.success("İlandaki tüm zorunlu yetenekler mevcut!")
+            
+            if job_match['missing_preferred']:
+                st.markdown("**💡 Eksik Tercih Sebebi Yetenekler:**")
+                for skill in job_match['missing_preferred']:
+                    st.write(f"• {skill}")
+    
     def display_format_analysis(self, format_analysis):
         """Format analiz sonuçlarını göster"""
         st.markdown("### 📄 Format ve Yapı Analizi")
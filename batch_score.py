@@ -0,0 +1,239 @@
+# batch_score.py - Streamlit olmadan toplu CV puanlama
+"""
+Bir klasördeki tüm PDF/DOCX CV'leri seçilen role göre puanlar.
+
+Örnek:
+    python batch_score.py cvs/ --role data_analyst --output sonuclar.jsonl --workers 8
+    python batch_score.py cvs/ --role business_analyst --output sonuclar.csv --recursive
+    python batch_score.py cvs/ --role data_analyst --job-description ilan.txt --output sonuclar.csv
+    python batch_score.py cvs/ --role data_analyst --index   # sonra: python rank_candidates.py
+    python batch_score.py cvs/ --role data_analyst --score-only --output skorlar.csv   # hızlı ön eleme
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.file_processor import LocalFile, MIME_TYPES
+from utils.profiling import Profiler, MetricsRegistry
+
+SUMMARY_FIELDS = ['file', 'role', 'overall_score', 'keyword_score', 'format_score', 'content_score',
+                  'job_match_score', 'error']
+
+# Her worker sürecinde bir kez oluşturulan pipeline
+_pipeline = None
+
+
+def _init_worker():
+    """Worker başlangıcında analizörleri (ve anahtar kelime otomatlarını) bir kez yükler"""
+    global _pipeline
+    from analyzers.pipeline import ScoringPipeline
+    from analyzers.executor import get_executor
+    # Paralellik süreç düzeyinde; worker içinde analizörler seri çalışır
+    _pipeline = ScoringPipeline(executor=get_executor('serial'))
+
+
+def _score_file(path: str, role: str, include_details: bool, trace_dir: str = None,
+                job_description: str = None, collect_index: bool = False) -> Dict[str, Any]:
+    """Tek bir dosyayı puanlar; hatalar satırın 'error' alanına yazılır"""
+    row = {field: None for field in SUMMARY_FIELDS}
+    row['file'] = path
+    row['role'] = role
+
+    try:
+        profiler = Profiler()
+        # Dosya kopyalanmadan eşlenir; ayrıştırma ve indeks özeti aynı görünümü kullanır
+        with LocalFile(path) as upload:
+            # İlan terim indeksi worker başına bir kez çıkarılır, sonraki CV'ler önbellekten kullanır
+            results = _pipeline.analyze(upload, role, profiler=profiler, job_description=job_description)
+            if trace_dir:
+                profiler.write_chrome_trace(str(Path(trace_dir) / f"{Path(path).stem}.trace.json"))
+            if results is None:
+                row['error'] = 'Dosyadan metin çıkarılamadı'
+                return row
+
+            row['overall_score'] = results['overall_score']
+            row['keyword_score'] = results['keyword_analysis'].get('total_score', 0)
+            row['format_score'] = results['format_analysis'].get('ats_compliance', 0)
+            row['content_score'] = results['content_analysis'].get('overall_score', 0)
+            if 'job_match' in results:
+                row['job_match_score'] = results['job_match'].get('score', 0)
+            row['timings'] = results['timings']
+
+            if include_details:
+                row['details'] = results
+
+            if collect_index:
+                from utils.candidate_index import CandidateIndex
+                # Ana süreçte indekse yazılır, çıktıya yazılmadan önce satırdan çıkarılır
+                row['_index'] = {
+                    'cv_key': upload.sha256,
+                    'ruleset_version': _pipeline.ruleset_version,
+                    'keywords': CandidateIndex.keywords_from_results(results)
+                }
+    except Exception as e:
+        row['error'] = str(e)
+
+    return row
+
+
+def _score_file_only(path: str, role: str, job_description: str = None) -> Tuple[str, Optional[Tuple], Optional[str]]:
+    """--score-only: yalnızca skorları hesaplar; süreçler arasında sözlük yerine kısa demet taşınır"""
+    try:
+        with LocalFile(path) as upload:
+            summary = _pipeline.score(upload, role, job_description=job_description)
+        if summary is None:
+            return path, None, 'Dosyadan metin çıkarılamadı'
+        return path, summary, None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def _summary_row(path: str, role: str, summary: Optional[Tuple], error: Optional[str]) -> Dict[str, Any]:
+    """_score_file_only sonucunu çıktı satırına çevirir"""
+    row = {field: None for field in SUMMARY_FIELDS}
+    row['file'] = path
+    row['role'] = role
+    if summary is not None:
+        row.update(summary._asdict())
+    row['error'] = error
+    return row
+
+
+def find_cv_files(directory: Path, recursive: bool) -> List[Path]:
+    """Klasördeki desteklenen CV dosyalarını listeler"""
+    pattern = '**/*' if recursive else '*'
+    return sorted(
+        path for path in directory.glob(pattern)
+        if path.is_file() and path.suffix.lower() in MIME_TYPES
+    )
+
+
+class ResultWriter:
+    """Sonuçları tamamlandıkça JSONL veya CSV olarak diske akıtır"""
+
+    def __init__(self, output, output_format: str):
+        self.output = output
+        self.output_format = output_format
+        self._csv_writer = None
+
+        if output_format == 'csv':
+            self._csv_writer = csv.DictWriter(output, fieldnames=SUMMARY_FIELDS, extrasaction='ignore')
+            self._csv_writer.writeheader()
+
+    def write(self, row: Dict[str, Any]):
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(row)
+        else:
+            self.output.write(json.dumps(row, ensure_ascii=False) + '\n')
+        self.output.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Klasördeki CV'leri Streamlit olmadan toplu puanlar")
+    parser.add_argument('directory', type=Path, help='PDF/DOCX CV klasörü')
+    parser.add_argument('--role', required=True,
+                        help='Rol: data_scientist, data_analyst, business_analyst (veya arayüz adı)')
+    parser.add_argument('--output', '-o', default='-', help="Çıktı dosyası (.jsonl veya .csv), varsayılan stdout")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], help='Çıktı formatı (varsayılan: uzantıdan)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Worker süreç sayısı')
+    parser.add_argument('--recursive', action='store_true', help='Alt klasörleri de tara')
+    parser.add_argument('--job-description', type=Path, help='İş ilanı metin dosyası (ilan uyum skoru için)')
+    parser.add_argument('--index', action='store_true',
+                        help='Bulunan anahtar kelimeleri aday sıralama indeksine (ats_scorer.db) yaz')
+    parser.add_argument('--details', action='store_true', help='JSONL satırlarına tam analiz sonucunu ekle')
+    parser.add_argument('--score-only', action='store_true',
+                        help='Yalnızca skorları hesapla (öneri ve ayrıntı üretilmez; hızlı ön eleme)')
+    parser.add_argument('--metrics', help='Aşama sürelerini Prometheus metin formatında bu dosyaya yaz')
+    parser.add_argument('--trace-dir', help='Her CV için Chrome trace dosyalarını bu klasöre yaz')
+    args = parser.parse_args(argv)
+    if args.score_only and (args.details or args.index or args.metrics or args.trace_dir):
+        parser.error("--score-only; --details, --index, --metrics ve --trace-dir ile birlikte kullanılamaz")
+
+    # resolve_role bilinmeyen adları data_scientist'e çevirir; yazım hatası tüm işi yanlış role puanlamasın
+    from analyzers.pipeline import ROLE_MAPPING, resolve_role
+    if args.role not in ROLE_MAPPING and args.role not in ROLE_MAPPING.values():
+        parser.error(f"Bilinmeyen rol: {args.role} (seçenekler: {', '.join(ROLE_MAPPING.values())})")
+    role = resolve_role(args.role)
+
+    from analyzers.ruleset import RULESETS
+    if role not in RULESETS.get().role_data:
+        parser.error(f"{role} rol dosyası yüklenemedi")
+
+    files = find_cv_files(args.directory.resolve(), args.recursive)
+    if not files:
+        print(f"Uyarı: {args.directory} içinde PDF/DOCX dosyası bulunamadı", file=sys.stderr)
+        return 1
+
+    job_description = None
+    if args.job_description:
+        job_description = args.job_description.read_text(encoding='utf-8')
+
+    output_format = args.format or ('csv' if args.output.endswith('.csv') else 'jsonl')
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    metrics_path = Path(args.metrics).resolve() if args.metrics else None
+    trace_dir = None
+    if args.trace_dir:
+        trace_dir = Path(args.trace_dir).resolve()
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        trace_dir = str(trace_dir)
+
+    candidate_index = None
+    if args.index:
+        from config import Config
+        from utils.candidate_index import CandidateIndex
+        candidate_index = CandidateIndex(Config.DATABASE_PATH)
+
+    started = time.perf_counter()
+    failed = 0
+    metrics = MetricsRegistry()
+
+    try:
+        writer = ResultWriter(output, output_format)
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+            if args.score_only:
+                futures = [executor.submit(_score_file_only, str(path), role, job_description) for path in files]
+            else:
+                futures = [
+                    executor.submit(_score_file, str(path), role, args.details and output_format == 'jsonl',
+                                    trace_dir, job_description, candidate_index is not None)
+                    for path in files
+                ]
+            for done, future in enumerate(as_completed(futures), start=1):
+                if args.score_only:
+                    path, summary, error = future.result()
+                    row = _summary_row(path, role, summary, error)
+                else:
+                    row = future.result()
+                if row['error']:
+                    failed += 1
+                if row.get('timings'):
+                    metrics.observe(row['timings'])
+                index_entry = row.pop('_index', None)
+                if candidate_index is not None and index_entry:
+                    candidate_index.add(
+                        index_entry['cv_key'], row['file'], role, index_entry['ruleset_version'],
+                        row['overall_score'], row['keyword_score'], index_entry['keywords']
+                    )
+                writer.write(row)
+                print(f"\r{done}/{len(files)} işlendi", end='', file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if metrics_path:
+        metrics_path.write_text(metrics.render(), encoding='utf-8')
+
+    elapsed = time.perf_counter() - started
+    print(f"\n{len(files)} CV {elapsed:.1f} sn'de puanlandı "
+          f"({len(files) / elapsed:.1f} CV/sn, {failed} hata)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+# benchmarks/corpus.py - Sentetik CV korpusu üretici
+"""
+Kontrollü boyut, anahtar kelime yoğunluğu ve yerleşimde sentetik PDF/DOCX CV'ler üretir.
+
+Örnek:
+    python -m benchmarks.corpus --output bench_corpus --count 50 --pages 1 5 20 --density 0.02 0.1
+"""
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Any
+
+import docx
+import fitz  # PyMuPDF
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "keywords"
+
+FILLER_WORDS = (
+    "team project data report weekly process customer system analysis support business "
+    "stakeholders quality delivery planning operations internal tools platform review "
+    "migration documentation workflow meeting results growth service product strategy"
+).split()
+
+ACTION_VERBS = [
+    'Developed', 'Led', 'Built', 'Designed', 'Implemented', 'Optimized', 'Automated',
+    'Analyzed', 'Delivered', 'Improved', 'Reduced', 'Increased', 'Managed', 'Created'
+]
+
+METRICS = ['by 15%', 'by 40%', 'saving $50K', 'for 2M+ records', 'across 5 teams', 'in 3 months', '3x faster']
+
+SECTIONS = ['Summary', 'Experience', 'Projects', 'Skills', 'Education']
+
+# Sayfa başına yaklaşık kelime sayısı (FormatAnalyzer de 250 kelime/sayfa varsayar)
+WORDS_PER_PAGE = 250
+
+LAYOUTS = ('single_column', 'two_column')
+
+
+def load_vocabulary(role: str) -> List[str]:
+    """Rol JSON'undaki tüm anahtar kelimeleri döndürür"""
+    with open(DATA_PATH / f"{role}.json", 'r', encoding='utf-8') as f:
+        role_config = json.load(f)
+
+    vocabulary = []
+    for config in role_config['critical_skills'].values():
+        vocabulary.extend(config.get('core_keywords', []))
+        vocabulary.extend(config.get('bonus_keywords', []))
+        vocabulary.extend(config.get('keywords', []))
+    vocabulary.extend(role_config.get('experience_keywords', []))
+    return sorted(set(vocabulary))
+
+
+def generate_cv_text(rng: random.Random, pages: int, density: float, vocabulary: List[str]) -> Dict[str, List[str]]:
+    """
+    Bölüm başlığı -> satırlar biçiminde CV içeriği üretir
+
+    Args:
+        pages: Hedef sayfa sayısı (~250 kelime/sayfa)
+        density: Kelimelerin anahtar kelime olma olasılığı (0-1)
+    """
+    target_words = pages * WORDS_PER_PAGE
+    sections = {
+        'header': [
+            'Jane Doe',
+            'jane.doe@example.com | +1 555-123-4567 | linkedin.com/in/janedoe | Austin, TX'
+        ]
+    }
+
+    words_written = 0
+    section_index = 0
+    while words_written < target_words:
+        section = SECTIONS[section_index % len(SECTIONS)]
+        lines = sections.setdefault(section, [])
+
+        words = [rng.choice(ACTION_VERBS)]
+        for _ in range(rng.randint(10, 22)):
+            words.append(rng.choice(vocabulary) if rng.random() < density else rng.choice(FILLER_WORDS))
+        words.append(rng.choice(METRICS))
+
+        lines.append('• ' + ' '.join(words) + '.')
+        words_written += len(words)
+        section_index += 1 if rng.random() < 0.15 else 0
+
+    return sections
+
+
+def wrap_text(text: str, fontname: str, fontsize: float, width: float) -> List[str]:
+    """Metni verilen genişliğe sığacak satırlara böler"""
+    lines = []
+    current = ''
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and fitz.get_text_length(candidate, fontname=fontname, fontsize=fontsize) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+def write_pdf(path: Path, sections: Dict[str, List[str]], layout: str):
+    """CV içeriğini PDF olarak yazar; two_column yerleşimde satırlar iki sütuna bölünür"""
+    doc = fitz.open()
+    page_width, page_height = fitz.paper_size('a4')
+    margin = 50
+    line_height = 13
+    columns = 2 if layout == 'two_column' else 1
+    column_width = (page_width - 2 * margin) / columns
+
+    page = None
+    column = 0
+    y = page_height
+
+    def write_line(text: str, fontname: str, fontsize: float):
+        nonlocal page, column, y
+        if page is None or y + line_height > page_height - margin:
+            if page is not None and column + 1 < columns:
+                column += 1
+            else:
+                page = doc.new_page(width=page_width, height=page_height)
+                column = 0
+            y = margin
+
+        x = margin + column * column_width
+        page.insert_text((x, y + fontsize), text, fontname=fontname, fontsize=fontsize)
+        y += line_height
+
+    for section, lines in sections.items():
+        if section != 'header':
+            write_line(section.upper(), 'hebo', 12)
+        for line in lines:
+            # Standart PDF fontlarında '•' glifi olmadığından '-' kullanılır
+            for wrapped in wrap_text(line.replace('• ', '- '), 'helv', 9.5, column_width - 10):
+                write_line(wrapped, 'helv', 9.5)
+
+    doc.save(str(path))
+    doc.close()
+
+
+def write_docx(path: Path, sections: Dict[str, List[str]], layout: str):
+    """CV içeriğini DOCX olarak yazar; two_column yerleşimde sayfa iki metin sütununa bölünür"""
+    document = docx.Document()
+
+    if layout == 'two_column':
+        section_properties = document.sections[0]._sectPr
+        columns = section_properties.find(qn('w:cols'))
+        if columns is None:
+            columns = OxmlElement('w:cols')
+            section_properties.append(columns)
+        columns.set(qn('w:num'), '2')
+
+    for section, lines in sections.items():
+        if section != 'header':
+            document.add_heading(section, level=2)
+        for line in lines:
+            document.add_paragraph(line)
+
+    document.save(str(path))
+
+
+def generate_corpus(output: Path, count: int, pages: List[int], densities: List[float],
+                    layouts: List[str], formats: List[str], role: str, seed: int) -> List[Dict[str, Any]]:
+    """
+    Korpusu üretir ve manifest.json yazar
+
+    Returns:
+        list: Her dosya için üretim parametreleri
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    vocabulary = load_vocabulary(role)
+    manifest = []
+
+    for index in range(count):
+        spec = {
+            'pages': pages[index % len(pages)],
+            'density': densities[(index // len(pages)) % len(densities)],
+            'layout': layouts[(index // len(formats)) % len(layouts)],
+            'format': formats[index % len(formats)],
+            'role': role
+        }
+        sections = generate_cv_text(rng, spec['pages'], spec['density'], vocabulary)
+        path = output / f"cv_{index:04d}_{spec['pages']}p_{spec['layout']}.{spec['format']}"
+
+        if spec['format'] == 'pdf':
+            write_pdf(path, sections, spec['layout'])
+        else:
+            write_docx(path, sections, spec['layout'])
+
+        spec['file'] = path.name
+        manifest.append(spec)
+
+    with open(output / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump({'seed': seed, 'files': manifest}, f, indent=2)
+
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sentetik CV korpusu üretir')
+    parser.add_argument('--output', type=Path, default=Path('bench_corpus'))
+    parser.add_argument('--count', type=int, default=30)
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 2, 5, 10, 20])
+    parser.add_argument('--density', type=float, nargs='+', default=[0.02, 0.08, 0.2])
+    parser.add_argument('--layouts', nargs='+', choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument('--formats', nargs='+', choices=['pdf', 'docx'], default=['pdf', 'docx'])
+    parser.add_argument('--role', default='data_analyst')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    manifest = generate_corpus(args.output, args.count, args.pages, args.density,
+                               args.layouts, args.formats, args.role, args.seed)
+    print(f"{len(manifest)} CV üretildi: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+# benchmarks/run_benchmarks.py - Puanlama hattı performans ölçümü
+"""
+FileProcessor.extract_text ve her analizörün genel giriş noktasını sentetik korpus
+üzerinde ölçer; CV/sn, p50/p95/p99 gecikme ve tepe belleği JSON olarak kaydeder.
+
+Örnek (depo kökünden):
+    python -m benchmarks.corpus --output bench_corpus
+    python -m benchmarks.run_benchmarks bench_corpus --output bench_results/baseline.json
+    python -m benchmarks.run_benchmarks bench_corpus --compare bench_results/baseline.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Callable
+
+from analyzers.pipeline import ScoringPipeline
+from utils.file_processor import LocalFile
+from utils.prepared_text import PreparedText
+
+STAGES = ['extract_text', 'prepare_text', 'analyze_keywords', 'analyze_format', 'analyze_content_quality', 'pipeline']
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Doğrusal enterpolasyonlu yüzdelik"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(samples: List[float], peaks: List[float]) -> Dict[str, float]:
+    """Saniye cinsinden örneklerden özet istatistik üretir"""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        'runs': len(ordered),
+        'throughput_cv_per_sec': round(len(ordered) / total, 2) if total else 0.0,
+        'mean_ms': round(total / len(ordered) * 1000, 3) if ordered else 0.0,
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 3),
+        'peak_kb': round(max(peaks), 1) if peaks else None
+    }
+
+
+def measure(func: Callable, trace_memory: bool):
+    """Fonksiyonu bir kez çalıştırır; (sonuç, saniye, tepe KB) döndürür"""
+    if trace_memory:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+
+    peak_kb = None
+    if trace_memory:
+        peak_kb = (tracemalloc.get_traced_memory()[1] - start_memory) / 1024
+    return result, elapsed, peak_kb
+
+
+def run_file(pipeline: ScoringPipeline, path: Path, role: str, trace_memory: bool) -> Dict[str, tuple]:
+    """Bir CV'yi aşama aşama ölçer"""
+    upload = LocalFile(path)
+    measurements = {}
+
+    # Dosya okuma (disk I/O) ölçüme dahil edilmez
+    parsed, elapsed, peak = measure(lambda: pipeline.file_processor.parse_document(upload), trace_memory)
+    measurements['extract_text'] = (elapsed, peak)
+
+    doc, elapsed, peak = measure(lambda: PreparedText.from_text(parsed.text), trace_memory)
+    measurements['prepare_text'] = (elapsed, peak)
+
+    _, elapsed, peak = measure(lambda: pipeline.keyword_analyzer.analyze_keywords(doc, role), trace_memory)
+    measurements['analyze_keywords'] = (elapsed, peak)
+
+    _, elapsed, peak = measure(lambda: pipeline.format_analyzer.analyze_format(upload, doc, parsed), trace_memory)
+    measurements['analyze_format'] = (elapsed, peak)
+
+    _, elapsed, peak = measure(lambda: pipeline.content_analyzer.analyze_content_quality(doc, role), trace_memory)
+    measurements['analyze_content_quality'] = (elapsed, peak)
+
+    upload = LocalFile(path)
+    _, elapsed, peak = measure(lambda: pipeline.analyze(upload, role), trace_memory)
+    measurements['pipeline'] = (elapsed, peak)
+
+    return measurements
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except Exception:
+        return 'unknown'
+
+
+def run(corpus: Path, role: str, repeat: int, warmup: int, trace_memory: bool) -> Dict[str, Any]:
+    """Korpustaki her dosyayı ölçer ve özet raporu döndürür"""
+    manifest_path = corpus / 'manifest.json'
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)['files']
+    else:
+        entries = [{'file': p.name, 'pages': None} for p in sorted(corpus.iterdir()) if p.suffix in ('.pdf', '.docx')]
+
+    pipeline = ScoringPipeline()
+    samples = {stage: [] for stage in STAGES}
+    peaks = {stage: [] for stage in STAGES}
+    by_pages: Dict[str, List[float]] = {}
+
+    for entry in entries[:warmup]:
+        run_file(pipeline, corpus / entry['file'], role, False)
+
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        for _ in range(repeat):
+            for entry in entries:
+                measurements = run_file(pipeline, corpus / entry['file'], role, trace_memory)
+                for stage, (elapsed, peak) in measurements.items():
+                    samples[stage].append(elapsed)
+                    if peak is not None:
+                        peaks[stage].append(peak)
+                by_pages.setdefault(str(entry.get('pages')), []).append(measurements['pipeline'][0])
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': git_revision(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'corpus': str(corpus),
+            'files': len(entries),
+            'repeat': repeat,
+            'role': role,
+            'memory_traced': trace_memory
+        },
+        'stages': {stage: summarize(samples[stage], peaks[stage]) for stage in STAGES},
+        'pipeline_by_pages': {pages: summarize(values, []) for pages, values in sorted(by_pages.items())}
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]):
+    """İki raporun p50/p95 değerlerini yan yana yazdırır"""
+    print(f"{'aşama':<26}{'p50 önce':>11}{'p50 sonra':>11}{'değişim':>10}{'p95 önce':>11}{'p95 sonra':>11}")
+    for stage in STAGES:
+        old = baseline['stages'].get(stage)
+        new = current['stages'].get(stage)
+        if not old or not new:
+            continue
+        change = (new['p50_ms'] - old['p50_ms']) / old['p50_ms'] * 100 if old['p50_ms'] else 0.0
+        print(f"{stage:<26}{old['p50_ms']:>11.2f}{new['p50_ms']:>11.2f}{change:>+9.1f}%"
+              f"{old['p95_ms']:>11.2f}{new['p95_ms']:>11.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='CV puanlama hattı benchmark')
+    parser.add_argument('corpus', type=Path, help='benchmarks.corpus ile üretilen klasör')
+    parser.add_argument('--role', default='data_analyst')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--warmup', type=int, default=3, help='Ölçüm öncesi ısınma için dosya sayısı')
+    parser.add_argument('--memory', action='store_true', help='tracemalloc ile tepe belleği ölç (yavaşlatır)')
+    parser.add_argument('--output', type=Path, help='Sonuç JSON dosyası')
+    parser.add_argument('--compare', type=Path, help='Karşılaştırılacak önceki sonuç JSON dosyası')
+    args = parser.parse_args(argv)
+
+    report = run(args.corpus, args.role, args.repeat, args.warmup, args.memory)
+
+    for stage, stats in report['stages'].items():
+        print(f"{stage:<26} {stats['throughput_cv_per_sec']:>9.1f} CV/sn  "
+              f"p50 {stats['p50_ms']:>8.2f} ms  p95 {stats['p95_ms']:>8.2f} ms  p99 {stats['p99_ms']:>8.2f} ms"
+              + (f"  tepe {stats['peak_kb']:.0f} KB" if stats['peak_kb'] is not None else ''))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,9 @@
 # config.py
 import os
 
+# Paket dizini; veritabanı gibi yollar çalışma dizininden bağımsız buna göre çözülür
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 class Config:
     # App settings
     APP_NAME = "ATS CV Scorer - Data Professionals"
@@ -16,4 +19,38 @@ class Config:
     CONTENT_WEIGHT = 0.25
     
     # Database (şimdilik SQLite)
-    DATABASE_URL = "sqlite:///ats_scorer.db"
\ No newline at end of file
+    DATABASE_PATH = os.path.join(BASE_DIR, "ats_scorer.db")
+    DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+    SESSION_WRITE_BATCH_SIZE = 100  # Oturum kayıtları bu kadarlık gruplar halinde yazılır
+    SESSION_FLUSH_INTERVAL = 1.0  # Saniye; grup dolmasa da bu süre sonunda yazılır
+    
+    # Sonuç önbelleği
+    SCORING_VERSION = "6"  # Puanlama mantığı değiştiğinde artırın
+    RESULT_CACHE_SIZE = 64
+    RESULT_CACHE_PERSIST = True
+    JOB_DESCRIPTION_CACHE_SIZE = 128  # İlan hash'ine göre tutulan terim indeksi sayısı
+    RULESET_RELOAD_INTERVAL = 2.0  # Saniye; rol JSON'larındaki değişiklikler bu aralıkla kontrol edilir (0: kapalı)
+    REVISION_CACHE_SIZE = 256  # Metin düzenleme modunda oturum başına önbelleğe alınan bölüm sonucu
+    
+    # Yükleme bellek bütçesi (süreç başına); aşılırsa yüklemeler sıraya girer
+    MEMORY_BUDGET_MB = 512  # 0: sınırsız
+    UPLOAD_MEMORY_FACTOR = 8  # Dosya boyutu başına tahmini tepe bellek (ayrıştırma + metin + analiz)
+    MEMORY_BUDGET_TIMEOUT = 120  # Saniye; süre dolarsa yükleme reddedilir
+    
+    # Analiz servisi (api_service.py); ATS_SERVICE_URL tanımlıysa arayüz analizi servise gönderir
+    SERVICE_URL = os.environ.get('ATS_SERVICE_URL', '')
+    SERVICE_HOST = '127.0.0.1'
+    SERVICE_PORT = 8000
+    SERVICE_WORKERS = os.cpu_count() or 1
+    SERVICE_MAX_PENDING = 64  # Bekleyen iş sınırı; aşılırsa yeni işler 503 ile reddedilir
+    SERVICE_JOB_TTL = 600  # Tamamlanan işlerin sonuçları bu kadar saniye tutulur
+    SERVICE_MAX_WAIT = 30  # GET /jobs/<id>?wait= için en uzun bekleme (saniye)
+    SERVICE_TIMEOUT = 300  # İstemcinin bir işi bekleyeceği en uzun süre (saniye)
+    
+    # Analizörlerin yürütülmesi: 'serial', 'thread' (iş parçacıkları) veya 'process' (anahtar
+    # kelime ve içerik analizi süreç havuzunda, diğer adımlar iş parçacıklarında)
+    ANALYZER_EXECUTOR = os.environ.get('ATS_ANALYZER_EXECUTOR', 'serial')
+    ANALYZER_WORKERS = None  # None: min(8, CPU sayısı)
+    
+    # Profil ölçümü (tracemalloc aşama başına tepe belleği ölçer ama yavaşlatır)
+    PROFILE_MEMORY = False
\ No newline at end of file
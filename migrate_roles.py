@@ -0,0 +1,66 @@
+# migrate_roles.py - Rol anahtar kelime dosyalarını güncel şemaya yükseltme
+"""
+data/keywords/*.json dosyalarını analyzers/role_schema.py'deki güncel şema sürümüne yükseltir
+ve doğrular. Eski şemadaki düz 'keywords' listeleri core/bonus ayrımına çevrilir; güncel
+dosyalara dokunulmaz.
+
+Örnek:
+    python migrate_roles.py               # tüm rol dosyalarını yükselt
+    python migrate_roles.py --check       # yalnızca kontrol et (yükseltme gerekiyorsa çıkış kodu 1)
+    python migrate_roles.py yeni_rol.json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def main(argv=None):
+    from analyzers.role_schema import (
+        RoleSchemaError, SCHEMA_VERSION, dump_role_config, is_current, migrate_role_config, validate_role_config
+    )
+    from analyzers.ruleset import DATA_PATH
+
+    parser = argparse.ArgumentParser(description=f'Rol JSON dosyalarını şema sürümü {SCHEMA_VERSION}\'ye yükseltir')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='Rol dosyaları (varsayılan: data/keywords/*.json)')
+    parser.add_argument('--check', action='store_true',
+                        help='Dosyaları yazma; yükseltme gereken veya geçersiz dosya varsa 1 ile çık')
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted(DATA_PATH.glob('*.json'))
+    failed = False
+
+    for path in files:
+        try:
+            raw = path.read_bytes()
+            role_config = json.loads(raw.decode('utf-8'))
+            if is_current(role_config):
+                validate_role_config(path.name, role_config)
+                print(f"{path.name}: güncel (sürüm {SCHEMA_VERSION})")
+                continue
+
+            migrated = migrate_role_config(role_config)
+            validate_role_config(path.name, migrated)
+        except (OSError, ValueError) as e:
+            message = str(e) if isinstance(e, RoleSchemaError) else f"{path.name}: {e}"
+            print(f"Hata: {message}", file=sys.stderr)
+            failed = True
+            continue
+
+        if args.check:
+            print(f"{path.name}: yükseltme gerekiyor (sürüm {role_config.get('schema_version', 1)})")
+            failed = True
+            continue
+
+        # Dosyanın satır sonu biçimi korunur
+        newline = '\r\n' if b'\r\n' in raw else '\n'
+        path.write_bytes(dump_role_config(migrated, newline).encode('utf-8'))
+        print(f"{path.name}: sürüm {SCHEMA_VERSION}'ye yükseltildi")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# rank_candidates.py - İndekslenmiş CV havuzundan en iyi adayları sıralama
+"""
+batch_score.py --index ile indekslenen CV'leri belgeleri yeniden okumadan sıralar.
+
+Örnek:
+    python rank_candidates.py --role data_analyst --top 20
+    python rank_candidates.py --job-description ilan.txt --top 50 --output adaylar.csv
+"""
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='İndekslenmiş CV havuzundan en iyi K adayı sıralar')
+    parser.add_argument('--role', help='Rol kural setine göre sırala (data_scientist, data_analyst, business_analyst)')
+    parser.add_argument('--job-description', type=Path, help='İş ilanı metin dosyasına göre sırala')
+    parser.add_argument('--top', type=int, default=10, help='Döndürülecek aday sayısı')
+    parser.add_argument('--only-role', action='store_true',
+                        help='İlana göre sıralarken yalnızca --role için analiz edilmiş CV\'leri sırala '
+                             '(rol sıralaması her zaman yalnızca o rolün CV\'lerini kullanır)')
+    parser.add_argument('--db', help='İndeks veritabanı (varsayılan: Config.DATABASE_PATH)')
+    parser.add_argument('--output', '-o', help='Sonuçları CSV olarak yaz (varsayılan: tablo olarak stdout)')
+    args = parser.parse_args(argv)
+
+    if not args.role and not args.job_description:
+        parser.error('--role veya --job-description gerekli')
+
+    job_description = args.job_description.read_text(encoding='utf-8') if args.job_description else None
+    output_path = Path(args.output).resolve() if args.output else None
+    db_path = str(Path(args.db).resolve()) if args.db else None
+
+    from config import Config
+    from analyzers.pipeline import resolve_role, scoring_version
+    from analyzers.keyword_analyzer import KeywordAnalyzer
+    from utils.candidate_index import CandidateIndex
+
+    index = CandidateIndex(db_path or Config.DATABASE_PATH)
+    keyword_analyzer = KeywordAnalyzer()
+    role = resolve_role(args.role) if args.role else None
+    # Yalnızca geçerli kural setiyle indekslenmiş CV'ler; eski posting'ler yeni sözlükle kıyaslanamaz
+    version = scoring_version(keyword_analyzer)
+
+    started = time.perf_counter()
+    if job_description:
+        from analyzers.job_description_analyzer import JobDescriptionAnalyzer
+        posting = JobDescriptionAnalyzer(keyword_analyzer).get_index(job_description)
+        ranked = index.rank_terms(posting.required, posting.preferred, top_k=args.top,
+                                  role=role if args.only_role else None, ruleset_version=version)
+    else:
+        from analyzers.batch_scoring import BatchKeywordScorer
+        ranked = index.rank_role(BatchKeywordScorer(keyword_analyzer, role), top_k=args.top,
+                                 ruleset_version=version)
+    elapsed = time.perf_counter() - started
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['rank', 'label', 'score', 'overall_score', 'role'],
+                                    extrasaction='ignore')
+            writer.writeheader()
+            for rank, candidate in enumerate(ranked, start=1):
+                writer.writerow({'rank': rank, **candidate})
+    else:
+        for rank, candidate in enumerate(ranked, start=1):
+            print(f"{rank:>4}. {candidate['score']:>6.1f}  {candidate['label']}")
+
+    print(f"{index.count()} CV içinden {len(ranked)} aday {elapsed * 1000:.1f} ms'de sıralandı",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
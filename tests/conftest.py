@@ -0,0 +1,6 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+# Testler depo kökünden (python -m pytest) ya da tests/ içinden çalıştırılabilsin
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,139 @@
+# tests/test_api_service.py
+"""Analiz servisi (ASGI): istek doğrulama hataları ve iş gönderme / bekleme akışı"""
+import asyncio
+import base64
+import json
+import os
+from concurrent.futures import Future
+
+import docx
+import pytest
+
+from analyzers.compact_result import CompactResult
+from api_service import AnalysisJob, AnalysisService
+from config import Config
+
+
+def call(app, method, path, body=b'', query_string=b'', chunk_size=None):
+    """Uygulamayı sahte scope/receive/send ile çağırır; (durum, JSON gövde) döndürür"""
+    chunk_size = chunk_size or max(len(body), 1)
+    messages = [
+        {'type': 'http.request', 'body': body[start:start + chunk_size],
+         'more_body': start + chunk_size < len(body)}
+        for start in range(0, max(len(body), 1), chunk_size)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query_string}
+    return app(scope, receive, send), sent
+
+
+async def request(app, method, path, body=b'', query_string=b'', chunk_size=None):
+    coroutine, sent = call(app, method, path, body, query_string, chunk_size)
+    await coroutine
+    assert sent[0]['type'] == 'http.response.start'
+    return sent[0]['status'], json.loads(sent[1]['body'])
+
+
+def job_body(filename='cv.docx', content=b'PK', **fields):
+    payload = {'filename': filename, 'content': base64.b64encode(content).decode('ascii'),
+               'role': 'data_analyst', **fields}
+    return json.dumps(payload).encode('utf-8')
+
+
+def post(app, body, chunk_size=None):
+    return asyncio.run(request(app, 'POST', '/jobs', body, chunk_size=chunk_size))
+
+
+@pytest.fixture
+def service():
+    service = AnalysisService(workers=1, max_pending=1)
+    yield service
+    service.shutdown()
+
+
+@pytest.mark.parametrize('body, message', [
+    (b'not json', "Gövde"),
+    (json.dumps({'filename': 'cv.docx', 'content': '%%%', 'role': 'data_analyst'}).encode(), "Gövde"),
+    (json.dumps({'content': 'UEs=', 'role': 'data_analyst'}).encode(), "Gövde"),
+    (job_body(role=''), "'role' gerekli"),
+    (job_body(role='astronaut'), "Desteklenmeyen rol"),
+])
+def test_bad_request(service, body, message):
+    status, payload = post(service, body)
+    assert status == 400
+    assert message in payload['error']
+    assert service.jobs == {}
+
+
+def test_unsupported_format(service):
+    status, payload = post(service, job_body(filename='cv.txt'))
+    assert status == 415
+    assert '.txt' in payload['error']
+
+
+def test_file_too_large(service, monkeypatch):
+    monkeypatch.setattr(Config, 'MAX_FILE_SIZE', 1024)
+
+    # Çözülmüş içerik sınırı aşıyor
+    status, _ = post(service, job_body(content=b'x' * 2048))
+    assert status == 413
+
+    # Gövde okunurken sınır aşılıyor; parçalar bitmeden reddedilir
+    status, _ = post(service, job_body(content=b'x' * 100 * 1024), chunk_size=16 * 1024)
+    assert status == 413
+    assert service.jobs == {}
+
+
+def test_queue_full(service):
+    pending = AnalysisJob('pending', 'cv.docx', 'data_analyst', '')
+    pending.future = Future()
+    service.jobs['pending'] = pending
+
+    status, payload = post(service, job_body())
+    assert status == 503
+    assert list(service.jobs) == ['pending']
+
+
+def test_unknown_job(service):
+    status, _ = asyncio.run(request(service, 'GET', '/jobs/missing'))
+    assert status == 404
+
+
+def test_submit_and_wait(service, tmp_path):
+    document = docx.Document()
+    for line in ("Data Analyst", "Experience", "Built Tableau dashboards and SQL reports for 40 managers",
+                 "Education", "BSc Statistics", "Skills", "SQL, Python, Excel, Tableau"):
+        document.add_paragraph(line)
+    path = tmp_path / 'cv.docx'
+    document.save(str(path))
+
+    async def round_trip():
+        status, submitted = await request(service, 'POST', '/jobs', job_body(content=path.read_bytes()))
+        assert status == 202
+        assert submitted['status'] in ('queued', 'running')
+
+        status, job = await request(service, 'GET', f"/jobs/{submitted['job_id']}", query_string=b'wait=30')
+        assert status == 200
+        # Olay döngüsündeki tamamlama geri çağrısı (sıkıştırma, geçici dosya) çalışsın
+        await asyncio.sleep(0)
+        _, stored = await request(service, 'GET', f"/jobs/{submitted['job_id']}")
+        _, health = await request(service, 'GET', '/health')
+        return submitted, job, stored, health, os.listdir(service._spool_dir.name)
+
+    submitted, job, stored, health, spooled = asyncio.run(round_trip())
+
+    assert job['status'] == 'done' and job['job_id'] == submitted['job_id']
+    assert job['role'] == 'data_analyst'
+    assert 'SQL' in job['result']['keyword_analysis']['found_keywords']['databases']
+    assert stored['result'] == job['result']
+    # Tamamlanan iş sıkıştırılmış sonuç tutar; geçici yükleme silinir
+    assert isinstance(service.jobs[submitted['job_id']].result, CompactResult)
+    assert service.completed == 1 and health['pending'] == 0
+    assert spooled == []
@@ -0,0 +1,43 @@
+# tests/test_candidate_index.py
+"""Aday indeksi: sıralamaya yalnızca geçerli kural seti sürümü ve puanlayıcının rolü girer"""
+import pytest
+
+from analyzers.batch_scoring import BatchKeywordScorer
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.pipeline import scoring_version
+from utils.candidate_index import CandidateIndex
+
+
+@pytest.fixture(scope='module')
+def scorer():
+    return BatchKeywordScorer(KeywordAnalyzer(), 'data_analyst')
+
+
+@pytest.fixture
+def index(tmp_path):
+    return CandidateIndex(str(tmp_path / 'index.db'))
+
+
+def test_rank_terms_ignores_stale_ruleset(index):
+    index.add('current', 'current.pdf', 'data_analyst', 'new', 50, 50, ['sql'])
+    index.add('stale', 'stale.pdf', 'data_analyst', 'old', 50, 50, ['sql', 'python'])
+
+    ranked = index.rank_terms(['sql', 'python'], ruleset_version='new')
+    assert [candidate['label'] for candidate in ranked] == ['current.pdf']
+    assert ranked[0]['score'] == 50.0
+
+    assert {candidate['label'] for candidate in index.rank_terms(['sql'])} == {'current.pdf', 'stale.pdf'}
+
+
+def test_rank_role_defaults_to_scorer_role(index, scorer):
+    version = scoring_version(KeywordAnalyzer())
+    keywords = scorer.vocabulary[:5]
+    index.add('analyst', 'analyst.pdf', 'data_analyst', version, 50, 50, keywords)
+    index.add('scientist', 'scientist.pdf', 'data_scientist', version, 50, 50, keywords)
+    index.add('stale', 'stale.pdf', 'data_analyst', 'old', 50, 50, keywords)
+
+    ranked = index.rank_role(scorer, ruleset_version=version)
+    assert [candidate['label'] for candidate in ranked] == ['analyst.pdf']
+
+    ranked = index.rank_role(scorer, role='data_scientist', ruleset_version=version)
+    assert [candidate['label'] for candidate in ranked] == ['scientist.pdf']
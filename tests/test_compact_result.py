@@ -0,0 +1,83 @@
+# tests/test_compact_result.py
+"""CompactResult: sıkıştırılmış sonuç to_dict() ile analiz sonucunun aynısına açılır"""
+import json
+
+import docx
+import pytest
+
+from analyzers.compact_result import CompactResult
+from analyzers.executor import get_executor
+from analyzers.pipeline import ScoringPipeline, collect_recommendations
+from analyzers.ruleset import RULESETS
+from utils.file_processor import LocalFile
+
+CV_LINES = [
+    "Ayşe Yılmaz",
+    "Data Analyst | ayse@example.com | +90 555 000 00 00",
+    "Experience",
+    "Data Analyst, Acme (2019 - 2024)",
+    "- Built Tableau and Power BI dashboards for KPIs used by 40 managers",
+    "- Wrote SQL queries in PostgreSQL and automated reports with Python and pandas",
+    "- Reduced reporting time by 35% with an ETL pipeline",
+    "Education",
+    "BSc Statistics, 2018",
+    "Skills",
+    "SQL, Python, Excel, Tableau, Power BI, A/B testing, statistics",
+]
+
+JOB_DESCRIPTION = """
+Requirements
+- SQL and Python
+- Tableau or Looker
+Nice to have
+- dbt, Airflow
+"""
+
+
+@pytest.fixture(scope='module')
+def pipeline():
+    return ScoringPipeline(executor=get_executor('serial'))
+
+
+@pytest.fixture(scope='module')
+def cv_path(tmp_path_factory):
+    document = docx.Document()
+    for line in CV_LINES:
+        document.add_paragraph(line)
+    path = tmp_path_factory.mktemp('cv') / 'cv.docx'
+    document.save(str(path))
+    return path
+
+
+def analyze(pipeline, cv_path, job_description=None):
+    with LocalFile(cv_path) as upload:
+        # Karşılaştırma için tembel değerler hesaplanmış sade dict
+        return pipeline.analyze(upload, 'data_analyst', job_description=job_description).to_dict()
+
+
+@pytest.mark.parametrize('job_description', [None, JOB_DESCRIPTION])
+def test_round_trip(pipeline, cv_path, job_description):
+    results = analyze(pipeline, cv_path, job_description)
+    compact = CompactResult.from_results(results, 'data_analyst', RULESETS.get())
+
+    restored = compact.to_dict()
+    assert restored == results
+    assert list(restored) == list(results)
+    assert json.loads(json.dumps(restored)) == json.loads(json.dumps(results))
+
+    assert compact.overall_score == results['overall_score']
+    assert compact.keyword_score == results['keyword_analysis']['total_score']
+    assert 'SQL' in compact.found_keywords()
+    assert compact.has_keyword('SQL') and not compact.has_keyword('Fortran')
+
+
+def test_error_result_round_trip(pipeline, cv_path):
+    results = analyze(pipeline, cv_path)
+    # Anahtar kelime analizi hata döndürdüğünde sonuç olduğu gibi saklanır
+    results['keyword_analysis'] = {'error': 'Desteklenmeyen rol: xyz', 'total_score': 0}
+    results['recommendations'] = collect_recommendations(results)
+    compact = CompactResult.from_results(results, 'data_analyst', RULESETS.get())
+
+    assert compact.vocabulary is None
+    assert compact.found_keywords() == []
+    assert compact.to_dict() == results
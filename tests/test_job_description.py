@@ -0,0 +1,100 @@
+# tests/test_job_description.py
+"""İş ilanından zorunlu / tercih sebebi terim çıkarımı"""
+import pytest
+
+from analyzers import patterns
+from analyzers.job_description_analyzer import JobDescriptionAnalyzer, is_non_skill
+from analyzers.keyword_analyzer import KeywordAnalyzer
+
+POSTING = """
+Senior Data Engineer
+
+About the role
+You will help the business grow revenue and drive a measurable artış in data quality.
+Our ability to ship reliable pipelines is key to our success.
+
+Responsibilities
+- Build and orchestrate batch pipelines with Airflow and dbt
+- Deploy services on Kubernetes, manage infrastructure with Terraform
+- Write production SQL and Python
+
+Requirements
+- 3+ years with Snowflake or BigQuery
+- Experience with Docker and Git
+
+Nice to have
+- Kafka, Spark MLlib
+- PyTorch
+"""
+
+
+@pytest.fixture(scope='module')
+def index():
+    return JobDescriptionAnalyzer(KeywordAnalyzer()).get_index(POSTING)
+
+
+def test_plain_tool_names_are_extracted_as_required(index):
+    for term in ('Airflow', 'dbt', 'Kubernetes', 'Terraform', 'SQL', 'Python', 'Snowflake', 'BigQuery',
+                 'Docker', 'Git'):
+        assert term in index.required
+
+
+def test_preferred_section(index):
+    for term in ('Kafka', 'Spark MLlib', 'PyTorch'):
+        assert term in index.preferred
+    # 'spark mllib' içindeki 'spark' ayrı terim sayılmaz
+    assert 'Spark' not in index.terms
+
+
+def test_substrings_do_not_switch_sections():
+    # 'artış' ve 'ability' tercih bölümü başlatmaz; ardından gelen terimler zorunlu kalır
+    posting = "Requirements\n- Satışlarda %20 artış sağlamak\n- Ability to use Terraform and Airflow\n- SQL\n"
+    index = JobDescriptionAnalyzer(KeywordAnalyzer()).get_index(posting)
+    assert set(index.required) == {'Terraform', 'Airflow', 'SQL'}
+    assert index.preferred == ()
+
+
+@pytest.mark.parametrize('line, preferred', [
+    ('nice to have: kafka', True),
+    ('tercihen airflow deneyimi', True),
+    ('spark bilgisi artı olarak değerlendirilir', True),
+    ('satışlarda artış sağlamak', False),
+    ('artırmak için çalışmak', False),
+    ('bonusless roles', False),
+    ('competitive bonus', True),
+])
+def test_preferred_marker_is_whole_word(line, preferred):
+    assert bool(patterns.PREFERRED_MARKER.search(line)) == preferred
+
+
+def test_cv_matches_extracted_terms():
+    analyzer = JobDescriptionAnalyzer(KeywordAnalyzer())
+    result = analyzer.analyze("Built Airflow DAGs and dbt models; deployed on Kubernetes.", POSTING)
+    for term in ('Airflow', 'dbt', 'Kubernetes'):
+        assert term in result['matched_required']
+    assert 'Terraform' in result['missing_required']
+
+
+HEADING_POSTING = """
+ABOUT THE ROLE
+DataCorp builds forecasting products for retailers. A PhD or MSc in a quantitative field is welcome.
+WHAT YOU WILL DO
+- Train models in Python with PyTorch and PySpark
+- Ship features on AWS with Terraform and FastAPI
+NICE TO HAVE
+- Kafka and GraphQL
+"""
+
+
+def test_uppercase_headings_and_common_words_are_not_terms():
+    index = JobDescriptionAnalyzer(KeywordAnalyzer()).get_index(HEADING_POSTING)
+    assert set(index.required) == {'Python', 'PyTorch', 'Spark', 'AWS', 'Terraform', 'FastAPI'}
+    assert set(index.preferred) == {'Kafka', 'GraphQL'}
+
+
+@pytest.mark.parametrize('term, expected', [
+    ('ABOUT', True), ('DataCorp', True), ('PhD', True), ('WILL', True),
+    ('GraphQL', False), ('PySpark', False), ('DynamoDB', False),
+])
+def test_is_non_skill(term, expected):
+    assert is_non_skill(term) == expected
@@ -0,0 +1,104 @@
+# tests/test_keyword_boundaries.py
+"""Rol anahtar kelimeleri yalnızca kelime sınırında eşleşir; tüm tarama yolları aynı sonucu verir"""
+import pytest
+
+from analyzers.batch_scoring import BatchKeywordScorer
+from analyzers.format_analyzer import FormatAnalyzer
+from analyzers.incremental import IncrementalScan
+from analyzers.keyword_analyzer import KeywordAnalyzer
+from analyzers.keyword_matcher import KeywordMatcher
+from analyzers.revision import TextRevisionScorer
+from analyzers.ruleset import keyword_variations
+from analyzers.pipeline import ScoringPipeline
+from analyzers.executor import get_executor
+
+# 'ability' içinde 'bi' (business intelligence), 'Excellent' içinde 'excel', 'Microsoft' içinde 'm' ve 'r'
+FALSE_POSITIVE_TEXT = "Strong ability to learn. Excellent communication skills.\nMicrosoft Word, teamwork, reports.\n"
+
+SKILLS_TEXT = (
+    "EXPERIENCE\nBuilt BI dashboards in Power BI and Excel; modelled data in R and M.\n"
+    "Wrote SQL for the data warehouse.\nSKILLS\nPython, R, Tableau, data cleaning\n"
+)
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return KeywordAnalyzer()
+
+
+def found_keywords(analysis):
+    found = set()
+    for result in analysis['category_results'].values():
+        found.update(result['total_found'])
+    found.update(analysis['experience_analysis']['found'])
+    found.update(analysis['impact_analysis']['found_metrics'])
+    return found
+
+
+def test_substrings_inside_words_are_not_keywords(analyzer):
+    analysis = analyzer.analyze_keywords(FALSE_POSITIVE_TEXT, 'data_analyst')
+    found = found_keywords(analysis)
+    for keyword in ('R', 'M', 'Excel', 'business intelligence'):
+        assert keyword not in found
+    assert analyzer.score_keywords(FALSE_POSITIVE_TEXT, 'data_analyst') == analysis['total_score']
+
+
+def test_standalone_keywords_are_found(analyzer):
+    found = found_keywords(analyzer.analyze_keywords(SKILLS_TEXT, 'data_analyst'))
+    for keyword in ('R', 'M', 'Excel', 'business intelligence', 'Power BI', 'SQL', 'data warehouse'):
+        assert keyword in found
+
+
+@pytest.mark.parametrize('text', [FALSE_POSITIVE_TEXT, SKILLS_TEXT])
+def test_stream_matches_scan_at_every_split(analyzer, text):
+    matcher = analyzer.role_matchers['data_analyst']
+    expected = matcher.scan(text.lower(), whole_words=True)
+    lower = text.lower()
+    for split in range(len(lower) + 1):
+        stream = matcher.stream(whole_words=True)
+        stream.feed(lower[:split])
+        stream.feed(lower[split:])
+        assert stream.hits == expected, split
+
+
+def test_incremental_scan_matches_full_scan(analyzer):
+    pages = [SKILLS_TEXT[:40], SKILLS_TEXT[40:90], SKILLS_TEXT[90:], FALSE_POSITIVE_TEXT]
+    scan = IncrementalScan(analyzer, FormatAnalyzer(), 'data_analyst')
+    for number, page in enumerate(pages, start=1):
+        scan.feed_page(page, number, len(pages))
+    text = ''.join(pages)
+    assert scan.keyword_hits == analyzer.role_matchers['data_analyst'].scan(text.lower(), whole_words=True)
+
+
+def test_batch_scorer_matches_analyzer(analyzer):
+    texts = [FALSE_POSITIVE_TEXT, SKILLS_TEXT, FALSE_POSITIVE_TEXT + SKILLS_TEXT]
+    scorer = BatchKeywordScorer(analyzer, 'data_analyst')
+    scores = [row['total_score'] for row in scorer.score(texts)]
+    assert scores == [analyzer.analyze_keywords(text, 'data_analyst')['total_score'] for text in texts]
+
+
+def test_revision_matches_full_analysis(analyzer):
+    pipeline = ScoringPipeline(executor=get_executor('serial'))
+    scorer = TextRevisionScorer(pipeline, 'data_analyst', SKILLS_TEXT, {})
+    edited = SKILLS_TEXT + FALSE_POSITIVE_TEXT
+    revised = scorer.rescore(edited)['keyword_analysis']
+    assert revised['total_score'] == analyzer.analyze_keywords(edited, 'data_analyst')['total_score']
+    assert found_keywords(revised) == found_keywords(analyzer.analyze_keywords(edited, 'data_analyst'))
+
+
+def test_plural_forms_match(analyzer):
+    found = found_keywords(analyzer.analyze_keywords("Built KPIs and dashboards for the sales team.", 'data_analyst'))
+    assert 'KPI' in found
+    assert 'dashboard' in found
+
+    matcher = KeywordMatcher({'API': keyword_variations('api')})
+    assert matcher.scan("designed rest apis and an api gateway", whole_words=True) == {'API': [14, 26]}
+    # Tek harfli kelimelerin çoğulu üretilmez ('ms' 'M' sayılmaz)
+    assert 'M' not in found_keywords(analyzer.analyze_keywords("Used MS Office daily.", 'data_analyst'))
+
+
+def test_hyphen_and_underscore_forms_match(analyzer):
+    for text in ("Models in scikit_learn", "Models in scikit learn", "Models in scikit-learn"):
+        assert 'scikit-learn' in found_keywords(analyzer.analyze_keywords(text, 'data_scientist'))
+    found = found_keywords(analyzer.analyze_keywords("Owned data-cleaning and data_validation jobs", 'data_analyst'))
+    assert {'data cleaning', 'data validation'} <= found
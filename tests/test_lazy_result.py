@@ -0,0 +1,74 @@
+# tests/test_lazy_result.py
+"""LazyResult: tembel değerler bir kez hesaplanır; tüm anahtarları gezen işlemler sade dict görür"""
+import copy
+import json
+import pickle
+
+from utils.lazy_result import LazyResult
+
+
+def make_result(calls):
+    def recommendations():
+        calls.append('recommendations')
+        return [{'title': 'SQL ekleyin'}]
+
+    def job_match():
+        calls.append('job_match')
+        return {'score': 50.0}
+
+    return LazyResult({'overall_score': 70.0}, lazy={'recommendations': recommendations, 'job_match': job_match})
+
+
+def test_computed_once_on_first_access():
+    calls = []
+    result = make_result(calls)
+
+    assert calls == []
+    assert 'job_match' in result and len(result) == 3
+    assert not result.is_computed('job_match')
+    assert calls == []
+
+    assert result['job_match'] == {'score': 50.0}
+    assert result.get('job_match') is result['job_match']
+    assert calls == ['job_match']
+    assert result.is_computed('job_match') and not result.is_computed('recommendations')
+
+    assert result.get('missing', 'default') == 'default'
+
+
+def test_items_and_json_materialize_pending_values():
+    calls = []
+    result = make_result(calls)
+
+    assert list(result.items()) == [
+        ('overall_score', 70.0),
+        ('recommendations', [{'title': 'SQL ekleyin'}]),
+        ('job_match', {'score': 50.0}),
+    ]
+    assert calls == ['recommendations', 'job_match']
+
+    assert json.loads(json.dumps(make_result([]))) == {
+        'overall_score': 70.0, 'recommendations': [{'title': 'SQL ekleyin'}], 'job_match': {'score': 50.0}
+    }
+    assert result == make_result([]) and make_result([]) == result
+    assert calls == ['recommendations', 'job_match']
+
+
+def test_copies_are_plain_dicts():
+    calls = []
+    result = make_result(calls)
+
+    shallow = result.copy()
+    assert type(shallow) is dict
+    assert shallow == {'overall_score': 70.0, 'recommendations': [{'title': 'SQL ekleyin'}], 'job_match': {'score': 50.0}}
+    assert shallow['job_match'] is result['job_match']
+
+    nested = LazyResult({'keyword_analysis': result})
+    plain = nested.to_dict()
+    assert type(plain['keyword_analysis']) is dict
+    assert plain['keyword_analysis']['job_match'] is not result['job_match']
+
+    restored = pickle.loads(pickle.dumps(make_result([])))
+    assert type(restored) is dict and restored == shallow
+    assert copy.deepcopy(result) == shallow
+    assert calls == ['recommendations', 'job_match']
@@ -0,0 +1,92 @@
+# tests/test_session_store.py
+"""Oturum kayıtları: her analiz bir satır; artımlı günlük toplamlar yeniden hesaplamayla aynı"""
+import sqlite3
+from datetime import date
+
+import pytest
+
+from utils.database import Database
+from utils.session_store import SessionStore, HISTOGRAM_COLUMNS
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(Database(str(tmp_path / 'sessions.db')), batch_size=4, flush_interval=0.05)
+    yield store
+    store.close()
+
+
+def daily_stats(store):
+    with store.database.connection() as conn:
+        return sorted(conn.execute(f'''
+            SELECT date, role, total_scans, score_sum, success_count, {', '.join(HISTOGRAM_COLUMNS)}
+            FROM daily_stats
+        '''))
+
+
+def test_every_analysis_is_a_row(store):
+    for score in (40, 75, 90):
+        store.record('browser-session', 'data_analyst', score, 'cv.pdf', 100)
+    assert store.flush(timeout=5)
+
+    with store.database.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM user_sessions WHERE session_id = 'browser-session'").fetchone()[0] == 3
+    assert store.stats()['total_scans'] == 3
+
+
+def test_incremental_stats_equal_rebuilt_stats(store):
+    records = [
+        ('s1', 'data_analyst', 40.5, date(2026, 3, 1)),
+        ('s1', 'data_analyst', 82.0, date(2026, 3, 1)),
+        ('s1', 'business_analyst', 100, date(2026, 3, 2)),
+        ('s2', 'data_scientist', 70, None),
+        ('s2', 'data_scientist', 0, None),
+        ('s3', 'data_analyst', 99.9, None),
+    ]
+    for session_id, role, score, day in records:
+        store.record(session_id, role, score, 'cv.pdf', 100, day=day)
+    assert store.flush(timeout=5)
+    incremental = daily_stats(store)
+
+    with store.database.transaction() as conn:
+        conn.execute('DELETE FROM daily_stats')
+        store._rebuild_daily_stats(conn)
+    assert daily_stats(store) == incremental
+
+    stats = store.stats(date(2026, 3, 1))
+    assert stats['total_scans'] == len(records)
+    assert stats['today_scans'] == 2
+    assert store.stats()['today_scans'] == 3
+
+
+def test_legacy_unique_table_is_migrated(tmp_path):
+    path = str(tmp_path / 'legacy.db')
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE user_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT UNIQUE,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            role TEXT,
+            overall_score REAL,
+            file_name TEXT,
+            file_size INTEGER,
+            ip_hash TEXT
+        )
+    ''')
+    conn.execute("INSERT INTO user_sessions (session_id, timestamp, role, overall_score) "
+                 "VALUES ('old', '2026-01-05 23:59:00', 'data_analyst', 80)")
+    conn.commit()
+    conn.close()
+
+    store = SessionStore(Database(path), flush_interval=0.05)
+    try:
+        store.record('old', 'data_analyst', 60, 'cv.pdf', 100, day=date(2026, 1, 6))
+        assert store.flush(timeout=5)
+        with store.database.connection() as conn:
+            assert conn.execute('SELECT COUNT(*) FROM user_sessions').fetchone()[0] == 2
+            assert conn.execute("SELECT day FROM user_sessions WHERE id = 1").fetchone()[0] == '2026-01-05'
+        assert store.stats(date(2026, 1, 5))['today_scans'] == 1
+        assert store.stats()['total_scans'] == 2
+    finally:
+        store.close()
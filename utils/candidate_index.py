@@ -0,0 +1,242 @@
+# utils/candidate_index.py
+import threading
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.database import get_database
+
+
+class CandidateIndex:
+    """
+    Analiz edilmiş CV'ler için anahtar kelime -> CV ters indeksi (SQLite)
+
+    Her CV'nin analizde bulunan anahtar kelimeleri saklanır; bir rol ya da iş ilanı için
+    en iyi K aday, belgeler yeniden okunmadan yalnızca posting listelerinden sıralanır.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.database = get_database(db_path)
+        self._lock = threading.Lock()
+        self._init_tables()
+
+    def _init_tables(self):
+        """İndeks tablolarını oluşturur"""
+        with self.database.transaction() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS cv_index (
+                    cv_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    cv_key TEXT UNIQUE,
+                    label TEXT,
+                    role TEXT,
+                    ruleset_version TEXT,
+                    overall_score REAL,
+                    keyword_score REAL,
+                    indexed_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS keyword_postings (
+                    keyword TEXT,
+                    cv_id INTEGER,
+                    PRIMARY KEY (keyword, cv_id)
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_keyword_postings_cv ON keyword_postings (cv_id)')
+
+    @staticmethod
+    def keywords_from_results(results: Dict[str, Any]) -> List[str]:
+        """Pipeline sonucundan indekslenecek (küçük harfli) anahtar kelimeleri toplar"""
+        keywords = set()
+        keyword_analysis = results.get('keyword_analysis', {})
+        for found in keyword_analysis.get('found_keywords', {}).values():
+            keywords.update(found)
+        keywords.update(keyword_analysis.get('experience_analysis', {}).get('found', []))
+
+        job_match = results.get('job_match') or {}
+        keywords.update(job_match.get('matched_required', []))
+        keywords.update(job_match.get('matched_preferred', []))
+
+        return sorted({keyword.lower() for keyword in keywords})
+
+    def add(self, cv_key: str, label: str, role: str, ruleset_version: str,
+            overall_score: float, keyword_score: float, keywords: Iterable[str]) -> int:
+        """
+        CV'yi indekse ekler; aynı cv_key tekrar eklenirse posting'leri yenilenir
+
+        Returns:
+            int: CV kimliği
+        """
+        keywords = sorted({keyword.lower() for keyword in keywords})
+
+        with self._lock, self.database.transaction() as conn:
+            conn.execute('''
+                INSERT INTO cv_index (cv_key, label, role, ruleset_version, overall_score, keyword_score)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cv_key) DO UPDATE SET
+                    label = excluded.label,
+                    role = excluded.role,
+                    ruleset_version = excluded.ruleset_version,
+                    overall_score = excluded.overall_score,
+                    keyword_score = excluded.keyword_score,
+                    indexed_at = CURRENT_TIMESTAMP
+            ''', (cv_key, label, role, ruleset_version, overall_score, keyword_score))
+            cv_id = conn.execute('SELECT cv_id FROM cv_index WHERE cv_key = ?', (cv_key,)).fetchone()[0]
+
+            conn.execute('DELETE FROM keyword_postings WHERE cv_id = ?', (cv_id,))
+            conn.executemany(
+                'INSERT INTO keyword_postings (keyword, cv_id) VALUES (?, ?)',
+                [(keyword, cv_id) for keyword in keywords]
+            )
+
+        return cv_id
+
+    def count(self) -> int:
+        """İndeksteki CV sayısı"""
+        with self.database.connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM cv_index').fetchone()[0]
+
+    @staticmethod
+    def _filters(prefix: str, role: Optional[str],
+                 ruleset_version: Optional[str]) -> Tuple[List[str], List[Any]]:
+        """cv_index için rol/sürüm koşulları ve parametreleri"""
+        conditions: List[str] = []
+        params: List[Any] = []
+        if role:
+            conditions.append(f'{prefix}role = ?')
+            params.append(role)
+        if ruleset_version:
+            conditions.append(f'{prefix}ruleset_version = ?')
+            params.append(ruleset_version)
+        return conditions, params
+
+    def rank_terms(self, required: Sequence[str], preferred: Sequence[str] = (), top_k: int = 10,
+                   preferred_weight: float = 0.5, role: Optional[str] = None,
+                   ruleset_version: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        İş ilanı terimlerine göre en iyi K adayı döndürür
+
+        Skor JobDescriptionAnalyzer kapsama skoruyla aynı formüldür: zorunlu terim 1.0,
+        tercih sebebi terim preferred_weight ağırlıklı; toplama SQLite'ta yapılır.
+        Yalnızca indekslenmiş terimler (analiz edilen rolün sözlüğü ve o sırada verilen
+        ilanın eşleşen terimleri) bilinir; diğer terimler hiçbir CV'de yokmuş gibi sayılır.
+
+        Args:
+            role: Verilirse yalnızca bu rol için analiz edilmiş CV'ler sıralanır
+            ruleset_version: Verilirse yalnızca bu sürümle (pipeline.scoring_version) indekslenmiş
+                CV'ler sıralanır; eski kural setiyle bulunan posting'ler karışmaz
+        """
+        weights: Dict[str, float] = {}
+        for term in preferred:
+            weights[term.lower()] = preferred_weight
+        for term in required:
+            weights[term.lower()] = 1.0
+
+        total_weight = sum(weights.values())
+        if not total_weight:
+            return []
+
+        values = ', '.join('(?, ?)' for _ in weights)
+        params: List[Any] = [value for item in weights.items() for value in item]
+        conditions, filter_params = self._filters('c.', role, ruleset_version)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        params.extend(filter_params)
+        params.append(top_k)
+
+        with self.database.connection() as conn:
+            rows = conn.execute(f'''
+                WITH query_terms(keyword, weight) AS (VALUES {values})
+                SELECT c.cv_id, c.label, c.role, c.overall_score, SUM(q.weight) AS matched
+                FROM query_terms q
+                JOIN keyword_postings p ON p.keyword = q.keyword
+                JOIN cv_index c ON c.cv_id = p.cv_id
+                {where}
+                GROUP BY c.cv_id
+                ORDER BY matched DESC, c.cv_id
+                LIMIT ?
+            ''', params).fetchall()
+
+        return [
+            {
+                'cv_id': cv_id,
+                'label': label,
+                'role': cv_role,
+                'overall_score': overall_score,
+                'score': round(matched / total_weight * 100, 1)
+            }
+            for cv_id, label, cv_role, overall_score, matched in rows
+        ]
+
+    def rank_role(self, scorer, top_k: int = 10, role: Optional[str] = None,
+                  ruleset_version: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Bir rol kural setine göre en iyi K adayı döndürür
+
+        Args:
+            scorer: analyzers.batch_scoring.BatchKeywordScorer; varlık matrisi posting'lerden
+                kurulur ve kategori skorları bu puanlayıcıyla hesaplanır
+            role: Yalnızca bu rol için analiz edilmiş CV'ler sıralanır (varsayılan: scorer.role);
+                başka rolün sözlüğüyle indekslenen CV'lerin posting'leri bu sözlükle kıyaslanamaz
+            ruleset_version: Verilirse yalnızca bu sürümle indekslenmiş CV'ler sıralanır
+        """
+        columns: Dict[str, List[int]] = {}
+        for column, term in enumerate(scorer.vocabulary):
+            columns.setdefault(term.lower(), []).append(column)
+        if not columns:
+            return []
+
+        conditions, filter_params = self._filters('', role or scorer.role, ruleset_version)
+        cv_filter = f"AND cv_id IN (SELECT cv_id FROM cv_index WHERE {' AND '.join(conditions)})"
+
+        # Her anahtar kelimenin posting listesi (keyword, cv_id) birincil anahtarından okunur
+        with self.database.connection() as conn:
+            posting_lists = []
+            for keyword, keyword_columns in columns.items():
+                cv_ids = conn.execute(
+                    f'SELECT cv_id FROM keyword_postings WHERE keyword = ? {cv_filter}',
+                    [keyword] + filter_params
+                ).fetchall()
+                if cv_ids:
+                    ids = np.fromiter((row[0] for row in cv_ids), dtype=np.int64, count=len(cv_ids))
+                    posting_lists.append((ids, keyword_columns))
+
+            if not posting_lists:
+                return []
+
+            candidate_ids, inverse = np.unique(
+                np.concatenate([ids for ids, _ in posting_lists]), return_inverse=True
+            )
+            presence = np.zeros((len(candidate_ids), len(scorer.vocabulary)), dtype=bool)
+            offset = 0
+            for ids, keyword_columns in posting_lists:
+                rows = inverse[offset:offset + len(ids)]
+                for column in keyword_columns:
+                    presence[rows, column] = True
+                offset += len(ids)
+
+            category_scores = scorer.category_scores(presence)
+            totals = scorer.total_scores(category_scores)
+            order = np.argsort(-totals, kind='stable')[:top_k].tolist()
+
+            top_ids = [int(candidate_ids[i]) for i in order]
+            details = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    f'SELECT cv_id, label, role, overall_score FROM cv_index '
+                    f'WHERE cv_id IN ({", ".join("?" for _ in top_ids)})',
+                    top_ids
+                )
+            }
+
+        return [
+            {
+                'cv_id': cv_id,
+                'label': details[cv_id][0],
+                'role': details[cv_id][1],
+                'overall_score': details[cv_id][2],
+                'score': float(totals[i]),
+                'category_scores': dict(zip(scorer.categories, category_scores[i].tolist()))
+            }
+            for cv_id, i in zip(top_ids, order)
+        ]
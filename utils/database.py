@@ -0,0 +1,88 @@
+# utils/database.py
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Iterator
+
+
+class Database:
+    """
+    SQLite bağlantı havuzu
+
+    Bağlantılar her çağrıda yeniden açılmaz, havuzdan ödünç alınıp geri verilir; bir bağlantıyı
+    aynı anda yalnızca bir iş parçacığı kullanır. Veritabanı WAL modunda açılır: okuyucular
+    yazarı, yazar okuyucuları beklemez; kilit çakışmasında hata yerine busy_timeout kadar beklenir.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, timeout: float = 5.0):
+        """
+        Args:
+            path: SQLite dosyası
+            pool_size: Havuzda boşta tutulacak en fazla bağlantı sayısı
+            timeout: Kilit için en uzun bekleme (saniye)
+        """
+        self.path = path
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        # WAL ile NORMAL senkronizasyon: commit'ler checkpoint'e kadar fsync beklemez
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Havuzdan bir bağlantı ödünç verir"""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._open()
+
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                if len(self._idle) < self.pool_size:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Blok hatasız biterse commit, hata verirse rollback yapan bağlantı"""
+        with self.connection() as conn:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Boştaki bağlantıları kapatır"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_databases: Dict[str, Database] = {}
+_databases_lock = threading.Lock()
+
+
+def get_database(path: str) -> Database:
+    """Aynı dosya için süreç içinde paylaşılan Database nesnesini döndürür"""
+    key = os.path.abspath(path)
+    with _databases_lock:
+        database = _databases.get(key)
+        if database is None:
+            database = _databases[key] = Database(path)
+        return database
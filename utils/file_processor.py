@@ -1,8 +1,232 @@
 # utils/file_processor.py
+import hashlib
+import io
+import mmap
+import os
+import tempfile
 import fitz  # PyMuPDF
 import docx
-import streamlit as st
-from typing import Optional, Dict, Any
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, Union, Iterator, Tuple, Callable
+
+from utils.profiling import timed
+
+MIME_TYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword'
+}
+
+
+class SpooledUpload(io.RawIOBase):
+    """
+    Yüklemenin tek kopyası: içerik bir kez geçici dosyaya yazılır ve salt okunur mmap ile sunulur
+    
+    PyMuPDF (buffer) ve python-docx (read/seek) aynı eşlenmiş belleği okur; içerik Python
+    tarafında bytes olarak yeniden kopyalanmaz. Streamlit UploadedFile arayüzünü (name, type,
+    size, read/seek/getvalue) sunduğu için analizörlere doğrudan verilebilir.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, uploaded_file=None):
+        """
+        Args:
+            uploaded_file: Streamlit UploadedFile veya okunabilir dosya nesnesi; içerik
+                parça parça geçici dosyaya yazılırken SHA-256 özeti de hesaplanır
+        """
+        super().__init__()
+        self._sha256 = None
+        if uploaded_file is None:
+            return
+        
+        self.name = getattr(uploaded_file, 'name', '')
+        self.type = getattr(uploaded_file, 'type', 'application/octet-stream')
+        
+        digest = hashlib.sha256()
+        spool = tempfile.TemporaryFile(prefix='ats_upload_')
+        uploaded_file.seek(0)
+        while True:
+            chunk = uploaded_file.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            spool.write(chunk)
+        uploaded_file.seek(0)
+        spool.flush()
+        
+        self._sha256 = digest.hexdigest()
+        self._map(spool)
+    
+    def _map(self, file):
+        """Açık dosyayı salt okunur eşler (boş dosyalar eşlenemez, boş görünüm kullanılır)"""
+        self._file = file
+        self.size = os.fstat(file.fileno()).st_size
+        self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.buffer = memoryview(self._mmap) if self._mmap is not None else memoryview(b'')
+        self._position = 0
+    
+    @property
+    def sha256(self) -> str:
+        """İçeriğin SHA-256 özeti (önbellek ve indeks anahtarları için)"""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.buffer).hexdigest()
+        return self._sha256
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Geçersiz konum: {offset}")
+        self._position = offset
+        return offset
+    
+    def readinto(self, target) -> int:
+        data = self.buffer[self._position:self._position + len(target)]
+        target[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+    
+    def getvalue(self) -> bytes:
+        """Tüm içeriğin bytes kopyası (yalnızca kopya gerektiren eski arayüzler için)"""
+        return bytes(self.buffer)
+    
+    def close(self):
+        """Eşlemeyi ve geçici dosyayı kapatır"""
+        if self.closed:
+            return
+        super().close()
+        if getattr(self, '_mmap', None) is not None:
+            try:
+                self.buffer.release()
+                self._mmap.close()
+            except BufferError:
+                # Görünümü hâlâ tutan bir nesne var; eşleme çöp toplayıcıyla kapanır
+                pass
+        if getattr(self, '_file', None) is not None:
+            self._file.close()
+
+
+class LocalFile(SpooledUpload):
+    """Diskteki bir CV dosyasını kopyalamadan doğrudan eşler ve UploadedFile arayüzüyle sunar"""
+    
+    def __init__(self, path: Union[str, Path]):
+        super().__init__()
+        path = Path(path)
+        self.name = path.name
+        self.type = MIME_TYPES.get(path.suffix.lower(), 'application/octet-stream')
+        self._map(open(path, 'rb'))
+
+
+@contextmanager
+def spooled(uploaded_file) -> Iterator[SpooledUpload]:
+    """Yüklemeyi SpooledUpload olarak verir; zaten eşlenmişse olduğu gibi kullanır ve kapatmaz"""
+    if isinstance(uploaded_file, SpooledUpload):
+        yield uploaded_file
+        return
+    
+    upload = SpooledUpload(uploaded_file)
+    try:
+        yield upload
+    finally:
+        upload.close()
+
+
+def upload_buffer(uploaded_file) -> Union[bytes, memoryview]:
+    """Yükleme içeriği: SpooledUpload için kopyasız mmap görünümü, diğerleri için getvalue()"""
+    if isinstance(uploaded_file, SpooledUpload):
+        return uploaded_file.buffer
+    return uploaded_file.getvalue()
+
+
+class FileProcessingError(Exception):
+    """Dosya okunamadığında veya formatı desteklenmediğinde fırlatılır"""
+    pass
+
+
+class ParsedDocument:
+    """Tek seferde ayrıştırılmış CV dosyası: düz metin ve (PDF için) font istatistikleri"""
+    
+    def __init__(self, text: str, file_type: str, page_count: int = 0,
+                 font_usage: Optional[Dict[str, int]] = None):
+        self.text = text
+        self.file_type = file_type
+        self.page_count = page_count
+        self.font_usage = font_usage
+
+
+# Sayfa geri çağrısı: (sayfa metni, sayfa numarası (1'den), toplam sayfa)
+PageCallback = Callable[[str, int, int], None]
+
+
+def iter_pdf_pages(data: Union[bytes, memoryview], font_usage: Optional[Dict[str, int]] = None) -> Iterator[Tuple[int, int, str]]:
+    """
+    PDF sayfalarını çözüldükçe üretir; her sayfada tek bir get_text("dict") geçişi yapılır
+    
+    Args:
+        font_usage: Verilirse span bazlı font kullanımı bu sözlükte biriktirilir
+    
+    Yields:
+        tuple: (sayfa numarası (1'den), toplam sayfa, sayfa metni)
+    """
+    doc = fitz.open(stream=data, filetype="pdf")
+    
+    try:
+        page_count = doc.page_count
+        for page_number, page in enumerate(doc, start=1):
+            # "text" moduyla aynı bayraklar: aynı karakterler, görseller çözülmez
+            page_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+            lines = []
+            
+            for block in page_dict.get("blocks", []):
+                for line in block.get("lines", []):
+                    spans = line["spans"]
+                    if font_usage is not None:
+                        for span in spans:
+                            font_name = span.get("font", "Unknown")
+                            font_usage[font_name] = font_usage.get(font_name, 0) + 1
+                    lines.append("".join(span["text"] for span in spans) + "\n")
+            
+            yield page_number, page_count, "".join(lines)
+    finally:
+        doc.close()
+
+
+def parse_pdf_bytes(data: Union[bytes, memoryview], on_page: Optional[PageCallback] = None) -> ParsedDocument:
+    """
+    PDF'i sayfa sayfa ayrıştırır; metin en sonda tek bir join ile birleştirilir
+    
+    Args:
+        on_page: Her sayfa çözüldüğünde çağrılır (ör. sayfa bazlı ön skor için)
+    """
+    page_texts = []
+    font_usage = {}
+    page_count = 0
+    
+    for page_number, page_count, page_text in iter_pdf_pages(data, font_usage):
+        page_texts.append(page_text)
+        if on_page is not None:
+            on_page(page_text, page_number, page_count)
+    
+    return ParsedDocument(
+        text="".join(page_texts).strip(),
+        file_type="application/pdf",
+        page_count=page_count,
+        font_usage=font_usage
+    )
+
 
 class FileProcessor:
     """CV dosyalarını işleyen sınıf"""
@@ -18,45 +242,52 @@ class FileProcessor:
             uploaded_file: Streamlit file uploader'dan gelen dosya
             
         Returns:
-            str: Çıkarılan metin veya None
+            str: Çıkarılan metin
+            
+        Raises:
+            FileProcessingError: Dosya işlenemezse
         """
-        try:
-            file_type = uploaded_file.type
+        return self.parse_document(uploaded_file).text
+    
+    @timed('extract_text')
+    def parse_document(self, uploaded_file, on_page: Optional[PageCallback] = None) -> Optional[ParsedDocument]:
+        """
+        Yüklenen dosyayı bir kez ayrıştırır; metin ve format analizi aynı sonucu paylaşır
+        
+        Args:
+            uploaded_file: Streamlit file uploader'dan gelen dosya
+            on_page: Her sayfa metni çözüldüğünde çağrılır (DOCX tek sayfa sayılır)
             
+        Returns:
+            ParsedDocument: Ayrıştırılmış doküman
+            
+        Raises:
+            FileProcessingError: Format desteklenmiyorsa veya dosya okunamazsa
+        """
+        file_type = uploaded_file.type
+        
+        if file_type not in MIME_TYPES.values():
+            raise FileProcessingError(f"Desteklenmeyen dosya formatı: {file_type}")
+        
+        try:
             if file_type == "application/pdf":
-                return self._extract_from_pdf(uploaded_file)
-            elif file_type in ["application/vnd.openxmlformats-officedocument.wordprocessingml.document", 
-                              "application/msword"]:
-                return self._extract_from_docx(uploaded_file)
-            else:
-                st.error(f"Desteklenmeyen dosya formatı: {file_type}")
-                return None
-                
+                return self._parse_pdf(uploaded_file, on_page)
+            
+            text = self._extract_from_docx(uploaded_file)
+            if on_page is not None:
+                on_page(text, 1, 1)
+            return ParsedDocument(text, file_type, page_count=1)
         except Exception as e:
-            st.error(f"Dosya işleme hatası: {str(e)}")
-            return None
+            raise FileProcessingError(f"Dosya işleme hatası: {str(e)}") from e
     
-    def _extract_from_pdf(self, uploaded_file) -> str:
-        """PDF'den metin çıkarır"""
-        doc = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-        text = ""
-        
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            text += page.get_text()
-            
-        doc.close()
-        return text.strip()
+    def _parse_pdf(self, uploaded_file, on_page: Optional[PageCallback] = None) -> ParsedDocument:
+        """PDF'i tek geçişte ayrıştırır (SpooledUpload ise eşlenmiş bellekten, kopyasız)"""
+        return parse_pdf_bytes(upload_buffer(uploaded_file), on_page)
     
     def _extract_from_docx(self, uploaded_file) -> str:
         """DOCX'den metin çıkarır"""
         doc = docx.Document(uploaded_file)
-        text = ""
-        
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-            
-        return text.strip()
+        return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs).strip()
     
     def get_file_info(self, uploaded_file) -> Dict[str, Any]:
         """
@@ -0,0 +1,117 @@
+# utils/lazy_result.py
+from typing import Dict, Any, Callable, Iterator, List, Optional
+
+
+class LazyResult(dict):
+    """
+    Bazı anahtarları ilk erişimde hesaplanıp saklanan sonuç sözlüğü
+
+    Skoru etkilemeyen ayrıntılar (öneri listeleri, örnekler, ilan uyumu) hesaplayıcı olarak
+    verilir; yalnızca skoru okuyan kullanıcılar (toplu puanlama, sıralama) bu işi hiç yapmaz.
+    Anahtar kontrolü ve len() hesaplama yapmaz. Tüm anahtarları gezen işlemler (iterasyon,
+    items(), json.dumps, pickle, ==) bekleyen değerleri tanımlanma sırasıyla hesaplar; böylece
+    sözlük her yerde sıradan bir dict gibi kullanılabilir. Aynı anahtar iki iş parçacığından
+    aynı anda istenirse değer iki kez hesaplanabilir, ancak ilk saklanan değer döndürülür.
+    """
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None,
+                 lazy: Optional[Dict[str, Callable[[], Any]]] = None):
+        """
+        Args:
+            values: Hemen bilinen değerler
+            lazy: Anahtar -> argümansız hesaplayıcı; değer ilk erişimde hesaplanır
+        """
+        super().__init__(values or {})
+        self._lazy: Dict[str, Callable[[], Any]] = dict(lazy or {})
+
+    def _pending(self) -> List[str]:
+        return [key for key in self._lazy if not dict.__contains__(self, key)]
+
+    def is_computed(self, key: str) -> bool:
+        """Anahtarın değeri hesaplanmış (veya baştan verilmiş) mı"""
+        return dict.__contains__(self, key)
+
+    def __missing__(self, key):
+        compute = self._lazy.get(key)
+        if compute is None:
+            # Başka bir iş parçacığı hesaplayıp saklamış olabilir
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+            raise KeyError(key)
+        value = dict.setdefault(self, key, compute())
+        self._lazy.pop(key, None)
+        return value
+
+    def materialize(self) -> 'LazyResult':
+        """Bekleyen tüm değerleri hesaplar"""
+        for key in self._pending():
+            self[key]
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """İç içe tüm tembel değerleri hesaplanmış sade dict kopyası"""
+        return _plain(self)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._lazy
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending())
+
+    def __iter__(self) -> Iterator:
+        return dict.__iter__(self.materialize())
+
+    def keys(self):
+        return dict.keys(self.materialize())
+
+    def values(self):
+        return dict.values(self.materialize())
+
+    def items(self):
+        return dict.items(self.materialize())
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            dict.pop(self, key)
+            self._lazy.pop(key, None)
+            return value
+        return dict.pop(self, key, *default)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def clear(self):
+        dict.clear(self)
+        self._lazy.clear()
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.materialize())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyResult):
+            other.materialize()
+        return dict.__eq__(self.materialize(), other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self.materialize())
+
+    def __reduce__(self):
+        # Hesaplayıcılar (kapanışlar) taşınamaz; süreçler ve önbellek sade dict görür
+        return (dict, (self.to_dict(),))
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
@@ -0,0 +1,88 @@
+# utils/memory_budget.py
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+
+class MemoryBudgetTimeout(Exception):
+    """Yükleme bellek bütçesinde yer açılmasını beklerken zaman aşımına uğradığında fırlatılır"""
+    pass
+
+
+class MemoryBudget:
+    """
+    Süreç başına bellek bütçesi: aynı anda işlenen yüklemelerin tahmini bellek toplamını sınırlar
+
+    Bütçe doluysa yeni yüklemeler geliş sırasıyla kuyruğa girer ve yer açılana kadar bekler.
+    Bütçeden büyük tek bir yükleme bütçeye kırpılır; böylece kuyruk kilitlenmez, yalnızca
+    tek başına işlenir.
+    """
+
+    def __init__(self, limit_bytes: int):
+        """
+        Args:
+            limit_bytes: Bütçe (bayt); 0 veya negatifse sınır uygulanmaz
+        """
+        self.limit_bytes = max(limit_bytes, 0)
+        self.in_use = 0
+        self._queue = deque()
+        self._condition = threading.Condition()
+
+    @property
+    def waiting(self) -> int:
+        """Kuyrukta bekleyen yükleme sayısı"""
+        with self._condition:
+            return len(self._queue)
+
+    def acquire(self, nbytes: int, timeout: Optional[float] = None) -> int:
+        """
+        Bütçeden yer ayırır; yer yoksa sıra gelene kadar bekler
+
+        Returns:
+            int: Ayrılan miktar (release'e verilmeli)
+
+        Raises:
+            MemoryBudgetTimeout: timeout saniye içinde yer açılmazsa
+        """
+        if not self.limit_bytes:
+            return 0
+
+        amount = min(max(nbytes, 0), self.limit_bytes)
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        ticket = object()
+
+        with self._condition:
+            self._queue.append(ticket)
+            try:
+                while self._queue[0] is not ticket or self.in_use + amount > self.limit_bytes:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise MemoryBudgetTimeout(
+                            "Sunucu şu anda yoğun, lütfen biraz sonra tekrar deneyin"
+                        )
+                    self._condition.wait(remaining)
+                self.in_use += amount
+            finally:
+                self._queue.remove(ticket)
+                self._condition.notify_all()
+
+        return amount
+
+    def release(self, amount: int):
+        """acquire ile ayrılan miktarı bütçeye geri verir"""
+        if not amount:
+            return
+        with self._condition:
+            self.in_use -= amount
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, nbytes: int, timeout: Optional[float] = None):
+        """Blok süresince bütçeden yer ayırır"""
+        amount = self.acquire(nbytes, timeout)
+        try:
+            yield
+        finally:
+            self.release(amount)
@@ -0,0 +1,67 @@
+# utils/prepared_text.py
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Tuple, Union
+
+from utils.profiling import timed
+from utils.token_index import TokenIndex
+
+_TOKEN_PATTERN = re.compile(r'\S+')
+_SPECIAL_CHARS = frozenset('!@#$%^&*()')
+
+
+@dataclass(frozen=True)
+class PreparedText:
+    """CV metninin tüm analizörlerce paylaşılan, bir kez hazırlanan değiştirilemez görünümü"""
+
+    text: str
+    lower: str
+    tokens: Tuple[str, ...]
+    token_offsets: Tuple[int, ...]
+    sentences: Tuple[str, ...]
+    lower_sentences: Tuple[str, ...]
+    lines: Tuple[str, ...]
+    upper_count: int
+    special_char_count: int
+
+    @classmethod
+    @timed('prepare_text')
+    def from_text(cls, text: str) -> 'PreparedText':
+        """Ham metinden hazırlanmış dokümanı oluşturur"""
+        tokens = []
+        token_offsets = []
+        for match in _TOKEN_PATTERN.finditer(text):
+            tokens.append(match.group())
+            token_offsets.append(match.start())
+
+        lower = text.lower()
+
+        return cls(
+            text=text,
+            lower=lower,
+            tokens=tuple(tokens),
+            token_offsets=tuple(token_offsets),
+            sentences=tuple(text.split('.')),
+            lower_sentences=tuple(lower.split('.')),
+            lines=tuple(text.split('\n')),
+            upper_count=sum(1 for c in text if c.isupper()),
+            special_char_count=sum(1 for c in text if c in _SPECIAL_CHARS)
+        )
+
+    @cached_property
+    @timed('prepare_text.token_index')
+    def index(self) -> TokenIndex:
+        """Kelime sınırlı ifade aramaları için token/n-gram indeksi (ilk kullanımda bir kez kurulur)"""
+        return TokenIndex(self.lower)
+
+    def __reduce__(self):
+        # Süreçler arasında yalnızca ham metin taşınır, görünüm karşı tarafta yeniden hazırlanır
+        return (PreparedText.from_text, (self.text,))
+
+    @classmethod
+    def ensure(cls, text: Union[str, 'PreparedText']) -> 'PreparedText':
+        """Ham metni hazırlar, zaten hazırlanmışsa aynen döndürür"""
+        if isinstance(text, cls):
+            return text
+        return cls.from_text(text)
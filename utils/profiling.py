@@ -0,0 +1,208 @@
+# utils/profiling.py
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional
+
+_active_profiler: ContextVar[Optional['Profiler']] = ContextVar('active_profiler', default=None)
+
+
+class Profiler:
+    """Puanlama aşamaları için duvar saati, CPU süresi ve tepe bellek ölçümü"""
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        Args:
+            trace_memory: True ise tracemalloc ile aşama başına tepe bellek ölçülür (yavaşlatır)
+        """
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.events: List[Dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def activate(self):
+        """Bu bağlamda çağrılan @timed fonksiyonları bu profiler'a kaydeder"""
+        started_tracing = False
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+
+        token = _active_profiler.set(self)
+        try:
+            with self.stage('total'):
+                yield self
+        finally:
+            _active_profiler.reset(token)
+            if started_tracing:
+                tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Bir aşamayı ölçer; iç içe aşamalar ayrı ayrı kaydedilir"""
+        peak_stack = self._peak_stack()
+        traced_start = 0
+        if self.trace_memory and tracemalloc.is_tracing():
+            traced_start, running_peak = tracemalloc.get_traced_memory()
+            if peak_stack:
+                peak_stack[-1] = max(peak_stack[-1], running_peak)
+            tracemalloc.reset_peak()
+            peak_stack.append(traced_start)
+
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+
+            peak_bytes = 0
+            if self.trace_memory and tracemalloc.is_tracing() and peak_stack:
+                stage_peak = max(peak_stack.pop(), tracemalloc.get_traced_memory()[1])
+                peak_bytes = stage_peak - traced_start
+                if peak_stack:
+                    peak_stack[-1] = max(peak_stack[-1], stage_peak)
+
+            self._record(name, wall_start, wall, cpu, peak_bytes)
+
+    def _peak_stack(self) -> List[int]:
+        """İş parçacığına özel tepe bellek yığını"""
+        if not hasattr(self._local, 'peaks'):
+            self._local.peaks = []
+        return self._local.peaks
+
+    def _record(self, name: str, wall_start: float, wall: float, cpu: float, peak_bytes: int):
+        with self._lock:
+            stats = self.stages.setdefault(name, {'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_kb': 0.0})
+            stats['calls'] += 1
+            stats['wall_ms'] += wall * 1000
+            stats['cpu_ms'] += cpu * 1000
+            stats['peak_kb'] = max(stats['peak_kb'], peak_bytes / 1024)
+
+            self.events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': (wall_start - self._origin) * 1e6,
+                'dur': wall * 1e6,
+                'pid': 0,
+                'tid': threading.get_ident()
+            })
+
+    def merge(self, timings: Dict[str, Dict[str, float]]):
+        """Başka bir süreçte ölçülmüş aşama sürelerini (as_dict çıktısı) ekler; 'total' atlanır"""
+        with self._lock:
+            for name, other in timings.items():
+                if name == 'total':
+                    continue
+                stats = self.stages.setdefault(name, {'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_kb': 0.0})
+                stats['calls'] += other['calls']
+                stats['wall_ms'] += other['wall_ms']
+                stats['cpu_ms'] += other['cpu_ms']
+                stats['peak_kb'] = max(stats['peak_kb'], other['peak_kb'])
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        """Sonuç sözlüğüne eklenecek 'timings' değeri"""
+        with self._lock:
+            return {
+                name: {
+                    'calls': stats['calls'],
+                    'wall_ms': round(stats['wall_ms'], 3),
+                    'cpu_ms': round(stats['cpu_ms'], 3),
+                    'peak_kb': round(stats['peak_kb'], 1)
+                }
+                for name, stats in self.stages.items()
+            }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """chrome://tracing / Perfetto ile açılabilen trace nesnesi"""
+        with self._lock:
+            return {'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str):
+        """Chrome trace dosyası yazar"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Bu bağlamda etkin olan Profiler (yoksa None)"""
+    return _active_profiler.get()
+
+
+def timed(name: str):
+    """Etkin bir Profiler varsa fonksiyonu verilen aşama adıyla ölçer; yoksa doğrudan çağırır"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active_profiler.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MetricsRegistry:
+    """'timings' sözlüklerini biriktirip Prometheus metin formatında sunar"""
+
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, prefix: str = 'ats', buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, timings: Dict[str, Dict[str, float]]):
+        """Bir analizin aşama sürelerini sayaçlara ve histogramlara ekler"""
+        with self._lock:
+            for name, stats in timings.items():
+                entry = self._stages.setdefault(name, {
+                    'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'bucket_counts': [0] * len(self.buckets), 'count': 0
+                })
+                wall_seconds = stats['wall_ms'] / 1000
+                entry['calls'] += stats['calls']
+                entry['wall'] += wall_seconds
+                entry['cpu'] += stats['cpu_ms'] / 1000
+                entry['count'] += 1
+                for i, bound in enumerate(self.buckets):
+                    if wall_seconds <= bound:
+                        entry['bucket_counts'][i] += 1
+
+    def render(self) -> str:
+        """Prometheus exposition formatında metin üretir"""
+        p = self.prefix
+
+        with self._lock:
+            stages = sorted(self._stages.items())
+
+            lines = [f'# TYPE {p}_stage_calls_total counter']
+            for name, entry in stages:
+                lines.append(f'{p}_stage_calls_total{{stage="{name}"}} {entry["calls"]}')
+
+            lines.append(f'# TYPE {p}_stage_cpu_seconds_total counter')
+            for name, entry in stages:
+                lines.append(f'{p}_stage_cpu_seconds_total{{stage="{name}"}} {entry["cpu"]:.6f}')
+
+            lines.append(f'# TYPE {p}_stage_wall_seconds histogram')
+            for name, entry in stages:
+                label = f'stage="{name}"'
+                for bound, count in zip(self.buckets, entry['bucket_counts']):
+                    lines.append(f'{p}_stage_wall_seconds_bucket{{{label},le="{bound}"}} {count}')
+                lines.append(f'{p}_stage_wall_seconds_bucket{{{label},le="+Inf"}} {entry["count"]}')
+                lines.append(f'{p}_stage_wall_seconds_sum{{{label}}} {entry["wall"]:.6f}')
+                lines.append(f'{p}_stage_wall_seconds_count{{{label}}} {entry["count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+
+# Süreç genelinde paylaşılan metrik kaydı
+METRICS = MetricsRegistry()
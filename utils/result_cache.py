@@ -0,0 +1,148 @@
+# utils/result_cache.py
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any
+
+from utils.database import get_database
+from utils.lazy_result import LazyResult
+
+
+class ResultCache:
+    """Analiz sonuçları için içerik hash'i anahtarlı, LRU tahliyeli iki katmanlı önbellek"""
+
+    def __init__(self, max_entries: int = 64, db_path: Optional[str] = None, max_disk_entries: int = 5000):
+        """
+        Args:
+            max_entries: Bellekte tutulacak en fazla sonuç sayısı
+            db_path: Verilirse sonuçlar bu SQLite dosyasında da saklanır
+            max_disk_entries: Disk katmanında tutulacak en fazla sonuç sayısı
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_disk_entries = max_disk_entries
+        self.ruleset_version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._database = None
+
+        if self.db_path:
+            self._init_disk_tier()
+
+    @staticmethod
+    def make_key(file_sha256: str, role: str, ruleset_version: str, posting_hash: str = '') -> str:
+        """
+        Dosya içeriği özeti, rol, kural seti sürümü ve (varsa) iş ilanı hash'inden önbellek anahtarı üretir
+
+        Args:
+            file_sha256: Dosya içeriğinin SHA-256 özeti (SpooledUpload.sha256); içerik
+                anahtar için yeniden okunmaz
+        """
+        digest = hashlib.sha256(file_sha256.encode('ascii'))
+        digest.update(b'\0' + role.encode('utf-8'))
+        digest.update(b'\0' + ruleset_version.encode('utf-8'))
+        if posting_hash:
+            digest.update(b'\0' + posting_hash.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _init_disk_tier(self):
+        """Disk katmanı tablosunu oluşturur"""
+        try:
+            self._database = get_database(self.db_path)
+            with self._database.transaction() as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS result_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        ruleset_version TEXT,
+                        payload TEXT,
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+        except Exception as e:
+            print(f"Uyarı: sonuç önbelleği disk katmanı devre dışı: {e}")
+            self.db_path = None
+
+    def sync_ruleset(self, ruleset_version: str):
+        """Kural seti değiştiyse eski sürüme ait tüm sonuçları geçersiz kılar"""
+        if ruleset_version != self.ruleset_version:
+            self.invalidate(keep_version=ruleset_version)
+            self.ruleset_version = ruleset_version
+
+    def invalidate(self, keep_version: Optional[str] = None):
+        """
+        Önbelleği temizler
+
+        Args:
+            keep_version: Verilirse bu kural seti sürümüne ait disk kayıtları korunur
+        """
+        with self._lock:
+            self._entries.clear()
+
+        if not self.db_path:
+            return
+
+        try:
+            with self._database.transaction() as conn:
+                if keep_version is None:
+                    conn.execute('DELETE FROM result_cache')
+                else:
+                    conn.execute('DELETE FROM result_cache WHERE ruleset_version != ?', (keep_version,))
+        except Exception as e:
+            print(f"Uyarı: önbellek temizlenemedi: {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Önbellekteki sonucu döndürür, yoksa None"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if not self.db_path:
+            return None
+
+        try:
+            with self._database.connection() as conn:
+                row = conn.execute('SELECT payload FROM result_cache WHERE cache_key = ?', (key,)).fetchone()
+        except Exception:
+            return None
+
+        if row is None:
+            return None
+
+        result = json.loads(row[0])
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Sonucu her iki katmana yazar"""
+        if isinstance(result, LazyResult):
+            # Bekleyen hesaplayıcılar CV metnini tutar; önbellekte yalnızca sonuç kalır
+            result.materialize()
+        self._remember(key, result)
+
+        if not self.db_path:
+            return
+
+        try:
+            with self._database.transaction() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO result_cache (cache_key, ruleset_version, payload) VALUES (?, ?, ?)',
+                    (key, self.ruleset_version, json.dumps(result, ensure_ascii=False))
+                )
+                conn.execute('''
+                    DELETE FROM result_cache WHERE cache_key IN (
+                        SELECT cache_key FROM result_cache
+                        ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                    )
+                ''', (self.max_disk_entries,))
+        except Exception as e:
+            print(f"Uyarı: sonuç önbelleğe yazılamadı: {e}")
+
+    def _remember(self, key: str, result: Dict[str, Any]):
+        """Bellek katmanına ekler ve LRU sınırını uygular"""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,85 @@
+# utils/service_client.py
+import base64
+import json
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, Any, Optional
+
+from utils.file_processor import upload_buffer
+
+
+class ServiceError(Exception):
+    """Analiz servisi isteği reddettiğinde, iş başarısız olduğunda veya servise ulaşılamadığında fırlatılır"""
+    pass
+
+
+class AnalysisServiceClient:
+    """api_service.py için HTTP/JSON istemcisi: yüklemeyi gönderir ve sonucu uzun yoklamayla bekler"""
+
+    def __init__(self, base_url: str, timeout: float = 300, poll_wait: float = 10):
+        """
+        Args:
+            base_url: Servis adresi (ör. http://127.0.0.1:8000)
+            timeout: Bir işin sonucunu beklemek için en uzun süre (saniye)
+            poll_wait: Her GET /jobs/<id>?wait= isteğinde sunucuda beklenecek süre
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.poll_wait = poll_wait
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                 timeout: float = 30) -> Dict[str, Any]:
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        request = urllib.request.Request(
+            self.base_url + path, data=data, method=method,
+            headers={'Content-Type': 'application/json'}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get('error', e.reason)
+            except ValueError:
+                message = e.reason
+            raise ServiceError(message) from e
+        except (urllib.error.URLError, OSError) as e:
+            raise ServiceError(f"Analiz servisine ulaşılamadı: {e}") from e
+
+    def submit(self, uploaded_file, role: str, job_description: Optional[str] = None) -> str:
+        """
+        Yüklemeyi servise gönderir
+
+        Returns:
+            str: İş kimliği
+        """
+        payload = {
+            'filename': uploaded_file.name,
+            'content': base64.b64encode(upload_buffer(uploaded_file)).decode('ascii'),
+            'role': role
+        }
+        if job_description and job_description.strip():
+            payload['job_description'] = job_description
+        return self._request('POST', '/jobs', payload)['job_id']
+
+    def wait(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        İş bitene kadar bekler
+
+        Returns:
+            dict: Analiz sonuçları; dosyada metin yoksa None
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            job = self._request('GET', f'/jobs/{job_id}?wait={self.poll_wait:g}', timeout=self.poll_wait + 30)
+            if job['status'] == 'done':
+                return job.get('result')
+            if job['status'] == 'failed':
+                raise ServiceError(job.get('error') or 'Analiz başarısız oldu')
+            if time.monotonic() > deadline:
+                raise ServiceError("Analiz servisi zaman aşımına uğradı")
+
+    def analyze(self, uploaded_file, role: str, job_description: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """ScoringPipeline.analyze ile aynı sonucu servis üzerinden döndürür"""
+        return self.wait(self.submit(uploaded_file, role, job_description))
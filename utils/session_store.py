@@ -0,0 +1,280 @@
+# utils/session_store.py
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.database import Database
+
+# Kuyruğu kapatan işaret
+_STOP = object()
+
+# daily_stats'ta tüm günleri / tüm rolleri temsil eden toplam satırlarının anahtarı
+ALL = '*'
+
+# Puan histogramı: 10 puanlık 10 dilim (100 son dilime dahil)
+HISTOGRAM_BUCKETS = 10
+HISTOGRAM_COLUMNS = [f'score_bucket_{i}' for i in range(HISTOGRAM_BUCKETS)]
+
+# Başarı oranında "başarılı" sayılan en düşük puan (hariç)
+SUCCESS_THRESHOLD = 70
+
+# Her analiz ayrı satırdır; aynı tarayıcı oturumunun analizleri aynı session_id'yi taşır
+SESSION_COLUMNS = '''
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+    role TEXT,
+    overall_score REAL,
+    file_name TEXT,
+    file_size INTEGER,
+    ip_hash TEXT,
+    day TEXT
+'''
+
+
+def utc_today() -> date:
+    """İstatistik günü: CURRENT_TIMESTAMP gibi UTC"""
+    return datetime.now(timezone.utc).date()
+
+
+def score_bucket(score: float) -> int:
+    """Puanın histogram dilimi"""
+    return min(max(int(score // (100 / HISTOGRAM_BUCKETS)), 0), HISTOGRAM_BUCKETS - 1)
+
+
+class SessionStore:
+    """
+    Analiz oturumlarının (user_sessions) kaydı ve özet istatistikleri
+
+    Kayıtlar istek iş parçacığında yazılmaz: kuyruğa alınır ve arka plandaki yazıcı
+    tarafından batch_size kayıtlık veya flush_interval saniyelik gruplar halinde tek
+    işlemle yazılır. Aynı işlemde daily_stats toplamları (gün x rol; tüm günler ve tüm
+    roller için ALL satırları) artırılır, böylece istatistikler tablo büyüklüğünden
+    bağımsız olarak birkaç birincil anahtar okumasıyla alınır.
+    """
+
+    def __init__(self, database: Database, batch_size: int = 100, flush_interval: float = 1.0):
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self.init_tables()
+
+    def init_tables(self):
+        """Oturum tablosunu ve sorgu indekslerini oluşturur"""
+        with self.database.transaction() as conn:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS user_sessions ({SESSION_COLUMNS})')
+            session_columns = {row[1] for row in conn.execute('PRAGMA table_info(user_sessions)')}
+            migrate = ('day' not in session_columns
+                       or any(row[2] and row[3] == 'u' for row in conn.execute('PRAGMA index_list(user_sessions)')))
+            if migrate:
+                self._migrate_sessions_table(conn)
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_user_sessions_timestamp ON user_sessions (timestamp)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_user_sessions_role ON user_sessions (role)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_user_sessions_session ON user_sessions (session_id)')
+
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(daily_stats)')}
+            if columns and 'score_sum' not in columns:
+                # app_backup.py'nin eski daily_stats tablosu; user_sessions'tan yeniden kurulur
+                conn.execute('DROP TABLE daily_stats')
+                columns = set()
+
+            histogram_columns = ',\n'.join(f'{column} INTEGER DEFAULT 0' for column in HISTOGRAM_COLUMNS)
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS daily_stats (
+                    date TEXT,
+                    role TEXT,
+                    total_scans INTEGER DEFAULT 0,
+                    score_sum REAL DEFAULT 0,
+                    success_count INTEGER DEFAULT 0,
+                    {histogram_columns},
+                    PRIMARY KEY (date, role)
+                ) WITHOUT ROWID
+            ''')
+            if not columns or migrate:
+                # Taşınan tablonun eski toplamları satırlarla uyuşmayabilir
+                conn.execute('DELETE FROM daily_stats')
+                self._rebuild_daily_stats(conn)
+
+    @staticmethod
+    def _migrate_sessions_table(conn):
+        """Eski tabloyu (session_id UNIQUE, day yok) güncel şemaya taşır; mevcut satırlar korunur"""
+        conn.execute('ALTER TABLE user_sessions RENAME TO user_sessions_old')
+        conn.execute(f'CREATE TABLE user_sessions ({SESSION_COLUMNS})')
+        conn.execute('''
+            INSERT INTO user_sessions (id, session_id, timestamp, role, overall_score, file_name, file_size, ip_hash, day)
+            SELECT id, session_id, timestamp, role, overall_score, file_name, file_size, ip_hash, DATE(timestamp)
+            FROM user_sessions_old
+        ''')
+        # Eski indeksler eski tabloyla birlikte silinir, çağıran yenilerini oluşturur
+        conn.execute('DROP TABLE user_sessions_old')
+
+    # --- Yazma ---
+
+    def record(self, session_id: str, role: str, overall_score: float, file_name: str,
+               file_size: int, ip_hash: Optional[str] = None, day: Optional[date] = None):
+        """
+        Oturum kaydını yazma kuyruğuna ekler (beklemeden döner)
+
+        Args:
+            day: İstatistiklerin sayılacağı gün (varsayılan: bugün, UTC); satıra da yazılır,
+                böylece artımlı toplamlar ve yeniden hesaplama aynı günü kullanır
+        """
+        self._ensure_writer()
+        day = (day or utc_today()).isoformat()
+        self._queue.put((session_id, role, overall_score, file_name, file_size, ip_hash, day))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Kuyruktaki kayıtlar yazılana kadar bekler
+
+        Returns:
+            bool: Süre dolmadan tüm kayıtlar yazıldıysa True
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self):
+        """Kuyruğu boşaltır ve yazıcıyı durdurur"""
+        with self._writer_lock:
+            if self._writer is None:
+                return
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+
+    def _ensure_writer(self):
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run, name='session-writer', daemon=True)
+                self._writer.start()
+
+    def _run(self):
+        """Yazıcı döngüsü: ilk kayıttan sonra grup dolana veya süre bitene kadar toplar"""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                print(f"Uyarı: {len(batch)} oturum kaydı yazılamadı: {e}")
+            finally:
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _write_batch(self, rows: List[Tuple]):
+        """Bir grup kaydı ve günlük toplam artışlarını tek işlemle yazar"""
+        deltas: Dict[Tuple[str, str], List[float]] = defaultdict(lambda: [0, 0.0, 0] + [0] * HISTOGRAM_BUCKETS)
+        for _, role, score, _, _, _, day in rows:
+            score = score or 0
+            for key in ((day, role), (day, ALL), (ALL, role), (ALL, ALL)):
+                delta = deltas[key]
+                delta[0] += 1
+                delta[1] += score
+                delta[2] += score > SUCCESS_THRESHOLD
+                delta[3 + score_bucket(score)] += 1
+
+        with self.database.transaction() as conn:
+            conn.executemany('''
+                INSERT INTO user_sessions
+                (session_id, role, overall_score, file_name, file_size, ip_hash, day)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self._add_daily_stats(conn, [(day, role, *delta) for (day, role), delta in deltas.items()])
+
+    @staticmethod
+    def _add_daily_stats(conn, rows: List[Tuple]):
+        """(date, role, total_scans, score_sum, success_count, dilim sayıları...) artışlarını ekler"""
+        columns = ['total_scans', 'score_sum', 'success_count'] + HISTOGRAM_COLUMNS
+        placeholders = ', '.join('?' for _ in range(len(columns) + 2))
+        updates = ',\n'.join(f'{column} = {column} + excluded.{column}' for column in columns)
+        conn.executemany(f'''
+            INSERT INTO daily_stats (date, role, {', '.join(columns)})
+            VALUES ({placeholders})
+            ON CONFLICT(date, role) DO UPDATE SET
+                {updates}
+        ''', rows)
+
+    def _rebuild_daily_stats(self, conn):
+        """daily_stats'ı user_sessions kayıtlarından hesaplar (tablo ilk kurulurken veya taşınınca)"""
+        buckets = ', '.join(
+            f'SUM(MIN(MAX(CAST(COALESCE(overall_score, 0) / {100 // HISTOGRAM_BUCKETS} AS INTEGER), 0), '
+            f'{HISTOGRAM_BUCKETS - 1}) = {i})'
+            for i in range(HISTOGRAM_BUCKETS)
+        )
+        aggregates = (f'COUNT(*), COALESCE(SUM(overall_score), 0), '
+                      f'SUM(COALESCE(overall_score, 0) > {SUCCESS_THRESHOLD}), {buckets}')
+        rows = []
+        for group_by, day, role in (("day, role", 'day', 'role'),
+                                    ("day", 'day', f"'{ALL}'"),
+                                    ("role", f"'{ALL}'", 'role'),
+                                    (None, f"'{ALL}'", f"'{ALL}'")):
+            query = f'SELECT {day}, {role}, {aggregates} FROM user_sessions'
+            if group_by:
+                query += f' GROUP BY {group_by}'
+            rows.extend(row for row in conn.execute(query) if row[2])
+        self._add_daily_stats(conn, rows)
+
+    # --- Okuma ---
+
+    def stats(self, today: Optional[date] = None, role: str = ALL) -> Dict[str, Any]:
+        """
+        Başlık istatistikleri; daily_stats'tan iki birincil anahtar okumasıyla
+
+        Args:
+            role: Verilirse yalnızca bu rolün istatistikleri
+
+        Returns:
+            dict: total_scans, today_scans, avg_score, success_rate, score_histogram
+        """
+        today = (today or utc_today()).isoformat()
+        with self.database.connection() as conn:
+            rows = {
+                row[0]: row[1:]
+                for row in conn.execute(f'''
+                    SELECT date, total_scans, score_sum, success_count, {', '.join(HISTOGRAM_COLUMNS)}
+                    FROM daily_stats WHERE role = ? AND date IN (?, ?)
+                ''', (role, ALL, today))
+            }
+
+        total = rows.get(ALL, (0, 0.0, 0) + (0,) * HISTOGRAM_BUCKETS)
+        total_scans, score_sum, success_count = total[:3]
+
+        return {
+            'total_scans': total_scans,
+            'today_scans': rows[today][0] if today in rows else 0,
+            'avg_score': round(score_sum / total_scans, 1) if total_scans else 0,
+            'success_rate': round(success_count / total_scans * 100, 1) if total_scans else 0,
+            'score_histogram': list(total[3:])
+        }
@@ -0,0 +1,87 @@
+# utils/token_index.py
+import re
+from functools import lru_cache
+from typing import Dict, List, Iterable, Tuple
+
+# Kelime parçaları: harf/rakam dizileri; 'c++', 'c#' gibi sondaki + ve # korunur.
+# Tire, alt çizgi, eğik çizgi ve diğer noktalama ayırıcıdır ('data-driven' = 'data driven').
+_TOKEN_PATTERN = re.compile(r'[^\W_]+[+#]*')
+
+# Bu uzunluğa kadar tüm n-gram'lar indekslenir; daha uzun ifadeler ilk n-gram'dan doğrulanır
+MAX_NGRAM = 3
+
+
+@lru_cache(maxsize=65536)
+def normalize_token(token: str) -> str:
+    """Basit çoğul indirgeme: 'dashboards' -> 'dashboard', 'companies' -> 'company', 'processes' -> 'process'"""
+    if len(token) <= 3 or not token.endswith('s') or token.endswith(('ss', 'us', 'is')):
+        return token
+    if token.endswith('ies') and len(token) > 4:
+        return token[:-3] + 'y'
+    if token.endswith(('sses', 'xes', 'zes', 'ches', 'shes')):
+        return token[:-2]
+    return token[:-1]
+
+
+@lru_cache(maxsize=4096)
+def normalize_phrase(phrase: str) -> Tuple[str, ...]:
+    """İfadeyi metinle aynı kurallarla normalize edilmiş token dizisine çevirir (analizörlerin sabit ifadeleri önbelleklenir)"""
+    return tuple(normalize_token(token) for token in _TOKEN_PATTERN.findall(phrase.lower()))
+
+
+class TokenIndex:
+    """
+    Küçük harfli metnin token ve n-gram hash indeksi
+
+    Metin kelime sınırlarından token'lara ayrılır, token'lar çoğul ekinden arındırılır ve
+    1..MAX_NGRAM uzunluğundaki her n-gram başlangıç konumlarıyla sözlüğe eklenir. Bir ifadenin
+    varlığı ve konumları, ifade uzunluğunda bir hash araması ile bulunur; 'r' yalnızca tek
+    başına 'r' kelimesiyle, 'led' yalnızca 'led' kelimesiyle eşleşir ('enabled' ile değil).
+    """
+
+    def __init__(self, text_lower: str):
+        tokens = []
+        offsets = []
+        for match in _TOKEN_PATTERN.finditer(text_lower):
+            tokens.append(normalize_token(match.group()))
+            offsets.append(match.start())
+
+        self.tokens: Tuple[str, ...] = tuple(tokens)
+        self.offsets: Tuple[int, ...] = tuple(offsets)
+
+        ngrams: Dict[Tuple[str, ...], List[int]] = {}
+        for n in range(1, MAX_NGRAM + 1):
+            for position, key in enumerate(zip(*(tokens[i:] for i in range(n)))):
+                ngrams.setdefault(key, []).append(position)
+        self._ngrams = ngrams
+
+    def positions(self, phrase: str) -> List[int]:
+        """İfadenin geçtiği token konumları (sıralı)"""
+        key = normalize_phrase(phrase)
+        if not key:
+            return []
+        if len(key) <= MAX_NGRAM:
+            return self._ngrams.get(key, [])
+
+        # Uzun ifade: ilk MAX_NGRAM token'ın konumlarından kalan token'lar doğrulanır
+        tokens = self.tokens
+        rest = key[MAX_NGRAM:]
+        return [
+            position for position in self._ngrams.get(key[:MAX_NGRAM], [])
+            if tokens[position + MAX_NGRAM:position + len(key)] == rest
+        ]
+
+    def find(self, phrase: str) -> List[int]:
+        """İfadenin küçük harfli metindeki başlangıç offset'leri"""
+        return [self.offsets[position] for position in self.positions(phrase)]
+
+    def count(self, phrase: str) -> int:
+        """İfadenin kelime sınırlarına uyan geçiş sayısı"""
+        return len(self.positions(phrase))
+
+    def __contains__(self, phrase: str) -> bool:
+        return bool(self.positions(phrase))
+
+    def present(self, phrases: Iterable[str]) -> List[str]:
+        """Verilen ifadelerden metinde geçenler (girdi sırasıyla)"""
+        return [phrase for phrase in phrases if phrase in self]